@@ -1,5 +1,10 @@
+from __future__ import annotations
+
+import pickle
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Callable, Any
+from typing import Callable, Any, Iterable, Optional, Union
 
 
 @dataclass(frozen=True, eq=True)
@@ -13,26 +18,152 @@ ParsePerception = Callable[[Any], Any]
 Rules = dict[Any, str]
 MatchRule = Callable[[Any, Rules], str]
 
+DEFAULT_CACHE_SIZE = 1024
 
-def create_table_driven_agent_program(table: dict[tuple, str]) -> AgentProgram:
-    """Creates an implementation of a table-driven agent program.
+VACUUM_PERCEPTIONS = [VacuumPerception(l, s) for l in ("A", "B") for s in ("Clean", "Dirty")]
+
+
+class PerceptionTrie:
+    """Prefix trie compiled from the table of a table-driven agent.
+
+    Every perception sequence of the table is a path from the root of the trie, the node at its end holds
+    the sequence's action. Nodes are numbered, the root is 0, perceptions are numbered too and the edges are kept
+    in a single dictionary mapping (node, perception number) pairs to nodes, so following an edge is O(1).
+
+    The trie can be serialised into a compact form, flat arrays of the parents, edge labels and actions
+    of the nodes, along with the distinct perceptions and actions.
 
     Parameters
     ----------
     table : dict[tuple, str]
         Dictionary of tuple to action description mappings. The tuples represent perception sequences.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, table: dict[tuple, str] = None) -> None:
+        self.__perceptions = {}
+        self.__edges = {}
+        self.__parents = array("q", [-1])
+        self.__labels = array("q", [-1])
+        self.__actions = [None]
+
+        for sequence, action in (table or {}).items():
+            node = 0
+            for perception in sequence:
+                node = self.__add_edge(node, self.__perceptions.setdefault(perception, len(self.__perceptions)))
+            self.__actions[node] = action
+
+    def __len__(self) -> int:
+        return len(self.__actions)
+
+    def advance(self, node: int, perception: Any) -> Optional[int]:
+        """Follows the edge of a perception from a node.
+
+        Parameters
+        ----------
+        node : int
+            A node of the trie.
+        perception : Any
+            Representation of a perception.
+
+        Returns
+        -------
+        Optional[int]
+            The node the edge leads to or None, if no sequence of the table continues with the perception.
+        """
+        i = self.__perceptions.get(perception)
+
+        return None if i is None else self.__edges.get((node, i))
+
+    def get_action(self, node: int) -> Optional[str]:
+        """Returns the action of the perception sequence ending in a node, None if it is not in the table."""
+        return self.__actions[node]
+
+    def to_bytes(self) -> bytes:
+        """Serialises this trie into its compact form.
+
+        Returns
+        -------
+        bytes
+            The serialised trie.
+        """
+        actions = {}
+        action_indices = array("q", [-1 if a is None else actions.setdefault(a, len(actions)) for a in self.__actions])
+
+        return pickle.dumps((self.FORMAT_VERSION, list(self.__perceptions), list(actions),
+                             self.__parents.tobytes(), self.__labels.tobytes(), action_indices.tobytes()),
+                            pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PerceptionTrie:
+        """Deserialises a trie serialised with to_bytes.
+
+        Parameters
+        ----------
+        data : bytes
+            The serialised trie.
+
+        Returns
+        -------
+        PerceptionTrie
+            The trie.
+
+        Raises
+        ------
+        ValueError
+            If the data was serialised by an unsupported version.
+        """
+        version, perceptions, actions, parents, labels, action_indices = pickle.loads(data)
+        if version != cls.FORMAT_VERSION:
+            raise ValueError(f"Unsupported perception trie version {version}")
+
+        trie = cls()
+        trie.__perceptions = {p: i for i, p in enumerate(perceptions)}
+        trie.__parents = array("q", parents)
+        trie.__labels = array("q", labels)
+        trie.__actions = [None if i == -1 else actions[i] for i in array("q", action_indices)]
+        trie.__edges = {(p, l): n for n, (p, l) in enumerate(zip(trie.__parents, trie.__labels)) if n}
+
+        return trie
+
+    def __add_edge(self, node: int, label: int) -> int:
+        child = self.__edges.get((node, label))
+
+        if child is None:
+            child = self.__edges[(node, label)] = len(self.__actions)
+            self.__parents.append(node)
+            self.__labels.append(label)
+            self.__actions.append(None)
+
+        return child
+
+
+def create_table_driven_agent_program(table: Union[dict[tuple, str], PerceptionTrie]) -> AgentProgram:
+    """Creates an implementation of a table-driven agent program.
+
+    The table is compiled into a PerceptionTrie, the agent program keeps a cursor in it, which follows
+    one edge per perception, instead of the whole perception sequence. Once no sequence of the table
+    matches the perceptions, the cursor is dropped and every following action is None.
+
+    Parameters
+    ----------
+    table : Union[dict[tuple, str], PerceptionTrie]
+        Dictionary of tuple to action description mappings. The tuples represent perception sequences.
+        A table already compiled into a trie can be passed as well.
 
     Returns
     -------
     Callable[[Any], str]
         Callable implementation of a table-driven agent program.
     """
-    perception_sequence = []
+    trie = table if isinstance(table, PerceptionTrie) else PerceptionTrie(table)
+    cursor = 0
 
     def execute(perception: Any) -> str:
         """Executes the table-driven agent program.
 
-        Uses a tuple representation of the persistent perception sequence to reference a table of mappings.
+        Advances the cursor along the edge of the perception and returns the action of the sequence it reaches.
 
         Parameters
         ----------
@@ -44,9 +175,12 @@ def create_table_driven_agent_program(table: dict[tuple, str]) -> AgentProgram:
         str
             Description of an action.
         """
-        perception_sequence.append(perception)
+        nonlocal cursor
+
+        if cursor is not None:
+            cursor = trie.advance(cursor, perception)
 
-        return table.get(tuple(perception_sequence))
+        return None if cursor is None else trie.get_action(cursor)
 
     return execute
 
@@ -54,6 +188,9 @@ def create_table_driven_agent_program(table: dict[tuple, str]) -> AgentProgram:
 def create_reflex_vacuum_agent_program() -> AgentProgram:
     """Creates reflex agent, mimicking a vacuum cleaner.
 
+    The agent program has a batch form, its batch attribute, which acts in a whole batch of vacuum worlds at once
+    (see environment.VacuumWorldBatch).
+
     Returns
     -------
     Callable[[Any], str]
@@ -78,6 +215,25 @@ def create_reflex_vacuum_agent_program() -> AgentProgram:
             else "Left" if perception.location == "B" \
             else None
 
+    def execute_batch(perception: Any) -> dict[str, int]:
+        """Executes the reflex vacuum agent program in a batch of worlds.
+
+        Parameters
+        ----------
+        perception : environment.BatchPerception
+            Perceptions of the worlds, as bitmaps.
+
+        Returns
+        -------
+        dict[str, int]
+            Mapping of the actions to the bitmaps of the worlds performing them.
+        """
+        clean = ~perception.dirty & ((1 << perception.size) - 1)
+
+        return {"Suck": perception.dirty, "Right": clean & ~perception.location, "Left": clean & perception.location}
+
+    execute.batch = execute_batch
+
     return execute
 
 
@@ -116,9 +272,45 @@ def match_vacuum_rule(state: Any, rules: Rules) -> str:
     return rules.get(state)
 
 
-def create_simple_reflex_agent(rules: Rules, parse_perception: ParsePerception, match_rule: MatchRule) -> AgentProgram:
+def compile_rules(rules: Rules,
+                  parse_perception: ParsePerception,
+                  match_rule: MatchRule,
+                  perceptions: Iterable[Any]) -> dict[Any, str]:
+    """Compiles condition-action rules into a direct perception to action dispatch table.
+
+    Parameters
+    ----------
+    rules : dict[Any, str]
+        Mapping of rules, it provides an appropriate action for each valid state the agent might be in.
+    parse_perception : Callable[[Any], Any]
+        Callable that parses a perception and returns a description of a state.
+    match_rule : Callable[[Any, Rules], str]
+        Function that matches a state description to an action.
+    perceptions : Iterable[Any]
+        The (hashable) perceptions the table is compiled for.
+
+    Returns
+    -------
+    dict[Any, str]
+        Mapping of the perceptions to their actions.
+    """
+    return {p: match_rule(parse_perception(p), rules) for p in perceptions}
+
+
+def create_simple_reflex_agent(rules: Rules,
+                               parse_perception: ParsePerception,
+                               match_rule: MatchRule,
+                               perceptions: Iterable[Any] = (),
+                               cache_size: int = DEFAULT_CACHE_SIZE) -> AgentProgram:
     """Creates a generalized reflex agent based on condition-action rules.
 
+    Since the action of a reflex agent only depends on its current perception, the rules are compiled into
+    a dispatch table (see compile_rules) for the provided perceptions. Every other (hashable) perception is parsed
+    once and its parsed state is interned in a cache of at most cache_size perceptions, which evicts the least
+    recently used one, so recurring perceptions are only matched against the rules. An evicted perception is
+    parsed again when it recurs. This assumes parse_perception and match_rule have no side effects and the rules
+    do not change afterwards.
+
     Parameters
     ----------
     rules : dict[Any, str]
@@ -127,12 +319,19 @@ def create_simple_reflex_agent(rules: Rules, parse_perception: ParsePerception,
         Callable that parses a perception and returns a description of a state.
     match_rule : Callable[[Any, Rules], str]
         Function that matches a state description to an action.
+    perceptions : Iterable[Any]
+        Perceptions to compile the dispatch table for, such as VACUUM_PERCEPTIONS.
+    cache_size : int
+        The maximum number of other perceptions whose parsed states are cached.
 
     Returns
     -------
     Callable[[Any], str]
         Callable implementation of a generalized reflex agent program.
     """
+    table = compile_rules(rules, parse_perception, match_rule, perceptions)
+    cache = OrderedDict()
+
     def execute(perception: Any) -> str:
         """Executes the generalized reflex agent program.
 
@@ -146,6 +345,25 @@ def create_simple_reflex_agent(rules: Rules, parse_perception: ParsePerception,
         str
             Description of an action.
         """
-        return match_rule(parse_perception(perception), rules)
+        try:
+            return table[perception]
+        except KeyError:
+            pass
+        except TypeError:
+            return match_rule(parse_perception(perception), rules)
+
+        try:
+            state = cache[perception]
+        except KeyError:
+            state = parse_perception(perception)
+
+            if cache_size > 0:
+                if len(cache) >= cache_size:
+                    cache.popitem(last=False)
+                cache[perception] = state
+        else:
+            cache.move_to_end(perception)
+
+        return match_rule(state, rules)
 
     return execute
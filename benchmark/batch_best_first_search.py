@@ -0,0 +1,56 @@
+"""Measures the throughput of uniform-cost search queries on a pool of processes sharing one compact graph.
+
+The graph is placed in shared memory once, so the throughput should scale with the number of worker processes
+up to the number of CPUs, minus the cost of starting the pool. Run from the root of the repository:
+
+    python -m benchmark.batch_best_first_search --vertices 5000 --edges 20000 --queries 200 --workers 1 2 4 8
+"""
+import argparse
+import random
+import time
+
+from datastructures import CompactGraph, Graph
+from problem.problem import GraphProblem
+from search.parallel_search import batch_best_first_search
+from search.uninformed_search import uniform_cost_search
+
+
+def create_graph(vertices: int, edges: int, seed: int) -> CompactGraph:
+    rng = random.Random(seed)
+
+    return CompactGraph.from_graph(Graph([(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 100))
+                                          for _ in range(edges)]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vertices", type=int, default=5000, help="number of vertices of the random graph")
+    parser.add_argument("--edges", type=int, default=20000, help="number of edges of the random graph")
+    parser.add_argument("--queries", type=int, default=200, help="number of random queries")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="process counts to measure")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    graph = create_graph(arguments.vertices, arguments.edges, arguments.seed)
+    vertices = sorted(graph.get_vertices())
+    rng = random.Random(arguments.seed)
+    queries = [(rng.choice(vertices), {rng.choice(vertices)}) for _ in range(arguments.queries)]
+
+    start = time.perf_counter()
+    expected = [uniform_cost_search(GraphProblem(i, g, graph)).path_cost for i, g in queries]
+    baseline = len(queries) / (time.perf_counter() - start)
+    print(f"sequential: {baseline:.1f} queries/s")
+
+    for workers in arguments.workers:
+        start = time.perf_counter()
+        costs = [n.path_cost for n in batch_best_first_search(graph, queries, workers=workers)]
+        throughput = len(queries) / (time.perf_counter() - start)
+
+        if costs != expected:
+            raise AssertionError("batch searches returned different results than sequential searches")
+
+        print(f"{workers} processes: {throughput:.1f} queries/s ({throughput / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compares jump point search (JPS and JPS+) with A* on large, mostly open, 8-connected grids.
+
+Run from the root of the repository:
+
+    python -m benchmark.jump_point_search --size 256 --density 0.1 --queries 10
+"""
+import argparse
+import random
+import time
+
+from problem.implicit import GridProblem
+from search.informed_search import astar_search
+from search.jump_point_search import JumpTable, jump_point_search
+
+
+def create_problems(size: int, density: float, queries: int, seed: int) -> list[GridProblem]:
+    rng = random.Random(seed)
+    obstacles = {(rng.randrange(size), rng.randrange(size)) for _ in range(int(size * size * density))}
+    free = [(x, y) for x in range(size) for y in range(size) if (x, y) not in obstacles]
+
+    return [GridProblem(size, size, obstacles, rng.choice(free), [rng.choice(free)], diagonal=True)
+            for _ in range(queries)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=256, help="width and height of the grid")
+    parser.add_argument("--density", type=float, default=0.1, help="fraction of the cells which are obstacles")
+    parser.add_argument("--queries", type=int, default=10, help="number of random queries")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    problems = create_problems(arguments.size, arguments.density, arguments.queries, arguments.seed)
+
+    start = time.perf_counter()
+    table = JumpTable(problems[0])
+    print(f"JPS+ precomputation: {time.perf_counter() - start:.3f}s")
+
+    algorithms = [("A*", lambda p: astar_search(p, p.octile_heuristic)),
+                  ("JPS", jump_point_search),
+                  ("JPS+", lambda p: jump_point_search(p, table))]
+
+    costs = {}
+    for name, algorithm in algorithms:
+        start = time.perf_counter()
+        costs[name] = [algorithm(p).path_cost for p in problems]
+        print(f"{name}: {time.perf_counter() - start:.3f}s")
+
+    if any(abs(a - b) > 1e-6 for c in costs.values() for a, b in zip(c, costs["A*"])):
+        raise AssertionError("jump point search returned a path with a different cost than A*")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Measures the throughput of uniform-cost search queries on a pool of threads sharing one frozen graph.
+
+On free-threaded builds of Python the throughput should scale with the number of threads, on the others
+it stays roughly flat, since the searches do not release the GIL. Run from the root of the repository:
+
+    python -m benchmark.threaded_search --vertices 5000 --edges 20000 --queries 200 --threads 1 2 4 8
+"""
+import argparse
+import random
+import sys
+import time
+
+from datastructures import FrozenGraph, Graph
+from search.parallel_search import threaded_batch_search
+
+
+def create_graph(vertices: int, edges: int, seed: int) -> FrozenGraph:
+    rng = random.Random(seed)
+
+    return FrozenGraph.from_graph(Graph([(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 100))
+                                         for _ in range(edges)]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vertices", type=int, default=5000, help="number of vertices of the random graph")
+    parser.add_argument("--edges", type=int, default=20000, help="number of edges of the random graph")
+    parser.add_argument("--queries", type=int, default=200, help="number of random queries")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8], help="thread counts to measure")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if is_gil_enabled else 'disabled'}")
+
+    graph = create_graph(arguments.vertices, arguments.edges, arguments.seed)
+    vertices = sorted(graph.get_vertices())
+    rng = random.Random(arguments.seed)
+    queries = [(rng.choice(vertices), {rng.choice(vertices)}) for _ in range(arguments.queries)]
+
+    baseline, expected = None, None
+    for threads in arguments.threads:
+        start = time.perf_counter()
+        costs = [n.path_cost for n in threaded_batch_search(graph, queries, workers=threads)]
+        throughput = len(queries) / (time.perf_counter() - start)
+
+        if expected is None:
+            baseline, expected = throughput, costs
+        elif costs != expected:
+            raise AssertionError("threaded searches returned different results")
+
+        print(f"{threads} threads: {throughput:.1f} queries/s ({throughput / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
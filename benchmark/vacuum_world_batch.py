@@ -0,0 +1,42 @@
+"""Measures how many agent steps per second the bit-sliced vacuum world batch simulates.
+
+The batch form of the reflex vacuum agent program updates every world at once with bitwise operations,
+the scalar simple reflex agent is called once per world and step. Run from the root of the repository:
+
+    python -m benchmark.vacuum_world_batch --worlds 65536 --steps 100
+"""
+import argparse
+import random
+import time
+
+from agent import create_reflex_vacuum_agent_program, create_simple_reflex_agent, match_vacuum_rule, \
+    parse_vacuum_perception
+from environment import VacuumWorldBatch
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--worlds", type=int, default=1 << 16, help="number of worlds of the batch")
+    parser.add_argument("--steps", type=int, default=100, help="number of steps")
+    parser.add_argument("--scalar-worlds", type=int, default=1 << 10,
+                        help="number of worlds of the scalar agent, which is much slower")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    rules = {"Is Dirty": "Suck", "Is Clean A": "Right", "Is Clean B": "Left"}
+    agents = [("batch", create_reflex_vacuum_agent_program(), arguments.worlds),
+              ("scalar", create_simple_reflex_agent(rules, parse_vacuum_perception, match_vacuum_rule),
+               arguments.scalar_worlds)]
+
+    for name, agent_program, worlds in agents:
+        environment = VacuumWorldBatch(worlds, rng=random.Random(arguments.seed))
+
+        start = time.perf_counter()
+        environment.run(agent_program, arguments.steps)
+        elapsed = time.perf_counter() - start
+
+        print(f"{name}: {worlds} worlds, {worlds * arguments.steps / elapsed:,.0f} agent steps/s")
+
+
+if __name__ == "__main__":
+    main()
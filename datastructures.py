@@ -1,5 +1,12 @@
+from __future__ import annotations
+
+import bisect
 import heapq
+import itertools
 import math
+import os
+import pickle
+from array import array
 from collections import defaultdict
 from typing import Any, Callable, Sequence, Optional, Union
 
@@ -9,24 +16,28 @@ Items = Union[Any, Item]
 Connections = Union[Sequence[tuple[Any, Any, Optional[float]]], Sequence[tuple[Any, Any]]]
 Edges = set[tuple[Any, float]]
 
+DEFAULT_CHANGE_LOG_SIZE = 1 << 16
+
 
 class PriorityQueue:
     """Implementation of a priority queue data structure.
 
     Based on the heapq module, part of the standard library.
     This utility class encapsulates the most common interactions with the heapq module.
+    Items with equal priorities are popped in insertion order, so the items themselves are never compared.
 
     Parameters
     ----------
     items: list[Any]
-        A list backing the priority queue, can be empty.
+        A list of (priority, item) tuples backing the priority queue, can be empty.
     priority_function : Callable[[Any], float]
         A function used to calculate the priorities of the items in the queue.
         The queue is ordered according to these priorities. The first element is the one with the smalles priority.
     """
 
     def __init__(self, items: list[Items], priority_function: PriorityFunction) -> None:
-        self.__items = items
+        self.__counter = itertools.count()
+        self.__items = [(p, next(self.__counter), i) for p, i in items]
         self.__priority_function = priority_function
 
         heapq.heapify(self.__items)
@@ -42,7 +53,7 @@ class PriorityQueue:
         item : Any
             Item to be added to the queue.
         """
-        heapq.heappush(self.__items, (self.__priority_function(item), item))
+        heapq.heappush(self.__items, (self.__priority_function(item), next(self.__counter), item))
 
     def pop(self) -> Item:
         """Pops the first element in the queue, removing it from the internal, heapified list.
@@ -52,7 +63,8 @@ class PriorityQueue:
         tuple[float, Any]
             Tuple which holds the item's priority and the item itself.
         """
-        return heapq.heappop(self.__items)
+        priority, _, item = heapq.heappop(self.__items)
+        return priority, item
 
     def top(self) -> Any:
         """Returns the first element in the queue, does not remove it from internal, heapified list
@@ -62,7 +74,119 @@ class PriorityQueue:
         Any
             An item.
         """
-        return self.__items[0][1]
+        return self.__items[0][2]
+
+    def get_entries(self) -> list[tuple[float, int, Any]]:
+        """Returns the entries of the queue, (priority, insertion number, item) tuples, in heap order.
+
+        Together with from_entries, this makes it possible to save a queue and restore it later,
+        with ties still broken in the original insertion order.
+
+        Returns
+        -------
+        list[tuple[float, int, Any]]
+            The entries of the queue.
+        """
+        return list(self.__items)
+
+    @classmethod
+    def from_entries(cls, entries: list[tuple[float, int, Any]], priority_function: PriorityFunction) -> PriorityQueue:
+        """Creates a priority queue from the entries returned by get_entries.
+
+        Parameters
+        ----------
+        entries : list[tuple[float, int, Any]]
+            Entries of a priority queue.
+        priority_function : Callable[[Any], float]
+            A function used to calculate the priorities of the items in the queue.
+
+        Returns
+        -------
+        PriorityQueue
+            The restored queue.
+        """
+        queue = cls([], priority_function)
+        queue.__items = list(entries)
+        queue.__counter = itertools.count(max((e[1] for e in entries), default=-1) + 1)
+        heapq.heapify(queue.__items)
+
+        return queue
+
+
+class BoundedPriorityQueue:
+    """Priority queue of fixed capacity, which keeps the items with the smallest priorities.
+
+    The items are kept in a heap ordered by the negated priorities, so the worst (largest priority) item is
+    at its top and, once the queue is full, adding an item which is better than it replaces it in O(log k),
+    k being the capacity. Memory never exceeds the capacity, whatever the number of added items.
+    Items with equal priorities are kept in insertion order, the latest one is evicted first.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of items in the queue.
+    priority_function : Callable[[Any], float]
+        A function used to calculate the priorities of the items in the queue.
+    """
+
+    def __init__(self, capacity: int, priority_function: PriorityFunction) -> None:
+        if capacity < 1:
+            raise ValueError("The capacity of a bounded priority queue must be positive")
+
+        self.capacity = capacity
+        self.__counter = itertools.count()
+        self.__items = []
+        self.__priority_function = priority_function
+
+    def __len__(self):
+        return len(self.__items)
+
+    def add(self, item: Any) -> Optional[Any]:
+        """Adds an item to the queue, evicting the worst item if the queue is full.
+
+        Parameters
+        ----------
+        item : Any
+            Item to be added to the queue.
+
+        Returns
+        -------
+        Optional[Any]
+            The evicted item, which is the added one if it is not better than any item of a full queue,
+            None if no item was evicted.
+        """
+        entry = (-self.__priority_function(item), -next(self.__counter), item)
+
+        if len(self.__items) < self.capacity:
+            heapq.heappush(self.__items, entry)
+            return None
+
+        if entry <= self.__items[0]:
+            return item
+
+        return heapq.heapreplace(self.__items, entry)[2]
+
+    def worst(self) -> Any:
+        """Returns the item with the largest priority, which is the next one to be evicted.
+
+        Returns
+        -------
+        Any
+            An item.
+        """
+        return self.__items[0][2]
+
+    def pop_all(self) -> list[Item]:
+        """Removes all the items from the queue.
+
+        Returns
+        -------
+        list[tuple[float, Any]]
+            The (priority, item) tuples of the queue, ordered from the smallest priority.
+        """
+        items, self.__items = self.__items, []
+
+        return [(-p, i) for p, _, i in sorted(items, reverse=True)]
 
 
 class Graph:
@@ -84,27 +208,99 @@ class Graph:
         A sequence of connections which are going to back this graph, an example is [('A', 'B'), ('A', 'C')].
     directed : bool
         Whether the graph is directed or undirected.
+    change_log_size : int
+        The maximum number of changed edges remembered for get_changes, older ones are discarded.
     """
 
-    def __init__(self, connections: Connections, directed: bool = False) -> None:
+    def __init__(self, connections: Connections, directed: bool = False,
+                 change_log_size: int = DEFAULT_CHANGE_LOG_SIZE) -> None:
         self.__graph_dict = defaultdict(set)
         self.__directed = directed
+        self.__version = 0
+        self.__changes = []
+        self.__change_versions = []
+        self.__change_log_size = change_log_size
+        self.__oldest_version = 0
+        self.__vertices = None
         self.__create_graph_dict(connections)
 
+    def get_version(self) -> int:
+        """Returns the version of this graph, which is incremented by every change of its edges.
+
+        Returns
+        -------
+        int
+            Version of the graph.
+        """
+        return self.__version
+
+    def get_changes(self, version: int) -> Optional[list[tuple[Any, Any]]]:
+        """Returns the edges which were changed after the provided version of this graph.
+
+        Only the last change_log_size changed edges are remembered, the log is truncated to half of that
+        when it overflows, so the changes after a version which is too old are no longer known.
+
+        Parameters
+        ----------
+        version : int
+            A previous version of the graph.
+
+        Returns
+        -------
+        Optional[list[tuple[Any, Any]]]
+            The changed edges, as (from, to) vertex pairs, in the order of the changes.
+            Both directions are included for undirected graphs. None if some of the changes after the version
+            were discarded, in which case whatever was derived from that version has to be rebuilt.
+        """
+        if version < self.__oldest_version:
+            return None
+
+        return self.__changes[bisect.bisect_right(self.__change_versions, version):]
+
+    def set_edge_cost(self, first_vertex: Any, second_vertex: Any, cost: float = math.inf) -> None:
+        """Sets the path cost of the edge between two vertices, replacing any existing edges between them.
+
+        Parameters
+        ----------
+        first_vertex : Any
+            Vertex from which the edge originates.
+        second_vertex : Any
+            Vertex which the edge leads to.
+        cost : float
+            New path cost of the edge, math.inf means the edge does not have a cost.
+        """
+        self.__change_edge(first_vertex, second_vertex, cost)
+
+    def remove_edge(self, first_vertex: Any, second_vertex: Any) -> None:
+        """Removes the edges between two vertices.
+
+        Parameters
+        ----------
+        first_vertex : Any
+            Vertex from which the edge originates.
+        second_vertex : Any
+            Vertex which the edge leads to.
+        """
+        self.__change_edge(first_vertex, second_vertex, None)
+
     def get_vertices(self) -> set[Any]:
         """Returns the vertices in this graph.
 
         Based on whether the graph is directed or not, this method returns either the keys of the
         underlying dictionary combined with the first element in each edge tuple (via a set union operation) or
-        just the keys of the aforementioned dictionary.
+        just the keys of the aforementioned dictionary. The result is cached until the edges of the graph change.
 
         Returns
         -------
-        set[Any] :
+        frozenset[Any] :
             Set of vertices in the graph.
         """
-        return set(self.__graph_dict.keys()).union(set([t[0] for v in self.__graph_dict.values() for t in v])) \
-            if self.__directed else set(self.__graph_dict.keys())
+        if self.__vertices is None:
+            self.__vertices = frozenset(self.__graph_dict.keys()).union([t[0] for v in self.__graph_dict.values()
+                                                                          for t in v]) \
+                if self.__directed else frozenset(self.__graph_dict.keys())
+
+        return self.__vertices
 
     def get_edges(self, vertex: Any) -> Edges:
         """Returns the edges originating from the provided vertex.
@@ -122,6 +318,27 @@ class Graph:
         """
         return self.__graph_dict.get(vertex, set())
 
+    def __change_edge(self, first_vertex: Any, second_vertex: Any, cost: Optional[float]) -> None:
+        self.__version += 1
+        self.__vertices = None
+
+        pairs = [(first_vertex, second_vertex)] if self.__directed \
+            else [(first_vertex, second_vertex), (second_vertex, first_vertex)]
+
+        for f, t in pairs:
+            edges = self.__graph_dict[f] if cost is not None else self.__graph_dict.get(f, set())
+            edges.difference_update([e for e in edges if e[0] == t])
+            if cost is not None:
+                edges.add((t, cost))
+
+            self.__changes.append((f, t))
+            self.__change_versions.append(self.__version)
+
+        if len(self.__changes) > self.__change_log_size:
+            discarded = len(self.__changes) - self.__change_log_size // 2
+            self.__oldest_version = self.__change_versions[discarded - 1]
+            del self.__changes[:discarded], self.__change_versions[:discarded]
+
     def __create_graph_dict(self, connections: Connections) -> None:
         """Creates the internal dictionary backing this implementation.
 
@@ -147,29 +364,289 @@ class Graph:
                 self.__graph_dict[second_node].add((first_node, cost))
 
 
-romania_road_map = Graph([("Oradea", "Zerind", 71), ("Oradea", "Sibiu", 151),
-                          ("Zerind", "Arad", 75),
-                          ("Arad", "Sibiu", 140), ("Arad", "Timisoara", 118),
-                          ("Timisoara", "Lugoj", 111),
-                          ("Lugoj", "Mehadia", 70),
-                          ("Mehadia", "Drobeta", 75),
-                          ("Drobeta", "Craiova", 120),
-                          ("Craiova", "Pitesti", 138), ("Craiova", "Rimnicu Vilcea", 146),
-                          ("Rimnicu Vilcea", "Pitesti", 97),
-                          ("Rimnicu Vilcea", "Sibiu", 80),
-                          ("Sibiu", "Fagaras", 99),
-                          ("Fagaras", "Bucharest", 211),
-                          ("Pitesti", "Bucharest", 101),
-                          ("Bucharest", "Giurgiu", 90), ("Bucharest", "Urziceni", 85),
-                          ("Urziceni", "Vaslui", 142), ("Urziceni", "Hirsova", 98),
-                          ("Vaslui", "Iasi", 92),
-                          ("Iasi", "Neamt", 87),
-                          ("Hirsova", "Eforie", 86)])
-
-binary_tree = Graph([("A", "B"), ("A", "C"),
-                     ("B", "D"), ("B", "E"),
-                     ("C", "F"), ("C", "G"),
-                     ("D", "H"), ("D", "I"),
-                     ("E", "J"), ("E", "K"),
-                     ("F", "L"), ("F", "M"),
-                     ("G", "N"), ("G", "O")], directed=True)
+class FrozenGraph:
+    """Immutable snapshot of a graph, which can be shared between threads.
+
+    Every structure of the snapshot is built once, when it is created, and never changes afterwards:
+    the edges of each vertex are a frozenset in a plain dictionary, which is only ever read, and a query for
+    a vertex without edges returns a shared empty frozenset instead of inserting it, like a defaultdict would.
+    Searches on different threads can therefore query the same snapshot without any locking, even on
+    free-threaded builds of Python, and the snapshot is not affected by later changes of the original graph.
+
+    It exposes the same querying interface as Graph, so it can back a GraphProblem.
+
+    Parameters
+    ----------
+    edges : dict[Any, frozenset[tuple[Any, float]]]
+        Mapping of the vertices to the edges originating from them.
+    vertices : frozenset[Any]
+        The vertices of the graph.
+    """
+
+    __EMPTY = frozenset()
+
+    def __init__(self, edges: dict[Any, frozenset[tuple[Any, float]]], vertices: frozenset[Any]) -> None:
+        self.__edges = edges
+        self.__vertices = vertices
+
+    @classmethod
+    def from_graph(cls, graph: Union[Graph, CompactGraph]) -> FrozenGraph:
+        """Creates a snapshot of the vertices and edges of a graph.
+
+        Parameters
+        ----------
+        graph : Union[Graph, CompactGraph]
+            Graph which is going to be copied.
+
+        Returns
+        -------
+        FrozenGraph
+            Immutable copy of the graph.
+        """
+        vertices = frozenset(graph.get_vertices())
+
+        return cls({v: frozenset(graph.get_edges(v)) for v in vertices}, vertices)
+
+    def get_vertices(self) -> frozenset[Any]:
+        """Returns the vertices in this graph.
+
+        Returns
+        -------
+        frozenset[Any]
+            Set of vertices in the graph.
+        """
+        return self.__vertices
+
+    def get_edges(self, vertex: Any) -> frozenset[tuple[Any, float]]:
+        """Returns the edges originating from the provided vertex.
+
+        Parameters
+        ----------
+        vertex : Any
+            Vertex of the graph.
+
+        Returns
+        -------
+        frozenset[tuple[Any, float]]
+            The edges originating from the provided vertex, empty if it is not part of the graph.
+        """
+        return self.__edges.get(vertex, self.__EMPTY)
+
+
+class CompactGraph:
+    """Read-only, array based representation of a graph.
+
+    The edges are stored in compressed sparse row (CSR) form, vertices are numbered by their position in
+    the vertices sequence, the edges of vertex i are stored in targets[offsets[i]:offsets[i + 1]] and their costs
+    in the matching slice of costs. Since the arrays can be any sequence supporting indexing, this representation
+    can be backed by memory views over shared memory, which is how it is shared between processes.
+
+    It exposes the same querying interface as Graph, so it can back a GraphProblem.
+
+    Parameters
+    ----------
+    vertices : Sequence[Any]
+        The vertices of the graph, their positions are used as indices in the other arrays.
+    offsets : Sequence[int]
+        Offsets into targets and costs, len(vertices) + 1 elements.
+    targets : Sequence[int]
+        Indices of the vertices each edge leads to.
+    costs : Sequence[float]
+        Path costs of the edges, math.inf marks an edge without a cost.
+    """
+
+    def __init__(self,
+                 vertices: Sequence[Any],
+                 offsets: Sequence[int],
+                 targets: Sequence[int],
+                 costs: Sequence[float]) -> None:
+        self.__vertices = vertices
+        self.__offsets = offsets
+        self.__targets = targets
+        self.__costs = costs
+        self.__indices = {v: i for i, v in enumerate(vertices)}
+        self.__vertex_set = frozenset(vertices)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> CompactGraph:
+        """Creates a compact graph holding the same vertices and edges as the provided graph.
+
+        Parameters
+        ----------
+        graph : Graph
+            Graph which is going to be converted.
+
+        Returns
+        -------
+        CompactGraph
+            Compact representation of the graph.
+        """
+        vertices = list(graph.get_vertices())
+        indices = {v: i for i, v in enumerate(vertices)}
+
+        offsets, targets, costs = array("q", [0]), array("q"), array("d")
+        for v in vertices:
+            for neighbor, cost in graph.get_edges(v):
+                targets.append(indices[neighbor])
+                costs.append(cost)
+            offsets.append(len(targets))
+
+        return cls(vertices, offsets, targets, costs)
+
+    def get_arrays(self) -> tuple[Sequence[Any], Sequence[int], Sequence[int], Sequence[float]]:
+        """Returns the vertices and the arrays backing this graph.
+
+        Returns
+        -------
+        tuple[Sequence[Any], Sequence[int], Sequence[int], Sequence[float]]
+            The vertices, offsets, targets and costs of this graph.
+        """
+        return self.__vertices, self.__offsets, self.__targets, self.__costs
+
+    def get_vertices(self) -> frozenset[Any]:
+        """Returns the vertices in this graph.
+
+        Returns
+        -------
+        frozenset[Any]
+            Set of vertices in the graph.
+        """
+        return self.__vertex_set
+
+    def get_edges(self, vertex: Any) -> Edges:
+        """Returns the edges originating from the provided vertex.
+
+        Parameters
+        ----------
+        vertex : Any
+            Vertex in the graph.
+
+        Returns
+        -------
+        set[tuple[Any, float]]
+            A set of the edges originating from the provided vertex or an empty set
+            if the vertex is not part of the graph.
+        """
+        i = self.__indices.get(vertex)
+        if i is None:
+            return set()
+
+        vertices, targets, costs = self.__vertices, self.__targets, self.__costs
+
+        return {(vertices[targets[j]], costs[j]) for j in range(self.__offsets[i], self.__offsets[i + 1])}
+
+
+def register_dataset(name: str, builder: Callable[[], Graph]) -> None:
+    """Registers a named sample graph, which is built the first time it is loaded.
+
+    Parameters
+    ----------
+    name : str
+        Name of the graph, it is also accessible as an attribute of this module, such as datastructures.binary_tree.
+    builder : Callable[[], Graph]
+        Function building the graph.
+    """
+    _datasets[name] = builder
+    _loaded_datasets.pop(name, None)
+
+
+def get_dataset_names() -> list[str]:
+    """Returns the names of the registered sample graphs.
+
+    Returns
+    -------
+    list[str]
+        Names of the graphs.
+    """
+    return list(_datasets)
+
+
+def load_dataset(name: str, directory: Optional[str] = None) -> Graph:
+    """Returns a registered sample graph, building it on first access.
+
+    Graphs are cached in memory, every call returns the same instance. If a directory is provided, graphs are also
+    cached on disk in prebuilt (pickled) form, a graph found there is loaded instead of being built.
+
+    Parameters
+    ----------
+    name : str
+        Name of a registered graph.
+    directory : str
+        Optional directory holding the prebuilt graphs.
+
+    Returns
+    -------
+    Graph
+        The graph.
+
+    Raises
+    ------
+    KeyError
+        If no graph with the provided name is registered.
+    """
+    graph = _loaded_datasets.get(name)
+    if graph is not None:
+        return graph
+
+    builder = _datasets[name]
+    path = None if directory is None else os.path.join(directory, f"{name}.pickle")
+
+    if path is not None and os.path.exists(path):
+        with open(path, "rb") as f:
+            graph = pickle.load(f)
+    else:
+        graph = builder()
+
+        if path is not None:
+            with open(path + ".tmp", "wb") as f:
+                pickle.dump(graph, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(path + ".tmp", path)
+
+    _loaded_datasets[name] = graph
+
+    return graph
+
+
+def __getattr__(name: str) -> Graph:
+    if name in _datasets:
+        return load_dataset(name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _build_romania_road_map() -> Graph:
+    return Graph([("Oradea", "Zerind", 71), ("Oradea", "Sibiu", 151),
+                  ("Zerind", "Arad", 75),
+                  ("Arad", "Sibiu", 140), ("Arad", "Timisoara", 118),
+                  ("Timisoara", "Lugoj", 111),
+                  ("Lugoj", "Mehadia", 70),
+                  ("Mehadia", "Drobeta", 75),
+                  ("Drobeta", "Craiova", 120),
+                  ("Craiova", "Pitesti", 138), ("Craiova", "Rimnicu Vilcea", 146),
+                  ("Rimnicu Vilcea", "Pitesti", 97),
+                  ("Rimnicu Vilcea", "Sibiu", 80),
+                  ("Sibiu", "Fagaras", 99),
+                  ("Fagaras", "Bucharest", 211),
+                  ("Pitesti", "Bucharest", 101),
+                  ("Bucharest", "Giurgiu", 90), ("Bucharest", "Urziceni", 85),
+                  ("Urziceni", "Vaslui", 142), ("Urziceni", "Hirsova", 98),
+                  ("Vaslui", "Iasi", 92),
+                  ("Iasi", "Neamt", 87),
+                  ("Hirsova", "Eforie", 86)])
+
+
+def _build_binary_tree() -> Graph:
+    return Graph([("A", "B"), ("A", "C"),
+                  ("B", "D"), ("B", "E"),
+                  ("C", "F"), ("C", "G"),
+                  ("D", "H"), ("D", "I"),
+                  ("E", "J"), ("E", "K"),
+                  ("F", "L"), ("F", "M"),
+                  ("G", "N"), ("G", "O")], directed=True)
+
+
+_datasets = {}
+_loaded_datasets = {}
+
+register_dataset("romania_road_map", _build_romania_road_map)
+register_dataset("binary_tree", _build_binary_tree)
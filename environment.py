@@ -0,0 +1,169 @@
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+from agent import AgentProgram, VacuumPerception
+
+BatchAction = dict[str, int]
+
+LOCATIONS = ("A", "B")
+
+
+@dataclass(frozen=True, eq=True)
+class BatchPerception:
+    """Perceptions of a batch of vacuum worlds, as bitmaps where bit i describes world i.
+
+    Attributes
+    ----------
+    size : int
+        Number of worlds.
+    location : int
+        Bitmap of the worlds whose agent is in location B (the others are in A).
+    dirty : int
+        Bitmap of the worlds whose agent's location is dirty.
+    """
+    size: int
+    location: int
+    dirty: int
+
+    def get_perception(self, i: int) -> VacuumPerception:
+        """Returns the perception of a single world."""
+        return VacuumPerception(LOCATIONS[self.location >> i & 1], "Dirty" if self.dirty >> i & 1 else "Clean")
+
+
+class VacuumWorldBatch:
+    """Environment simulating a batch of two-location vacuum worlds at once.
+
+    The state of all the worlds is held in three bitmaps (Python integers), one for the locations of the agents
+    and one for the dirt of each location, bit i of each describing world i. Perceiving and acting are a few
+    bitwise operations on these integers, whatever the number of worlds, so agent programs which provide
+    a batch form (a batch attribute, taking a BatchPerception and returning a mapping of actions to
+    bitmaps of the worlds performing them) step millions of worlds at a time.
+
+    The performance measure is the one of the book, a point for every clean location at every time step.
+    Scores are kept per world, in bit-sliced counters: the k-th bitmap holds the k-th bit of every world's score.
+
+    Parameters
+    ----------
+    size : int
+        Number of worlds.
+    location : int
+        Initial bitmap of the worlds whose agent is in location B, random if None.
+    dirt_a : int
+        Initial bitmap of the worlds whose location A is dirty, random if None.
+    dirt_b : int
+        Initial bitmap of the worlds whose location B is dirty, random if None.
+    rng : random.Random
+        Random number generator for the initial state, the random module by default.
+    """
+
+    def __init__(self,
+                 size: int,
+                 location: Optional[int] = None,
+                 dirt_a: Optional[int] = None,
+                 dirt_b: Optional[int] = None,
+                 rng: Optional[random.Random] = None) -> None:
+        rng = random if rng is None else rng
+
+        self.size = size
+        self.__mask = (1 << size) - 1
+        self.__location = rng.getrandbits(size) if location is None else location
+        self.__dirt_a = rng.getrandbits(size) if dirt_a is None else dirt_a
+        self.__dirt_b = rng.getrandbits(size) if dirt_b is None else dirt_b
+        self.__scores = []
+        self.__steps = 0
+
+    def get_perception(self) -> BatchPerception:
+        """Returns the perceptions of all the worlds.
+
+        Returns
+        -------
+        BatchPerception
+            The perceptions.
+        """
+        location = self.__location
+        return BatchPerception(self.size, location, (self.__dirt_a & ~location) | (self.__dirt_b & location))
+
+    def step(self, actions: BatchAction) -> None:
+        """Applies the actions of the agents of all the worlds and scores the resulting states.
+
+        Parameters
+        ----------
+        actions : dict[str, int]
+            Mapping of the actions (Suck, Left, Right) to the bitmaps of the worlds whose agents perform them.
+            Worlds in none of the bitmaps do nothing.
+        """
+        location, mask = self.__location, self.__mask
+        suck = actions.get("Suck", 0)
+
+        self.__dirt_a &= ~(suck & ~location)
+        self.__dirt_b &= ~(suck & location)
+        self.__location = (location | actions.get("Right", 0)) & ~actions.get("Left", 0) & mask
+
+        self.__add_points(~self.__dirt_a & mask)
+        self.__add_points(~self.__dirt_b & mask)
+        self.__steps += 1
+
+    def run(self, agent_program: AgentProgram, steps: int) -> None:
+        """Runs an agent program in all the worlds for a number of steps.
+
+        The batch form of the program (its batch attribute) is used if it has one, if it does not, the program is
+        called with the perception of each world in turn, so it should not keep state between calls.
+
+        Parameters
+        ----------
+        agent_program : Callable[[Any], str]
+            The agent program.
+        steps : int
+            Number of steps.
+        """
+        batch = getattr(agent_program, "batch", None) or (lambda p: _run_scalar(agent_program, p))
+
+        for _ in range(steps):
+            self.step(batch(self.get_perception()))
+
+    def get_steps(self) -> int:
+        """Returns the number of steps simulated so far."""
+        return self.__steps
+
+    def get_performance(self) -> int:
+        """Returns the sum of the performance measures of all the worlds.
+
+        Returns
+        -------
+        int
+            Total score.
+        """
+        return sum(bin(plane).count("1") << k for k, plane in enumerate(self.__scores))
+
+    def get_scores(self) -> list[int]:
+        """Returns the performance measure of each world.
+
+        Returns
+        -------
+        list[int]
+            Score of every world.
+        """
+        return [sum((plane >> i & 1) << k for k, plane in enumerate(self.__scores)) for i in range(self.size)]
+
+    def __add_points(self, points: int) -> None:
+        carry = points
+
+        for k, plane in enumerate(self.__scores):
+            if not carry:
+                return
+            self.__scores[k], carry = plane ^ carry, plane & carry
+
+        if carry:
+            self.__scores.append(carry)
+
+
+def _run_scalar(agent_program: AgentProgram, perception: BatchPerception) -> BatchAction:
+    actions = {}
+
+    for i in range(perception.size):
+        action = agent_program(perception.get_perception(i))
+        if action is not None:
+            actions[action] = actions.get(action, 0) | 1 << i
+
+    return actions
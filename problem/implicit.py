@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable, Optional, Sequence
+
+from problem.node import Node
+from problem.problem import Problem
+
+Cell = tuple[int, int]
+
+SQRT_2 = math.sqrt(2)
+
+
+class GridProblem(Problem):
+    """Representation of a path finding problem on a 2-D grid, whose successors are generated on the fly.
+
+    Cells are numbered row by row, the state of cell (x, y) is the integer y * width + x, obstacles are kept in
+    a bit-packed array with one bit per cell. Moves to the 4 orthogonal neighbours cost 1, when diagonal
+    moves are allowed, they cost sqrt(2) and are only possible if both orthogonal cells they pass by are
+    free, so paths never cut the corners of obstacles. Actions are (next state, cost) tuples, like in GraphProblem.
+
+    Parameters
+    ----------
+    width : int
+        Number of columns of the grid.
+    height : int
+        Number of rows of the grid.
+    obstacles : Iterable[tuple[int, int]]
+        The blocked (x, y) cells.
+    initial_cell : tuple[int, int]
+        The (x, y) cell from which an agent begins.
+    goal_cells : Iterable[tuple[int, int]]
+        The (x, y) cells which an agent is trying to reach.
+    diagonal : bool
+        Whether diagonal moves are allowed (8-connected grid) or not (4-connected grid).
+    """
+
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 obstacles: Iterable[Cell],
+                 initial_cell: Cell,
+                 goal_cells: Iterable[Cell],
+                 diagonal: bool = False) -> None:
+        self.width = width
+        self.height = height
+        self.diagonal = diagonal
+        self.__obstacles = bytearray((width * height + 7) // 8)
+
+        for x, y in obstacles:
+            s = self.get_state(x, y)
+            self.__obstacles[s >> 3] |= 1 << (s & 7)
+
+        super().__init__(initial_state=self.get_state(*initial_cell),
+                         goal_states={self.get_state(x, y) for x, y in goal_cells})
+        self.__goal_cells = [self.get_cell(s) for s in self.goal_states]
+
+    @classmethod
+    def from_strings(cls, rows: Sequence[str], diagonal: bool = False) -> GridProblem:
+        """Creates a grid problem from its textual representation.
+
+        Every string is a row, '#' marks an obstacle, 'S' the initial cell, 'G' a goal cell,
+        any other character a free cell.
+
+        Parameters
+        ----------
+        rows : Sequence[str]
+            Rows of the grid, all of the same length.
+        diagonal : bool
+            Whether diagonal moves are allowed.
+
+        Returns
+        -------
+        GridProblem
+            The grid problem.
+        """
+        cells = [((x, y), c) for y, row in enumerate(rows) for x, c in enumerate(row)]
+
+        return cls(len(rows[0]), len(rows),
+                   [xy for xy, c in cells if c == "#"],
+                   next(xy for xy, c in cells if c == "S"),
+                   [xy for xy, c in cells if c == "G"],
+                   diagonal)
+
+    def get_state(self, x: int, y: int) -> int:
+        """Returns the state of a cell."""
+        return y * self.width + x
+
+    def get_cell(self, state: int) -> Cell:
+        """Returns the (x, y) cell of a state."""
+        y, x = divmod(state, self.width)
+        return x, y
+
+    def is_free(self, x: int, y: int) -> bool:
+        """Determines whether a cell is inside the grid and not blocked."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+
+        s = y * self.width + x
+        return not self.__obstacles[s >> 3] & (1 << (s & 7))
+
+    def get_actions(self, state):
+        x, y = self.get_cell(state)
+        w = self.width
+        free = self.is_free
+
+        actions = [(state + dx + dy * w, 1) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                   if free(x + dx, y + dy)]
+
+        if self.diagonal:
+            actions.extend((state + dx + dy * w, SQRT_2) for dx, dy in ((1, 1), (1, -1), (-1, 1), (-1, -1))
+                           if free(x + dx, y + dy) and free(x + dx, y) and free(x, y + dy))
+
+        return actions
+
+    def apply_action(self, action):
+        return action[0]
+
+    def get_action_cost(self, action):
+        return action[1]
+
+    def manhattan_heuristic(self, node: Node) -> float:
+        """Manhattan distance to the closest goal, admissible on 4-connected grids."""
+        x, y = self.get_cell(node.state)
+        return min((abs(x - gx) + abs(y - gy) for gx, gy in self.__goal_cells), default=math.inf)
+
+    def octile_heuristic(self, node: Node) -> float:
+        """Octile distance to the closest goal, admissible on 8-connected grids."""
+        x, y = self.get_cell(node.state)
+        return min((_octile(abs(x - gx), abs(y - gy)) for gx, gy in self.__goal_cells), default=math.inf)
+
+
+class SlidingPuzzleProblem(Problem):
+    """Representation of a sliding-tile puzzle (8-puzzle, 15-puzzle), whose states are packed integers.
+
+    The tile on position i (counting row by row) occupies bits 4 * i to 4 * i + 3 of a state, 0 stands for
+    the blank, so puzzles of up to 4 x 4 tiles fit in 64 bits. Every move slides a tile into the blank and costs 1,
+    actions are (next state, cost) tuples.
+
+    Parameters
+    ----------
+    initial_tiles : Sequence[int]
+        The tiles of the initial state, row by row, 0 for the blank.
+    goal_tiles : Sequence[int]
+        The tiles of the goal state, 1, 2, ..., n * n - 1 followed by the blank by default.
+    """
+
+    def __init__(self, initial_tiles: Sequence[int], goal_tiles: Optional[Sequence[int]] = None) -> None:
+        n = math.isqrt(len(initial_tiles))
+        if n * n != len(initial_tiles) or n > 4:
+            raise ValueError(f"{len(initial_tiles)} tiles do not form a square puzzle of up to 4 x 4 tiles")
+
+        goal_tiles = list(range(1, n * n)) + [0] if goal_tiles is None else goal_tiles
+
+        super().__init__(initial_state=pack_tiles(initial_tiles), goal_states={pack_tiles(goal_tiles)})
+        self.size = n
+        self.__neighbours = [[p + d for d, valid in ((-n, p >= n), (n, p < n * n - n),
+                                                     (-1, p % n > 0), (1, p % n < n - 1)) if valid]
+                             for p in range(n * n)]
+        goals = {t: divmod(p, n) for p, t in enumerate(goal_tiles)}
+        self.__distances = [[0] * (n * n)] + [[abs(p // n - goals[t][0]) + abs(p % n - goals[t][1])
+                                               for p in range(n * n)] for t in range(1, n * n)]
+
+    def get_actions(self, state):
+        blank = _find_blank(state)
+        actions = []
+
+        for p in self.__neighbours[blank]:
+            tile = (state >> (4 * p)) & 0xF
+            actions.append((state + (tile << (4 * blank)) - (tile << (4 * p)), 1))
+
+        return actions
+
+    def apply_action(self, action):
+        return action[0]
+
+    def get_action_cost(self, action):
+        return action[1]
+
+    def is_solvable(self) -> bool:
+        """Determines whether the goal can be reached from the initial state, using the parity of permutations."""
+        goal = next(iter(self.goal_states))
+        return _get_parity(self.initial_state, self.size) == _get_parity(goal, self.size)
+
+    def manhattan_heuristic(self, node: Node) -> float:
+        """Sum of the Manhattan distances of the tiles to their goal positions, admissible."""
+        state, distances = node.state, self.__distances
+        return sum(distances[(state >> (4 * p)) & 0xF][p] for p in range(self.size * self.size))
+
+
+def pack_tiles(tiles: Sequence[int]) -> int:
+    """Packs the tiles of a sliding puzzle, row by row, into an integer state."""
+    state = 0
+
+    for p, t in enumerate(tiles):
+        state |= t << (4 * p)
+
+    return state
+
+
+def unpack_tiles(state: int, size: int) -> list[int]:
+    """Unpacks the tiles of an integer state of a size x size sliding puzzle."""
+    return [(state >> (4 * p)) & 0xF for p in range(size * size)]
+
+
+def _find_blank(state: int) -> int:
+    p = 0
+
+    while state & 0xF:
+        state >>= 4
+        p += 1
+
+    return p
+
+
+def _get_parity(state: int, size: int) -> int:
+    tiles = unpack_tiles(state, size)
+    numbers = [t for t in tiles if t]
+    inversions = sum(1 for i, a in enumerate(numbers) for b in numbers[i + 1:] if a > b)
+
+    if size % 2:
+        return inversions % 2
+
+    return (inversions + tiles.index(0) // size) % 2
+
+
+def _octile(dx: int, dy: int) -> float:
+    return max(dx, dy) + (SQRT_2 - 1) * min(dx, dy)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from typing import Any, Generator
+from typing import Any, Generator, Iterator, Optional
 
 DEFAULT_PATH_COST = 0
 DEFAULT_DEPTH = 0
@@ -52,14 +52,7 @@ class Node:
             The path from this node to the root.
 
         """
-        path = []
-
-        p = self.parent
-        while p:
-            path.append(p.state)
-            p = p.parent
-
-        return path
+        return list(_iterate_states(self.parent))
 
     def is_cycle(self):
         """Determines if the current node is on a cycle path.
@@ -69,8 +62,13 @@ class Node:
         Bool
             Whether this node is on a cycle path.
         """
-        path = self.get_path()
-        return any(s == self.state for s in path)
+        p = self.parent
+        while p:
+            if p.state == self.state:
+                return True
+            p = p.parent
+
+        return False
 
     def expand(self, problem) -> Generator[Node]:
         """Expands the nodes that are one step away from this one.
@@ -96,17 +94,95 @@ class Node:
             yield Node(state=frontier_state, parent=self, action=a, path_cost=cost)
 
 
-def join_nodes(direction: str, nodes: tuple[Node, Node]) -> Node:
-    n_f, n_b = nodes if direction == "F" else nodes[::-1]
+class PathView:
+    """Lazy view of the path joining a forward and a backward chain of nodes, which meet in the same state.
+
+    The view only references the two nodes where the chains meet, so recording a candidate solution of
+    a bidirectional search is O(1), whatever the length of its path. The states of the path (from the root
+    of the forward chain to the root of the backward chain) are generated on demand, and the path can be
+    materialised into a single chain of nodes, like the one join_nodes returns, once it is the solution.
+
+    Parameters
+    ----------
+    forward : problem.node.Node
+        The node where the forward chain ends.
+    backward : problem.node.Node
+        The node where the backward chain ends, its state is the one of the forward node.
+        If None, the view is the path of the forward chain alone.
+    """
+
+    def __init__(self, forward: Node, backward: Optional[Node] = None) -> None:
+        self.forward = forward
+        self.backward = backward
+
+    @classmethod
+    def join(cls, direction: str, nodes: tuple[Node, Node]) -> PathView:
+        """Creates the view of the path joining two nodes, ordered by the direction of the first one (F or B)."""
+        return cls(*(nodes if direction == "F" else nodes[::-1]))
+
+    @property
+    def state(self) -> Any:
+        """The state at the end of the path."""
+        if self.backward is None:
+            return self.forward.state
+
+        n = self.backward
+        while n.parent is not None:
+            n = n.parent
 
-    join_node = n_f
+        return n.state
+
+    @property
+    def path_cost(self) -> float:
+        """The cost of the whole path."""
+        return self.forward.path_cost + (0 if self.backward is None else self.backward.path_cost)
+
+    @property
+    def depth(self) -> int:
+        """The number of actions of the path."""
+        return self.forward.depth + (0 if self.backward is None else self.backward.depth)
+
+    def __len__(self) -> int:
+        return self.depth + 1
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from reversed(list(_iterate_states(self.forward)))
+
+        if self.backward is not None:
+            yield from _iterate_states(self.backward.parent)
+
+    def __reversed__(self) -> Iterator[Any]:
+        if self.backward is not None:
+            yield from reversed(list(_iterate_states(self.backward.parent)))
+
+        yield from _iterate_states(self.forward)
+
+    def to_node(self) -> Node:
+        """Materialises the path into a chain of nodes, ending in a node of the state at the end of the path.
+
+        Returns
+        -------
+        Node
+            The last node of the chain.
+        """
+        join_node, n_b = self.forward, self.backward
+
+        while n_b is not None and n_b.parent is not None:
+            cost = join_node.path_cost + n_b.path_cost - n_b.parent.path_cost
+            join_node = Node(n_b.parent.state, join_node, n_b.parent.action, cost)
+            n_b = n_b.parent
+
+        return join_node
+
+
+def join_nodes(direction: str, nodes: tuple[Node, Node]) -> Node:
+    return PathView.join(direction, nodes).to_node()
 
-    while n_b.parent is not None:
-        cost = join_node.path_cost + n_b.path_cost - n_b.parent.path_cost
-        join_node = Node(n_b.parent.state, join_node, n_b.parent.action, cost)
-        n_b = n_b.parent
 
-    return join_node
+def _iterate_states(node: Optional[Node]) -> Iterator[Any]:
+    while node is not None:
+        yield node.state
+        node = node.parent
 
 
 cutoff = Node(state="cutoff", path_cost=math.inf)
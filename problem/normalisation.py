@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import itertools
+import math
+from collections import deque
+from typing import Any, Iterable, Sequence
+
+from datastructures import Graph
+from problem.node import Node
+from problem.problem import GraphProblem
+
+Hops = tuple[tuple[Any, float], ...]
+
+
+class NormalisedGraph:
+    """A graph produced by normalise_graph, along with what is needed to map its paths back to the original graph.
+
+    The vertices of the normalised graph are the integers 0..n - 1, every edge remembers its hops, the sequence of
+    (vertex, cost) pairs of the original edges it replaces, so a path found in the normalised graph expands back
+    into the path of original vertices it stands for, with the same cost.
+
+    Parameters
+    ----------
+    vertices : Sequence[Any]
+        The original vertices, in the order of their labels.
+    hops : dict[tuple[int, int], tuple[tuple[Any, float], ...]]
+        Mapping of the edges of the normalised graph, as (from, to) label pairs, to their hops in the original graph.
+    """
+
+    def __init__(self, vertices: Sequence[Any], hops: dict[tuple[int, int], Hops]) -> None:
+        self.__vertices = list(vertices)
+        self.__indices = {v: i for i, v in enumerate(self.__vertices)}
+        self.__hops = hops
+        self.__graph = Graph([(f, t, _get_cost(h)) for (f, t), h in hops.items()], directed=True)
+
+    def get_graph(self) -> Graph:
+        """Returns the normalised graph, whose vertices are labels."""
+        return self.__graph
+
+    def get_index(self, vertex: Any) -> int:
+        """Returns the label of an original vertex.
+
+        Parameters
+        ----------
+        vertex : Any
+            A vertex of the original graph.
+
+        Returns
+        -------
+        int
+            The label of the vertex.
+
+        Raises
+        ------
+        ValueError
+            If the vertex is not part of the normalised graph, because it was contracted or is unknown.
+        """
+        try:
+            return self.__indices[vertex]
+        except KeyError:
+            raise ValueError(f"Vertex {vertex!r} is not part of the normalised graph, "
+                             "vertices which are searched from or for have to be kept") from None
+
+    def get_vertex(self, index: int) -> Any:
+        """Returns the original vertex of a label."""
+        return self.__vertices[index]
+
+    def create_problem(self, initial_state: Any, goal_states: Iterable[Any]) -> GraphProblem:
+        """Creates a problem on the normalised graph, from original vertices.
+
+        Parameters
+        ----------
+        initial_state : Any
+            Original vertex the problem starts from.
+        goal_states : Iterable[Any]
+            Original vertices which are the goals of the problem.
+
+        Returns
+        -------
+        GraphProblem
+            Problem whose states are labels, its solutions are mapped back with expand_node.
+        """
+        return GraphProblem(self.get_index(initial_state), {self.get_index(g) for g in goal_states}, self.__graph)
+
+    def expand_path(self, indices: Sequence[int]) -> list[Any]:
+        """Expands a path of labels into the path of original vertices it stands for.
+
+        Parameters
+        ----------
+        indices : Sequence[int]
+            Labels of a path of the normalised graph, from its first vertex.
+
+        Returns
+        -------
+        list[Any]
+            The original vertices of the path, including the ones of the contracted chains.
+        """
+        path = [self.__vertices[i] for i in indices[:1]]
+        for f, t in zip(indices, indices[1:]):
+            path.extend(v for v, _ in self.__hops[(f, t)])
+
+        return path
+
+    def expand_node(self, node: Node) -> Node:
+        """Expands a solution node of the normalised graph into one of the original graph.
+
+        Parameters
+        ----------
+        node : Node
+            Solution node of a problem created by create_problem, failure and cutoff are returned as they are.
+
+        Returns
+        -------
+        Node
+            Solution node whose states are original vertices, with an action (vertex, cost) for every original edge.
+        """
+        if node.path_cost == math.inf:
+            return node
+
+        indices = node.get_path()[::-1] + [node.state]
+        expanded = Node(state=self.__vertices[indices[0]])
+
+        for f, t in zip(indices, indices[1:]):
+            for v, c in self.__hops[(f, t)]:
+                expanded = Node(state=v, parent=expanded, action=(v, c), path_cost=expanded.path_cost + _get_weight(c))
+
+        return expanded
+
+
+def normalise_graph(graph: Graph, keep: Iterable[Any] = (), contract: bool = True) -> NormalisedGraph:
+    """Normalises a graph, to shrink the space its searches explore.
+
+    The pass
+
+    - collapses parallel edges into the cheapest one and drops self-loops,
+    - contracts chains of degree-2 vertices (vertices with exactly two neighbours, counting both directions),
+      every path through such a vertex becomes a single edge whose cost is the sum of the costs it replaces,
+      the vertex is removed and the edge remembers it, so paths expand back to the original vertices,
+    - relabels the remaining vertices with the integers 0..n - 1, in breadth-first order, so neighbouring vertices
+      get close labels, which keeps their edges close in array based representations, like CompactGraph.
+
+    Contracted vertices cannot be searched from or for, so the vertices which queries use have to be kept.
+    The costs of shortest paths between the remaining vertices are the same as in the original graph,
+    math.inf (no cost) counts as a cost of 0.
+
+    Parameters
+    ----------
+    graph : Graph
+        The graph, directed or undirected.
+    keep : Iterable[Any]
+        Vertices which must not be contracted.
+    contract : bool
+        Whether to contract the degree-2 chains.
+
+    Returns
+    -------
+    NormalisedGraph
+        The normalised graph.
+    """
+    keep = set(keep)
+    successors = {v: {} for v in graph.get_vertices()}
+    predecessors = {v: set() for v in successors}
+
+    for f in successors:
+        for t, c in graph.get_edges(f):
+            if f != t:
+                _add_edge(successors, predecessors, f, t, ((t, c),))
+
+    if contract:
+        candidates = deque(successors)
+
+        while candidates:
+            v = candidates.popleft()
+            if v not in successors or v in keep:
+                continue
+
+            neighbours = set(successors[v]) | predecessors[v]
+            if len(neighbours) != 2:
+                continue
+
+            for u in neighbours:
+                for w in neighbours:
+                    if u != w and v in successors[u] and w in successors[v]:
+                        _add_edge(successors, predecessors, u, w, successors[u][v] + successors[v][w])
+
+            for u in predecessors[v]:
+                del successors[u][v]
+            for w in successors[v]:
+                predecessors[w].discard(v)
+            del successors[v], predecessors[v]
+
+            candidates.extend(neighbours)
+
+    vertices = _get_breadth_first_order(successors, predecessors)
+    indices = {v: i for i, v in enumerate(vertices)}
+
+    return NormalisedGraph(vertices, {(indices[f], indices[t]): h
+                                      for f in successors for t, h in successors[f].items()})
+
+
+def _add_edge(successors: dict[Any, dict[Any, Hops]], predecessors: dict[Any, set], f: Any, t: Any, hops: Hops) -> None:
+    current = successors[f].get(t)
+
+    if current is None or _get_weight(_get_cost(hops)) < _get_weight(_get_cost(current)):
+        successors[f][t] = hops
+        predecessors[t].add(f)
+
+
+def _get_breadth_first_order(successors: dict[Any, dict[Any, Hops]], predecessors: dict[Any, set]) -> list[Any]:
+    order = []
+    visited = set()
+
+    for root in successors:
+        if root in visited:
+            continue
+
+        visited.add(root)
+        queue = deque([root])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+
+            for n in itertools.chain(successors[v], predecessors[v]):
+                if n not in visited:
+                    visited.add(n)
+                    queue.append(n)
+
+    return order
+
+
+def _get_cost(hops: Hops) -> float:
+    if all(c == math.inf for _, c in hops):
+        return math.inf
+
+    return sum(_get_weight(c) for _, c in hops)
+
+
+def _get_weight(cost: float) -> float:
+    return 0 if cost == math.inf else cost
@@ -1,5 +1,6 @@
 import random
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 
 class Problem(ABC):
@@ -32,6 +33,17 @@ class Problem(ABC):
     def get_action_cost(self, action):
         pass
 
+    def encode_state(self, state):
+        """Encodes a state in a compact, hashable form, such as a packed integer or bytes.
+
+        Used by the compact reached sets, the default encoding is the state itself.
+        """
+        return state
+
+    def decode_state(self, code):
+        """Decodes a state encoded with encode_state."""
+        return code
+
 
 class GraphProblem(Problem):
     """Representation of a graph problem.
@@ -60,6 +72,87 @@ class GraphProblem(Problem):
         return action[1]
 
 
+class CachingProblem(Problem):
+    """Wrapper around a problem, which memoizes its successors.
+
+    The actions of every state passed to get_actions are kept in a least recently used cache, so are the results
+    of apply_action, which are keyed by the action since the result of an action does not depend on anything else.
+    Searches which expand the same states repeatedly, like iterative deepening, then call the wrapped
+    problem once per state, for as long as the state stays in the cache. Everything else is delegated to
+    the wrapped problem.
+
+    Successors are assumed not to change, if they do (for example the graph of a GraphProblem is edited),
+    the cache has to be cleared.
+
+    Parameters
+    ----------
+    problem : Problem
+        The wrapped problem.
+    max_size : int
+        The maximum number of states (and, separately, actions) whose successors are kept.
+    """
+
+    def __init__(self, problem, max_size=4096):
+        super().__init__(initial_state=problem.initial_state, goal_states=problem.goal_states)
+        self.problem = problem
+        self.__max_size = max_size
+        self.__actions = OrderedDict()
+        self.__states = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get_hits(self):
+        """Returns the number of calls answered from the cache."""
+        return self.__hits
+
+    def get_misses(self):
+        """Returns the number of calls delegated to the wrapped problem."""
+        return self.__misses
+
+    def clear(self):
+        """Empties the cache, the counters are kept."""
+        self.__actions.clear()
+        self.__states.clear()
+
+    def is_goal(self, state):
+        return self.problem.is_goal(state)
+
+    def get_actions(self, state):
+        return self.__get(self.__actions, state, lambda: tuple(self.problem.get_actions(state)))
+
+    def apply_action(self, action):
+        return self.__get(self.__states, action, lambda: self.problem.apply_action(action))
+
+    def get_action_cost(self, action):
+        return self.problem.get_action_cost(action)
+
+    def encode_state(self, state):
+        return self.problem.encode_state(state)
+
+    def decode_state(self, code):
+        return self.problem.decode_state(code)
+
+    def __get(self, cache, key, compute):
+        try:
+            value = cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            self.__misses += 1
+            return compute()
+        else:
+            cache.move_to_end(key)
+            self.__hits += 1
+            return value
+
+        self.__misses += 1
+        value = cache[key] = compute()
+        if len(cache) > self.__max_size:
+            cache.popitem(last=False)
+
+        return value
+
+
 def create_n_queens_states(n, population_size):
     return ["".join([str(random.randint(1, n)) for _ in range(n)]) for _ in range(population_size)]
 
@@ -0,0 +1,196 @@
+import asyncio
+import inspect
+import math
+import time
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, Callable, Optional, Sequence
+
+from agent import AgentProgram
+
+Actuator = Callable[[str, Any, str], Any]
+
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_LATENCY_SAMPLES = 1024
+
+
+class AgentRuntime:
+    """Asyncio runtime stepping many agent programs concurrently.
+
+    Every agent has a bounded queue of perceptions and a worker task, which takes all the perceptions waiting
+    in the queue (up to the batch size) and runs the agent program on them in order, so the perceptions of
+    an agent are always handled in the order they were submitted, while different agents run concurrently.
+    When a queue is full, submitting to it waits, which slows the event sources down to the pace of their agents.
+
+    Agent programs run on the event loop, unless an executor is provided, in which case every batch runs in it,
+    for CPU-heavy programs. A thread pool suits any program, a process pool only those which can be pickled and
+    do not keep state, since each batch runs on a copy of the program.
+
+    The latency of a step, the time from the submission of a perception to the computation of its action, is
+    sampled for every agent.
+
+    Parameters
+    ----------
+    actuator : Callable[[str, Any, str], Any]
+        Called with the name of an agent, a perception and the agent's action, for every step, can be a coroutine.
+    queue_size : int
+        The maximum number of perceptions waiting for each agent.
+    batch_size : int
+        The maximum number of perceptions handled at once by each agent.
+    executor : concurrent.futures.Executor
+        Optional executor running the agent programs.
+    """
+
+    def __init__(self,
+                 actuator: Optional[Actuator] = None,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 executor: Optional[Executor] = None) -> None:
+        self.__actuator = actuator
+        self.__queue_size = queue_size
+        self.__batch_size = batch_size
+        self.__executor = executor
+        self.__agents = {}
+        self.__queues = {}
+        self.__workers = {}
+        self.__latencies = {}
+        self.__steps = {}
+        self.__errors = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if exc_info[0] is None:
+            await self.join()
+        await self.close()
+
+    def add_agent(self, name: str, agent_program: AgentProgram) -> None:
+        """Adds an agent to the runtime and starts its worker, it has to be called from a running event loop.
+
+        Parameters
+        ----------
+        name : str
+            Unique name of the agent.
+        agent_program : Callable[[Any], str]
+            The agent's program.
+        """
+        if name in self.__agents:
+            raise ValueError(f"Agent {name} already exists")
+
+        self.__agents[name] = agent_program
+        self.__queues[name] = asyncio.Queue(self.__queue_size)
+        self.__latencies[name] = deque(maxlen=DEFAULT_LATENCY_SAMPLES)
+        self.__steps[name] = 0
+        self.__workers[name] = asyncio.ensure_future(self.__work(name))
+
+    async def submit(self, name: str, perception: Any) -> None:
+        """Submits a perception to an agent, waiting while its queue is full.
+
+        Parameters
+        ----------
+        name : str
+            Name of the agent.
+        perception : Any
+            Representation of a perception.
+        """
+        await self.__queues[name].put((time.perf_counter(), perception))
+
+    async def feed(self, name: str, source: AsyncIterable[Any]) -> None:
+        """Submits all the perceptions of an event source to an agent.
+
+        Parameters
+        ----------
+        name : str
+            Name of the agent.
+        source : AsyncIterable[Any]
+            Asynchronous source of perceptions.
+        """
+        async for perception in source:
+            await self.submit(name, perception)
+
+    async def join(self) -> None:
+        """Waits until every submitted perception has been handled.
+
+        Raises
+        ------
+        Exception
+            The first exception raised by an agent program or the actuator since the previous call, if any,
+            the exceptions are cleared, so the runtime can be joined again after handling it.
+        """
+        await asyncio.gather(*(q.join() for q in self.__queues.values()))
+
+        if self.__errors:
+            error = self.__errors[0]
+            self.__errors.clear()
+            raise error
+
+    async def close(self) -> None:
+        """Stops the workers of all the agents, perceptions which have not been handled are dropped."""
+        for worker in self.__workers.values():
+            worker.cancel()
+
+        await asyncio.gather(*self.__workers.values(), return_exceptions=True)
+        self.__workers.clear()
+
+    def get_steps(self, name: str) -> int:
+        """Returns the number of perceptions an agent has handled."""
+        return self.__steps[name]
+
+    def get_latency_percentiles(self, name: str, percentiles: Sequence[float] = (50, 90, 99)) -> dict[float, float]:
+        """Returns percentiles of the latencies of the latest steps of an agent.
+
+        Parameters
+        ----------
+        name : str
+            Name of the agent.
+        percentiles : Sequence[float]
+            The percentiles, between 0 and 100.
+
+        Returns
+        -------
+        dict[float, float]
+            Mapping of the percentiles to latencies in seconds (nearest rank), math.nan if there were no steps.
+        """
+        latencies = sorted(self.__latencies[name])
+
+        return {p: latencies[max(0, math.ceil(p / 100 * len(latencies)) - 1)] if latencies else math.nan
+                for p in percentiles}
+
+    async def __work(self, name: str) -> None:
+        queue, agent_program = self.__queues[name], self.__agents[name]
+        latencies = self.__latencies[name]
+
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.__batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                perceptions = [p for _, p in batch]
+
+                if self.__executor is None:
+                    actions = _run_batch(agent_program, perceptions)
+                else:
+                    actions = await asyncio.get_running_loop().run_in_executor(self.__executor, _run_batch,
+                                                                               agent_program, perceptions)
+
+                now = time.perf_counter()
+                latencies.extend(now - t for t, _ in batch)
+                self.__steps[name] += len(batch)
+
+                if self.__actuator is not None:
+                    for perception, action in zip(perceptions, actions):
+                        result = self.__actuator(name, perception, action)
+                        if inspect.isawaitable(result):
+                            await result
+            except Exception as e:
+                self.__errors.append(e)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+
+def _run_batch(agent_program: AgentProgram, perceptions: list[Any]) -> list[str]:
+    return [agent_program(p) for p in perceptions]
@@ -0,0 +1,216 @@
+import asyncio
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any
+
+from datastructures import PriorityQueue
+from problem.node import Node, failure
+from problem.problem import Problem
+from search.helpers import path_cost_evaluation_function
+from search.uninformed_search import EvaluationFunction
+
+DEFAULT_MAX_IN_FLIGHT = 8
+
+
+class AsyncProblem(ABC):
+    """An abstract class acting as the base for problems whose successors are computed asynchronously.
+
+    Mirrors Problem, except that get_actions and apply_action are coroutines, which is the case when
+    successors come from a service, a database or any other I/O bound source.
+
+    Parameters
+    ----------
+    initial_state : obj
+        The state from which an agent will begin solving this problem.
+    goal_states : set
+        A set of states which represents the target for an agent solving this problem.
+    """
+
+    def __init__(self, initial_state, goal_states: set):
+        self.initial_state = initial_state
+        self.goal_states = goal_states
+
+    def is_goal(self, state):
+        return state in self.goal_states
+
+    @abstractmethod
+    async def get_actions(self, state):
+        pass
+
+    @abstractmethod
+    async def apply_action(self, action):
+        pass
+
+    @abstractmethod
+    def get_action_cost(self, action):
+        pass
+
+
+class AsyncProblemAdapter(AsyncProblem):
+    """Adapts a (blocking) Problem to the AsyncProblem interface, by running its calls in an executor.
+
+    Parameters
+    ----------
+    problem : Problem
+        The adapted problem.
+    executor : concurrent.futures.Executor
+        Executor running the calls, the event loop's default one if None.
+    """
+
+    def __init__(self, problem: Problem, executor=None):
+        super().__init__(initial_state=problem.initial_state, goal_states=problem.goal_states)
+        self.problem = problem
+        self.__executor = executor
+
+    def is_goal(self, state):
+        return self.problem.is_goal(state)
+
+    async def get_actions(self, state):
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, self.problem.get_actions, state)
+
+    async def apply_action(self, action):
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, self.problem.apply_action, action)
+
+    def get_action_cost(self, action):
+        return self.problem.get_action_cost(action)
+
+
+async def async_best_first_search(problem: AsyncProblem,
+                                  evaluation_function: EvaluationFunction,
+                                  max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> Node:
+    """Asynchronous best-first search implementation.
+
+    Expands up to max_in_flight nodes concurrently: the best nodes of the frontier are popped and expanded
+    without waiting for each other, and the children of every finished expansion are added to the frontier.
+    A goal node is only returned once it is the best node of the frontier while no expansion is in flight,
+    since an unfinished expansion could still produce a better node. With an evaluation function that never
+    decreases along a path (such as the path cost, or the f-cost of A* with a consistent heuristic), the result
+    is as good as the one of best_first_search, at the price of expanding some nodes it would not have expanded.
+
+    Parameters
+    ----------
+    problem : AsyncProblem
+        Problem, which the algorithm searches.
+    evaluation_function: Callable[[Node], float]
+        Function calculating the cost of each node. It is used to order the priority queue backing the algorithm.
+    max_in_flight : int
+        The maximum number of concurrent expansions.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    node = Node(state=problem.initial_state)
+
+    reached = {node.state: node.path_cost}
+    frontier = PriorityQueue([(evaluation_function(node), node)], evaluation_function)
+    in_flight = set()
+
+    try:
+        while frontier or in_flight:
+            while frontier and len(in_flight) < max_in_flight:
+                n = frontier.pop()[1]
+
+                if problem.is_goal(n.state):
+                    if not in_flight:
+                        return n
+
+                    frontier.add(n)
+                    break
+
+                in_flight.add(asyncio.ensure_future(_expand(problem, n)))
+
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                for c in task.result():
+                    if c.state not in reached or c.path_cost < reached[c.state]:
+                        reached[c.state] = c.path_cost
+                        frontier.add(c)
+    finally:
+        await _cancel(in_flight)
+
+    return failure
+
+
+async def async_uniform_cost_search(problem: AsyncProblem, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> Node:
+    """Asynchronous uniform-cost search implementation.
+
+    Calls asynchronous best-first search with the path cost of a node as the evaluation function.
+
+    Parameters
+    ----------
+    problem : AsyncProblem
+        Problem, which the algorithm searches.
+    max_in_flight : int
+        The maximum number of concurrent expansions.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    return await async_best_first_search(problem, path_cost_evaluation_function, max_in_flight)
+
+
+async def async_breadth_first_search(problem: AsyncProblem, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> Node:
+    """Asynchronous breadth-first search implementation.
+
+    Starts the expansions of up to max_in_flight nodes from the front of the FIFO queue at once, but handles
+    their results in the order the nodes were queued, so the nodes are generated and goal tested
+    in the same order as in breadth_first_search, which returns the same solution.
+
+    Parameters
+    ----------
+    problem : AsyncProblem
+        The problem which this implementation searches.
+    max_in_flight : int
+        The maximum number of concurrent expansions.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    node = Node(state=problem.initial_state)
+
+    if problem.is_goal(node.state):
+        return node
+
+    frontier = deque([node])
+    reached = {node.state}
+    in_flight = deque()
+
+    try:
+        while frontier or in_flight:
+            while frontier and len(in_flight) < max_in_flight:
+                in_flight.append(asyncio.ensure_future(_expand(problem, frontier.popleft())))
+
+            for e in await in_flight.popleft():
+                if problem.is_goal(e.state):
+                    return e
+                if e.state not in reached:
+                    reached.add(e.state)
+                    frontier.append(e)
+    finally:
+        await _cancel(in_flight)
+
+    return failure
+
+
+async def _expand(problem: AsyncProblem, node: Node) -> list[Node]:
+    actions = list(await problem.get_actions(node.state))
+    states = await asyncio.gather(*(problem.apply_action(a) for a in actions))
+
+    return [Node(state=s, parent=node, action=a,
+                 path_cost=node.path_cost if a[1] == math.inf else node.path_cost + a[1])
+            for a, s in zip(actions, states)]
+
+
+async def _cancel(tasks: Any) -> None:
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
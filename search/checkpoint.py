@@ -0,0 +1,305 @@
+import os
+import pickle
+import struct
+import zlib
+from typing import Any, BinaryIO, Iterable, Optional
+
+from problem.node import Node
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"AIAMCKPT"
+_LOG_MAGIC = b"AIAMCLOG"
+_HEADER = struct.Struct(">8sH")
+_LENGTH = struct.Struct(">I")
+_MIN_COMPACTION_SIZE = 1 << 16
+
+NodeTable = list[tuple[Any, int, Any, float]]
+
+
+class Checkpoint:
+    """Periodically saved snapshot or log of a long-running algorithm, which can be resumed from.
+
+    An algorithm given a checkpoint saves its progress every interval steps (expansions or generations),
+    resuming from it continues the run exactly as if it had not been interrupted, provided that the problem
+    lists its actions in a deterministic order. The actions of a Graph are a set, whose iteration order depends
+    on the hashes of the states, which are randomised per process for strings (see PYTHONHASHSEED), so a resumed
+    search may break ties between equally good nodes differently and return another solution of the same cost.
+
+    Algorithms whose state has a bounded size, like the population of a genetic algorithm, save it whole
+    with save, as a snapshot. The snapshot is pickled, compressed and prefixed with a versioned header, it is
+    written to a temporary file first and then moved in place, so a crash while saving never leaves a corrupted
+    checkpoint behind.
+
+    Algorithms whose state grows with every step, like the frontier and reached set of a search, would make
+    snapshots cost O(N^2 / interval) over a run of N steps, they append the records of the steps done since
+    their previous save to a log instead (see start_log, append_log and load_log), which costs O(interval) per
+    save, and rebuild their state by replaying the records when they resume. Every append is a length-prefixed
+    compressed chunk, a chunk left incomplete by a crash is dropped when the log is loaded. Every chunk also
+    carries a small state (the random state...) of which only the latest one is needed, so once the log has
+    doubled in size since it was last compacted, its chunks are rewritten as a single one, which keeps the
+    total cost of the compactions linear in the size of the log.
+
+    Parameters
+    ----------
+    path : str
+        Path of the checkpoint file.
+    interval : int
+        Number of steps between two saves.
+    """
+
+    def __init__(self, path: str, interval: int = 10000) -> None:
+        self.path = path
+        self.interval = interval
+        self.__compacted_size = 0
+
+    def is_due(self, step: int) -> bool:
+        """Determines whether the state after the provided step should be saved.
+
+        Parameters
+        ----------
+        step : int
+            Number of steps done so far.
+
+        Returns
+        -------
+        bool
+            Whether the state should be saved.
+        """
+        return step % self.interval == 0
+
+    def save(self, algorithm: str, state: dict[str, Any]) -> None:
+        """Saves the state of an algorithm, replacing the previous one.
+
+        Parameters
+        ----------
+        algorithm : str
+            Name of the algorithm, checked when the state is loaded.
+        state : dict[str, Any]
+            Picklable state of the algorithm.
+        """
+        data = zlib.compress(pickle.dumps((algorithm, state), pickle.HIGHEST_PROTOCOL), 1)
+        temporary_path = self.path + ".tmp"
+
+        with open(temporary_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, FORMAT_VERSION))
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(temporary_path, self.path)
+
+    def load(self, algorithm: str) -> dict[str, Any]:
+        """Loads the state saved by an algorithm.
+
+        Parameters
+        ----------
+        algorithm : str
+            Name of the algorithm, which has to match the one which saved the state.
+
+        Returns
+        -------
+        dict[str, Any]
+            The saved state.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a checkpoint, it has an unsupported version or was saved by another algorithm.
+        """
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        magic, version = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} checkpoint")
+
+        saved_algorithm, state = pickle.loads(zlib.decompress(data[_HEADER.size:]))
+        if saved_algorithm != algorithm:
+            raise ValueError(f"{self.path} is a checkpoint of {saved_algorithm}, not {algorithm}")
+
+        return state
+
+    def start_log(self, algorithm: str) -> None:
+        """Starts a new, empty log of an algorithm, replacing any previous checkpoint.
+
+        Parameters
+        ----------
+        algorithm : str
+            Name of the algorithm, checked when the log is loaded.
+        """
+        self.__write_log(algorithm, [])
+
+    def append_log(self, records: list[Any], state: dict[str, Any]) -> None:
+        """Appends the records of the steps done since the previous append to the log started by start_log.
+
+        Parameters
+        ----------
+        records : list[Any]
+            Picklable records of the steps, in the order the algorithm replays them.
+        state : dict[str, Any]
+            Small picklable state of the algorithm, replacing the one of the previous append.
+        """
+        with open(self.path, "ab") as f:
+            _write_chunk(f, records, state)
+            size = f.tell()
+
+        if size >= max(2 * self.__compacted_size, _MIN_COMPACTION_SIZE):
+            self.__compact()
+
+    def load_log(self, algorithm: str) -> tuple[list[Any], Optional[dict[str, Any]]]:
+        """Loads the log of an algorithm, so it can be resumed and appended to.
+
+        Parameters
+        ----------
+        algorithm : str
+            Name of the algorithm, which has to match the one which started the log.
+
+        Returns
+        -------
+        tuple[list[Any], Optional[dict[str, Any]]]
+            All the records, in the order they were appended, and the latest state, None if nothing was appended.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a checkpoint log, it has an unsupported version or was started by another algorithm.
+        """
+        records, state, size = self.__read_log(algorithm)
+
+        with open(self.path, "r+b") as f:
+            f.truncate(size)
+        self.__compacted_size = size
+
+        return records, state
+
+    def __compact(self) -> None:
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        algorithm, position = _read_log_header(self.path, data)
+        records, state, _ = _read_chunks(data, position)
+        self.__write_log(algorithm, [(records, state)])
+
+    def __read_log(self, algorithm: str) -> tuple[list[Any], Optional[dict[str, Any]], int]:
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        saved_algorithm, position = _read_log_header(self.path, data)
+        if saved_algorithm != algorithm:
+            raise ValueError(f"{self.path} is a checkpoint of {saved_algorithm}, not {algorithm}")
+
+        return _read_chunks(data, position)
+
+    def __write_log(self, algorithm: str, chunks: list[tuple[list[Any], dict[str, Any]]]) -> None:
+        name = algorithm.encode()
+        temporary_path = self.path + ".tmp"
+
+        with open(temporary_path, "wb") as f:
+            f.write(_HEADER.pack(_LOG_MAGIC, FORMAT_VERSION))
+            f.write(_LENGTH.pack(len(name)))
+            f.write(name)
+            for records, state in chunks:
+                _write_chunk(f, records, state)
+            self.__compacted_size = f.tell()
+
+        os.replace(temporary_path, self.path)
+
+
+def flatten_nodes(nodes: Iterable[Node]) -> tuple[NodeTable, list[int]]:
+    """Flattens nodes, along with all their ancestors, into a table.
+
+    Every node is stored once, as a (state, parent index, action, path cost) row, parents before their children.
+    Unlike pickling the nodes directly, this does not recurse along the paths, so it works for paths of any depth.
+
+    Parameters
+    ----------
+    nodes : Iterable[Node]
+        Nodes to flatten.
+
+    Returns
+    -------
+    tuple[list[tuple[Any, int, Any, float]], list[int]]
+        The table and the indices of the nodes in it.
+    """
+    table = []
+    indices = {}
+
+    def index(node: Node) -> int:
+        chain = []
+        while node is not None and id(node) not in indices:
+            chain.append(node)
+            node = node.parent
+
+        for n in reversed(chain):
+            indices[id(n)] = len(table)
+            table.append((n.state, -1 if n.parent is None else indices[id(n.parent)], n.action, n.path_cost))
+
+        return indices[id(chain[0])] if chain else indices[id(node)]
+
+    return table, [index(n) for n in nodes]
+
+
+def restore_nodes(table: NodeTable) -> list[Node]:
+    """Restores the nodes flattened by flatten_nodes.
+
+    Parameters
+    ----------
+    table : list[tuple[Any, int, Any, float]]
+        Table of nodes.
+
+    Returns
+    -------
+    list[Node]
+        The nodes, in the order of the table.
+    """
+    nodes = []
+
+    for state, parent, action, path_cost in table:
+        nodes.append(Node(state=state, parent=None if parent == -1 else nodes[parent], action=action,
+                          path_cost=path_cost))
+
+    return nodes
+
+
+def _write_chunk(f: BinaryIO, records: list[Any], state: dict[str, Any]) -> None:
+    data = zlib.compress(pickle.dumps((records, state), pickle.HIGHEST_PROTOCOL), 1)
+
+    f.write(_LENGTH.pack(len(data)))
+    f.write(data)
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _read_log_header(path: str, data: bytes) -> tuple[str, int]:
+    if len(data) < _HEADER.size + _LENGTH.size:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} checkpoint log")
+
+    magic, version = _HEADER.unpack_from(data)
+    if magic != _LOG_MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} checkpoint log")
+
+    length, = _LENGTH.unpack_from(data, _HEADER.size)
+    position = _HEADER.size + _LENGTH.size + length
+
+    return data[position - length:position].decode(), position
+
+
+def _read_chunks(data: bytes, position: int) -> tuple[list[Any], Optional[dict[str, Any]], int]:
+    records, state = [], None
+
+    while position + _LENGTH.size <= len(data):
+        length, = _LENGTH.unpack_from(data, position)
+        end = position + _LENGTH.size + length
+        if end > len(data):
+            break
+
+        try:
+            chunk_records, state = pickle.loads(zlib.decompress(data[position + _LENGTH.size:end]))
+        except zlib.error:
+            break
+
+        records.extend(chunk_records)
+        position = end
+
+    return records, state, position
@@ -1,7 +1,13 @@
+import math
 import random
-from typing import Sequence, Callable
+from typing import Any, Sequence, Callable
+
+from datastructures import BoundedPriorityQueue
+from problem.problem import Problem
+from search.checkpoint import Checkpoint
 
 FitnessFunction = Callable[[str], float]
+ObjectiveFunction = Callable[[Any], float]
 
 
 def weight_by(population: Sequence[str], fitness_function: FitnessFunction) -> list[float]:
@@ -99,7 +105,9 @@ def genetic_algorithm(population: Sequence[str],
                       fitness_threshold: float = None,
                       mutation_rate: float = 0.1,
                       number_generations: int = 100,
-                      generation_size: int = 1000) -> str:
+                      generation_size: int = 1000,
+                      checkpoint: Checkpoint = None,
+                      resume: bool = False) -> str:
     """Implementation of a genetic algorithm.
 
     It relies on a fixed generation size and number of generations, the recombination procedure assumes
@@ -123,12 +131,24 @@ def genetic_algorithm(population: Sequence[str],
         The number of generations for which the algorithm is going to run.
     generation_size : int
         The population size of each generation.
+    checkpoint : Checkpoint
+        If provided, the population and the random state are saved every checkpoint.interval generations,
+        as a snapshot, since the size of the population is bounded by generation_size, so is the cost of a save.
+    resume : bool
+        Whether to continue the run saved in the checkpoint, instead of starting a new one.
 
     Returns
     -------
 
     """
-    for _ in range(number_generations):
+    generation = 0
+
+    if resume:
+        state = checkpoint.load("genetic_algorithm")
+        population, generation = state["population"], state["generation"]
+        random.setstate(state["random"])
+
+    for generation in range(generation + 1, number_generations + 1):
         weights = weight_by(population, fitness_function)
         next_generation = []
 
@@ -147,4 +167,96 @@ def genetic_algorithm(population: Sequence[str],
 
         population = next_generation
 
+        if checkpoint is not None and checkpoint.is_due(generation):
+            checkpoint.save("genetic_algorithm", {"population": population,
+                                                  "generation": generation,
+                                                  "random": random.getstate()})
+
     return max(population, key=fitness_function)
+
+
+def local_beam_search(problem: Problem,
+                      objective_function: ObjectiveFunction,
+                      beam_width: int,
+                      initial_states: Sequence[Any] = None,
+                      max_iterations: int = 100,
+                      stochastic: bool = False) -> Any:
+    """Implementation of local beam search and stochastic beam search.
+
+    Keeps track of beam_width states instead of one. At every iteration, the successors of all the states
+    are generated and, if none of them is a goal, the beam_width best ones (the ones with the highest objective
+    values) become the next beam, kept in a BoundedPriorityQueue, so an iteration takes O(n log k) time
+    for n successors and the beam never holds more than beam_width states.
+
+    In the stochastic mode, the next beam is a random sample of the successors, without replacement, where
+    the probability of choosing a successor is proportional to its value, which must not be negative.
+    Every successor gets the random key u ** (1 / value), u being uniform in [0, 1), and the beam_width
+    largest keys are kept, which samples the successors in a single pass (weighted reservoir sampling).
+
+    The search stops when it finds a goal, after max_iterations iterations or, in the deterministic mode,
+    when no successor is better than the best state of the beam (a local maximum).
+
+    Parameters
+    ----------
+    problem : Problem
+        Problem, whose actions provide the successors of the states.
+    objective_function : Callable[[Any], float]
+        Function evaluating a state, the search maximises it.
+    beam_width : int
+        The number of states kept at every iteration.
+    initial_states : Sequence[Any]
+        The states of the first beam, the initial state of the problem if not provided.
+    max_iterations : int
+        The maximum number of iterations.
+    stochastic : bool
+        Whether to sample the successors (stochastic beam search) instead of choosing the best ones.
+
+    Returns
+    -------
+    Any
+        A goal state or the best state found.
+    """
+    beam = list(dict.fromkeys([problem.initial_state] if initial_states is None else initial_states))
+    best = max(beam, key=objective_function)
+    best_value = objective_function(best)
+
+    for _ in range(max_iterations):
+        for s in beam:
+            if problem.is_goal(s):
+                return s
+
+        values = {}
+        for s in beam:
+            for a in problem.get_actions(s):
+                successor = problem.apply_action(a)
+                if successor not in values:
+                    values[successor] = objective_function(successor)
+
+        if not values:
+            break
+
+        best_successor = max(values, key=values.get)
+        if values[best_successor] > best_value:
+            best, best_value = best_successor, values[best_successor]
+        elif not stochastic:
+            break
+
+        if stochastic:
+            keys = {s: _sampling_key(v) for s, v in values.items()}
+            next_beam = BoundedPriorityQueue(beam_width, lambda s: -keys[s])
+        else:
+            next_beam = BoundedPriorityQueue(beam_width, lambda s: -values[s])
+
+        for s in values:
+            next_beam.add(s)
+
+        beam = [s for _, s in next_beam.pop_all()]
+
+    return best
+
+
+def _sampling_key(value: float) -> float:
+    if value < 0:
+        raise ValueError("Stochastic beam search requires non-negative objective values")
+
+    return random.random() ** (1 / value) if value > 0 else -math.inf
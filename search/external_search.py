@@ -0,0 +1,419 @@
+import hashlib
+import heapq
+import itertools
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from typing import Any, Iterable, Iterator, Optional
+
+from problem.node import Node, failure
+from problem.problem import Problem
+
+Record = tuple[float, bytes, bytes]
+
+DEFAULT_MEMORY_BUDGET = 64 * 2 ** 20
+
+_RECORD_HEADER = struct.Struct("<d16sI")
+_RECORD_OVERHEAD = 128
+_INDEX_ENTRY = struct.Struct("<16sQ")
+_INDEX_ENTRY_OVERHEAD = 128
+_LENGTH = struct.Struct("<I")
+_MAX_RUNS = 16
+
+
+def external_breadth_first_search(problem: Problem,
+                                  memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                                  directory: Optional[str] = None,
+                                  locality: Optional[int] = None) -> Node:
+    """External-memory breadth-first search implementation.
+
+    Every layer of the search lives on disk, as a file of records sorted by a digest of their states.
+    While a layer is expanded, the generated records are buffered in memory until the memory budget is reached,
+    after which the buffer is sorted and spilled to disk as a run. Duplicates are detected with a delay,
+    once the layer is fully expanded, by merging the sorted runs and subtracting the previous layers, which are
+    sorted in the same order. At most _MAX_RUNS runs or layers are merged at once, once there are more of them,
+    they are first merged into a single file, so the number of open files does not grow with the size of a layer
+    or the depth of the search.
+
+    Goals are tested as soon as a node is generated, like in breadth_first_search.
+    States are identified by a digest of their pickled encoding (Problem.encode_state), so they have to be picklable.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem which this implementation searches.
+    memory_budget : int
+        Approximate number of bytes the buffered records can use before they are spilled to disk.
+    directory : str
+        Directory in which the temporary files are created, the system's temporary directory by default.
+    locality : int
+        Number of previous layers which are subtracted from a new one. All of them by default,
+        2 is enough for undirected graphs, because their edges never skip a layer backwards.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    node = Node(state=problem.initial_state)
+
+    if problem.is_goal(node.state):
+        return node
+
+    with tempfile.TemporaryDirectory(dir=directory) as d:
+        layers = [os.path.join(d, "layer-0")]
+        _write_run(layers[0], [(0, _get_digest(problem, node.state), _pack_payload(node.state, None, None, 0))])
+
+        run_ids = itertools.count()
+
+        while True:
+            runs, buffer, size = [], [], 0
+
+            for _, digest, payload in _read_run(layers[-1]):
+                state, _, _, path_cost = pickle.loads(payload)
+
+                for c in Node(state=state, path_cost=path_cost).expand(problem):
+                    if problem.is_goal(c.state):
+                        return _recover_layered_path(layers, (c.state, digest, c.action, c.path_cost))
+
+                    p = _pack_payload(c.state, digest, c.action, c.path_cost)
+                    buffer.append((0, _get_digest(problem, c.state), p))
+                    size += len(p) + _RECORD_OVERHEAD
+
+                    if size >= memory_budget:
+                        buffer.sort()
+                        runs.append(os.path.join(d, "run-{}".format(next(run_ids))))
+                        _write_run(runs[-1], buffer)
+                        buffer, size = [], 0
+
+                        if len(runs) > _MAX_RUNS:
+                            runs = [_merge_runs(d, "run-{}".format(next(run_ids)), runs)]
+
+            buffer.sort()
+            previous = layers[-locality if locality else 0:]
+            if len(previous) > _MAX_RUNS:
+                previous = [_merge_runs(d, "previous", previous, remove=False)]
+
+            generated = _unique(heapq.merge(*[_read_run(r) for r in runs], buffer))
+            layers.append(os.path.join(d, "layer-{}".format(len(layers))))
+            count = _write_run(layers[-1], _subtract(generated, heapq.merge(*[_read_run(p) for p in previous])))
+
+            for r in runs:
+                os.remove(r)
+            if previous[0] not in layers:
+                os.remove(previous[0])
+
+            if not count:
+                return failure
+
+
+def external_uniform_cost_search(problem: Problem,
+                                 memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                                 directory: Optional[str] = None) -> Node:
+    """External-memory uniform-cost search implementation. (External Dijkstra's algorithm)
+
+    The frontier is an external priority queue, it keeps a heap in memory and, once its half of the memory budget
+    is used up, spills it to disk as a run sorted by path cost. Records are popped from the smallest of the heap
+    and the heads of the runs. The reached set is an index from state digests to records in an append-only
+    log file, the index is flushed to disk as sorted, memory-mapped runs when it outgrows the other half of the
+    memory budget. Both kinds of runs are merged together once there are too many of them.
+
+    Since records are popped in path cost order, the first time a state is popped its path is optimal,
+    every later copy of it is a duplicate and is dropped.
+    Goals are tested when a node is popped, like in best_first_search.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem which this implementation searches.
+    memory_budget : int
+        Approximate number of bytes the in-memory parts of the frontier and the reached set can use.
+    directory : str
+        Directory in which the temporary files are created, the system's temporary directory by default.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    with tempfile.TemporaryDirectory(dir=directory) as d:
+        frontier = _ExternalPriorityQueue(d, memory_budget // 2)
+        reached = _ExternalReachedSet(d, memory_budget // 2)
+
+        try:
+            state = problem.initial_state
+            frontier.add(0, _get_digest(problem, state), _pack_payload(state, None, None, 0))
+
+            while frontier:
+                _, digest, payload = frontier.pop()
+
+                if digest in reached:
+                    continue
+                reached.add(digest, payload)
+
+                state, _, _, path_cost = pickle.loads(payload)
+                if problem.is_goal(state):
+                    return _recover_indexed_path(reached, digest)
+
+                for c in Node(state=state, path_cost=path_cost).expand(problem):
+                    child_digest = _get_digest(problem, c.state)
+
+                    if child_digest not in reached:
+                        frontier.add(c.path_cost, child_digest,
+                                     _pack_payload(c.state, digest, c.action, c.path_cost))
+
+            return failure
+        finally:
+            frontier.close()
+            reached.close()
+
+
+class _ExternalPriorityQueue:
+    def __init__(self, directory: str, memory_budget: int) -> None:
+        self.__directory = directory
+        self.__memory_budget = memory_budget
+        self.__buffer = []
+        self.__size = 0
+        self.__heads = []
+        self.__runs = {}
+        self.__run_ids = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.__buffer) + len(self.__heads)
+
+    def add(self, priority: float, digest: bytes, payload: bytes) -> None:
+        heapq.heappush(self.__buffer, (priority, digest, payload))
+        self.__size += len(payload) + _RECORD_OVERHEAD
+
+        if self.__size >= self.__memory_budget:
+            self.__spill()
+
+    def pop(self) -> Record:
+        if self.__heads and (not self.__buffer or self.__heads[0][:3] < self.__buffer[0]):
+            *record, run_id = heapq.heappop(self.__heads)
+            self.__advance(run_id)
+            return tuple(record)
+
+        record = heapq.heappop(self.__buffer)
+        self.__size -= len(record[2]) + _RECORD_OVERHEAD
+
+        return record
+
+    def close(self) -> None:
+        for _, records in self.__runs.values():
+            records.close()
+
+    def __spill(self) -> None:
+        self.__buffer.sort()
+        self.__add_run(self.__buffer)
+        self.__buffer, self.__size = [], 0
+
+        if len(self.__runs) > _MAX_RUNS:
+            runs, heads = self.__runs, self.__heads
+            self.__runs, self.__heads = {}, []
+
+            self.__add_run(heapq.merge(*[itertools.chain([tuple(h[:3])], runs[h[3]][1]) for h in heads]))
+
+            for path, records in runs.values():
+                records.close()
+                os.remove(path)
+
+    def __add_run(self, records: Iterable[Record]) -> None:
+        run_id = next(self.__run_ids)
+        path = os.path.join(self.__directory, "frontier-{}".format(run_id))
+
+        _write_run(path, records)
+        self.__runs[run_id] = (path, _read_run(path))
+        self.__advance(run_id)
+
+    def __advance(self, run_id: int) -> None:
+        path, records = self.__runs[run_id]
+        record = next(records, None)
+
+        if record is None:
+            del self.__runs[run_id]
+            os.remove(path)
+        else:
+            heapq.heappush(self.__heads, (*record, run_id))
+
+
+class _ExternalReachedSet:
+    def __init__(self, directory: str, memory_budget: int) -> None:
+        self.__directory = directory
+        self.__capacity = max(1, memory_budget // _INDEX_ENTRY_OVERHEAD)
+        self.__log = open(os.path.join(directory, "reached.log"), "w+b")
+        self.__index = {}
+        self.__runs = []
+        self.__run_ids = itertools.count()
+
+    def __contains__(self, digest: bytes) -> bool:
+        return self.__get_offset(digest) is not None
+
+    def add(self, digest: bytes, payload: bytes) -> None:
+        self.__log.seek(0, os.SEEK_END)
+        self.__index[digest] = self.__log.tell()
+        self.__log.write(_LENGTH.pack(len(payload)))
+        self.__log.write(payload)
+
+        if len(self.__index) >= self.__capacity:
+            self.__flush()
+
+    def get(self, digest: bytes) -> bytes:
+        self.__log.seek(self.__get_offset(digest))
+        length, = _LENGTH.unpack(self.__log.read(_LENGTH.size))
+
+        return self.__log.read(length)
+
+    def close(self) -> None:
+        for m, _ in self.__runs:
+            m.close()
+        self.__log.close()
+
+    def __get_offset(self, digest: bytes) -> Optional[int]:
+        offset = self.__index.get(digest)
+
+        for m, _ in self.__runs:
+            if offset is not None:
+                break
+            offset = _search_index_run(m, digest)
+
+        return offset
+
+    def __flush(self) -> None:
+        sources, merged = [sorted(self.__index.items())], []
+        self.__index = {}
+
+        if len(self.__runs) >= _MAX_RUNS:
+            sources.extend(_read_index_run(m) for m, _ in self.__runs)
+            merged, self.__runs = self.__runs, []
+
+        path = os.path.join(self.__directory, "reached-{}".format(next(self.__run_ids)))
+        with open(path, "wb") as f:
+            for digest, offset in heapq.merge(*sources):
+                f.write(_INDEX_ENTRY.pack(digest, offset))
+        with open(path, "rb") as f:
+            self.__runs.append((mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), path))
+
+        for m, p in merged:
+            m.close()
+            os.remove(p)
+
+
+def _get_digest(problem: Problem, state: Any) -> bytes:
+    return hashlib.blake2b(pickle.dumps(problem.encode_state(state), 4), digest_size=16).digest()
+
+
+def _pack_payload(state: Any, parent_digest: Optional[bytes], action: Any, path_cost: float) -> bytes:
+    return pickle.dumps((state, parent_digest, action, path_cost), pickle.HIGHEST_PROTOCOL)
+
+
+def _write_run(path: str, records: Iterable[Record]) -> int:
+    count = 0
+
+    with open(path, "wb") as f:
+        for priority, digest, payload in records:
+            f.write(_RECORD_HEADER.pack(priority, digest, len(payload)))
+            f.write(payload)
+            count += 1
+
+    return count
+
+
+def _merge_runs(directory: str, name: str, paths: list[str], remove: bool = True) -> str:
+    temporary = set()
+    paths = list(paths)
+
+    while len(paths) > _MAX_RUNS:
+        group, paths = paths[:_MAX_RUNS], paths[_MAX_RUNS:]
+        paths.append(_merge_group(os.path.join(directory, "{}-{}".format(name, len(temporary))), group,
+                                  [p for p in group if remove or p in temporary]))
+        temporary.add(paths[-1])
+
+    return _merge_group(os.path.join(directory, name), paths, [p for p in paths if remove or p in temporary])
+
+
+def _merge_group(path: str, paths: list[str], removed: list[str]) -> str:
+    _write_run(path, heapq.merge(*[_read_run(p) for p in paths]))
+
+    for p in removed:
+        os.remove(p)
+
+    return path
+
+
+def _read_run(path: str) -> Iterator[Record]:
+    with open(path, "rb") as f:
+        while header := f.read(_RECORD_HEADER.size):
+            priority, digest, length = _RECORD_HEADER.unpack(header)
+            yield priority, digest, f.read(length)
+
+
+def _read_index_run(m: mmap.mmap) -> Iterator[tuple[bytes, int]]:
+    return _INDEX_ENTRY.iter_unpack(m)
+
+
+def _search_index_run(m: mmap.mmap, digest: bytes) -> Optional[int]:
+    lo, hi = 0, len(m) // _INDEX_ENTRY.size
+
+    while lo < hi:
+        mid = (lo + hi) // 2
+        d, offset = _INDEX_ENTRY.unpack_from(m, mid * _INDEX_ENTRY.size)
+
+        if d == digest:
+            return offset
+        elif d < digest:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return None
+
+
+def _unique(records: Iterable[Record]) -> Iterator[Record]:
+    last = None
+
+    for r in records:
+        if r[1] != last:
+            last = r[1]
+            yield r
+
+
+def _subtract(records: Iterable[Record], previous: Iterable[Record]) -> Iterator[Record]:
+    previous = iter(previous)
+    p = next(previous, None)
+
+    for r in records:
+        while p is not None and p[1] < r[1]:
+            p = next(previous, None)
+        if p is None or p[1] != r[1]:
+            yield r
+
+
+def _recover_layered_path(layers: list[str], last: tuple[Any, bytes, Any, float]) -> Node:
+    steps = [last]
+
+    for layer in reversed(layers):
+        parent_digest = steps[-1][1]
+        steps.append(next(pickle.loads(p) for _, d, p in _read_run(layer) if d == parent_digest))
+
+    return _build_path(steps)
+
+
+def _recover_indexed_path(reached: _ExternalReachedSet, digest: bytes) -> Node:
+    steps = [pickle.loads(reached.get(digest))]
+
+    while steps[-1][1] is not None:
+        steps.append(pickle.loads(reached.get(steps[-1][1])))
+
+    return _build_path(steps)
+
+
+def _build_path(steps: list[tuple[Any, Optional[bytes], Any, float]]) -> Node:
+    node = None
+
+    for state, _, action, path_cost in reversed(steps):
+        node = Node(state=state, parent=node, action=action, path_cost=path_cost)
+
+    return node
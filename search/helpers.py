@@ -1,5 +1,7 @@
+from typing import Union
+
 from datastructures import PriorityQueue
-from problem.node import Node, join_nodes
+from problem.node import Node, PathView
 from problem.problem import Problem
 
 
@@ -7,12 +9,24 @@ def path_cost_evaluation_function(node: Node):
     return node.path_cost
 
 
+def path_cost_has_terminated(solution: Union[Node, PathView],
+                             frontier_f: PriorityQueue,
+                             frontier_b: PriorityQueue) -> bool:
+    """Termination check of bidirectional uniform-cost search.
+
+    Once the path costs of the best nodes of both frontiers add up to at least the cost of the solution,
+    no path through the unexpanded nodes can be cheaper, the search also terminates when a frontier is empty.
+    """
+    return (not frontier_f or not frontier_b
+            or solution.path_cost <= frontier_f.top().path_cost + frontier_b.top().path_cost)
+
+
 def proceed(direction: str,
             problem: Problem,
             frontier: PriorityQueue,
             reached1: dict[str, Node],
             reached2: dict[str, Node],
-            solution: Node) -> Node:
+            solution: Union[Node, PathView]) -> Union[Node, PathView]:
     node = frontier.pop()[1]
 
     for c in node.expand(problem):
@@ -23,7 +37,7 @@ def proceed(direction: str,
             frontier.add(c)
 
             if state in reached2:
-                joined_solution = join_nodes(direction, (c, reached2[state]))
+                joined_solution = PathView.join(direction, (c, reached2[state]))
                 if joined_solution.path_cost < solution.path_cost:
                     solution = joined_solution
 
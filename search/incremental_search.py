@@ -0,0 +1,201 @@
+import heapq
+import itertools
+import math
+from collections import defaultdict, deque
+from typing import Any, Optional
+
+from problem.node import Node, failure
+from problem.problem import GraphProblem
+from search.informed_search import Heuristic
+
+Cost = tuple[float, float]
+Key = tuple[float, float, float, float]
+
+_GOAL = object()
+_INFINITY = (math.inf, math.inf)
+
+
+class LifelongPlanningAStar:
+    """Implementation of Lifelong Planning A* (LPA*).
+
+    An incremental version of A*, which keeps its search state between queries. For every vertex it maintains
+    g, the cost of the best path found so far, and rhs, a one-step lookahead of it based on the g values of the
+    vertex's predecessors. Only vertices whose g and rhs differ (locally inconsistent ones) are put in the priority
+    queue, so after the costs of a few edges change, plan only repairs the part of the search affected by them.
+
+    The planner follows the graph backing the problem: every call to plan applies the changes made to the graph's
+    edges (see Graph.set_edge_cost and Graph.remove_edge) since the previous call, using the graph's version.
+    If the graph no longer remembers all of those changes (see Graph.get_changes), the planner starts over.
+    Multiple goal states are handled by connecting them to a virtual goal vertex with edges without a cost,
+    since the virtual goal ties with the goal states it is reached from, the search goes on until the top key
+    of the priority queue exceeds the virtual goal's key.
+
+    Edges without a cost (math.inf) cost nothing, as in Node.expand. To keep cycles of such edges from
+    supporting each other's costs, path costs are compared as (cost, number of edges) pairs, which makes every
+    edge strictly positive and has the side effect of preferring, amongst optimal paths, those with fewer edges.
+
+    Parameters
+    ----------
+    problem : GraphProblem
+        The problem which this planner searches, its graph can change between calls to plan.
+    heuristic : Callable[[Node], float]
+        Consistent function estimating the cost of the cheapest path from a node to a goal, 0 by default.
+    """
+
+    def __init__(self, problem: GraphProblem, heuristic: Optional[Heuristic] = None) -> None:
+        self.__problem = problem
+        self.__graph = problem.graph
+        self.__heuristic = heuristic
+        self.__start = problem.initial_state
+        self.__expansions = 0
+        self.__counter = itertools.count()
+        self.__reset()
+
+    def get_expansions(self) -> int:
+        """Returns the number of vertices this planner expanded so far, across all calls to plan.
+
+        Returns
+        -------
+        int
+            Number of expansions.
+        """
+        return self.__expansions
+
+    def plan(self) -> Node:
+        """Applies the pending changes of the graph and returns the current optimal solution.
+
+        Returns
+        -------
+        Node
+            Solution node or failure.
+        """
+        changes = self.__graph.get_changes(self.__version)
+
+        if changes is None:
+            self.__reset()
+        else:
+            self.__version = self.__graph.get_version()
+
+            for first_vertex in {f for f, _ in changes}:
+                self.__update_edge(first_vertex)
+            for second_vertex in {t for _, t in changes}:
+                self.__update_vertex(second_vertex)
+
+        self.__compute_shortest_path()
+
+        return self.__get_solution()
+
+    def __reset(self) -> None:
+        self.__version = self.__graph.get_version()
+
+        self.__predecessors = defaultdict(dict)
+        self.__successors = {}
+        for v in self.__graph.get_vertices():
+            self.__update_edge(v)
+
+        self.__g = defaultdict(lambda: _INFINITY)
+        self.__rhs = defaultdict(lambda: _INFINITY)
+        self.__queue = []
+        self.__keys = {}
+
+        self.__rhs[self.__start] = (0, 0)
+        self.__push(self.__start)
+
+    def __compute_shortest_path(self) -> None:
+        g, rhs = self.__g, self.__rhs
+
+        while self.__queue and (self.__queue[0][0] <= self.__calculate_key(_GOAL) or rhs[_GOAL] != g[_GOAL]):
+            key, _, u = heapq.heappop(self.__queue)
+
+            if self.__keys.get(u) != key:
+                continue
+            del self.__keys[u]
+            self.__expansions += 1
+
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]
+            else:
+                g[u] = _INFINITY
+                self.__update_vertex(u)
+
+            for s in self.__get_successors(u):
+                self.__update_vertex(s)
+
+    def __update_vertex(self, u: Any) -> None:
+        if u != self.__start:
+            self.__rhs[u] = min((_add(self.__g[p], c) for p, c in self.__get_predecessors(u)), default=_INFINITY)
+
+        self.__keys.pop(u, None)
+        if self.__g[u] != self.__rhs[u]:
+            self.__push(u)
+
+    def __update_edge(self, first_vertex: Any) -> None:
+        for t in self.__successors.pop(first_vertex, ()):
+            self.__predecessors[t].pop(first_vertex, None)
+
+        successors = self.__successors[first_vertex] = set()
+        for second_vertex, cost in self.__graph.get_edges(first_vertex):
+            cost = 0 if cost == math.inf else cost
+            costs = self.__predecessors[second_vertex]
+            costs[first_vertex] = min(costs.get(first_vertex, math.inf), cost)
+            successors.add(second_vertex)
+
+    def __push(self, u: Any) -> None:
+        key = self.__calculate_key(u)
+        self.__keys[u] = key
+        heapq.heappush(self.__queue, (key, next(self.__counter), u))
+
+    def __calculate_key(self, u: Any) -> Key:
+        g = min(self.__g[u], self.__rhs[u])
+        h = 0 if u is _GOAL or self.__heuristic is None else self.__heuristic(Node(state=u))
+
+        return g[0] + h, g[1], g[0], g[1]
+
+    def __get_successors(self, u: Any) -> list[Any]:
+        successors = [] if u is _GOAL else [s for s, _ in self.__graph.get_edges(u)]
+
+        if self.__problem.is_goal(u):
+            successors.append(_GOAL)
+
+        return successors
+
+    def __get_predecessors(self, u: Any) -> list[tuple[Any, float]]:
+        if u is _GOAL:
+            return [(s, 0) for s in self.__problem.goal_states]
+
+        return list(self.__predecessors[u].items())
+
+    def __get_solution(self) -> Node:
+        g = self.__g
+
+        if g[_GOAL] == _INFINITY:
+            return failure
+
+        goal = min(self.__problem.goal_states, key=lambda s: g[s])
+        successors = {goal: None}
+        frontier = deque([goal])
+        while self.__start not in successors:
+            v = frontier.popleft()
+            for p, c in self.__predecessors[v].items():
+                if p not in successors and _add(g[p], c) <= g[v]:
+                    successors[p] = v
+                    frontier.append(p)
+
+        node = Node(state=self.__start)
+        states = []
+        s = successors[self.__start]
+        while s is not None:
+            states.append(s)
+            s = successors[s]
+
+        for s in states:
+            action = min((a for a in self.__graph.get_edges(node.state) if a[0] == s),
+                         key=lambda a: 0 if a[1] == math.inf else a[1])
+            cost = node.path_cost if action[1] == math.inf else node.path_cost + action[1]
+            node = Node(state=s, parent=node, action=action, path_cost=cost)
+
+        return node
+
+
+def _add(cost: Cost, edge_cost: float) -> Cost:
+    return cost[0] + edge_cost, cost[1] + 1
@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from typing import Callable, Iterator, Optional
+
+from datastructures import BoundedPriorityQueue
+from problem.node import Node, failure
+from problem.problem import Problem
+from search.uninformed_search import EvaluationFunction, best_first_search
+
+Heuristic = Callable[[Node], float]
+
+
+def astar_search(problem: Problem, heuristic: Heuristic) -> Node:
+    """A* search implementation.
+
+    Calls best-first search with an evaluation function which is the sum of the path cost of a node
+    and the heuristic estimate of the cost from it to a goal. With an admissible and consistent heuristic,
+    the algorithm returns an optimal solution.
+
+    Parameters
+    ----------
+    problem : Problem
+        Problem, which the algorithm searches.
+    heuristic : Callable[[Node], float]
+        Function estimating the cost of the cheapest path from a node to a goal.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    return best_first_search(problem, lambda n: n.path_cost + heuristic(n))
+
+
+def iterative_deepening_astar_search(problem: Problem, heuristic: Heuristic) -> Node:
+    """Iterative-deepening A* search implementation. (IDA*)
+
+    Runs a series of depth-first searches, each bounded by a threshold on the f-cost (path cost plus heuristic)
+    of nodes instead of their depth. The first threshold is the f-cost of the root, every following one is
+    the smallest f-cost which exceeded the previous threshold, so no solution cheaper than the returned one exists.
+
+    Memory is linear in the depth of the solution, cycles are avoided by keeping the states on the current path
+    in a set.
+
+    Parameters
+    ----------
+    problem : Problem
+        Problem, which the algorithm searches.
+    heuristic : Callable[[Node], float]
+        Admissible function estimating the cost of the cheapest path from a node to a goal.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    root = Node(state=problem.initial_state)
+    bound = root.path_cost + heuristic(root)
+
+    while True:
+        node, bound = _cost_limited_search(problem, heuristic, root, bound)
+
+        if node is not failure or bound == math.inf:
+            return node
+
+
+def recursive_best_first_search(problem: Problem, heuristic: Heuristic) -> Node:
+    """Recursive best-first search implementation. (RBFS)
+
+    Mimics best-first search in linear space. It follows the best successor of a node as long as its f-cost
+    stays below that of the best alternative path, when it does not, the recursion unwinds and the f-cost of
+    the abandoned subtree is backed up to its root, so it can be revisited later if it becomes the best again.
+
+    Parameters
+    ----------
+    problem : Problem
+        Problem, which the algorithm searches.
+    heuristic : Callable[[Node], float]
+        Admissible function estimating the cost of the cheapest path from a node to a goal.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    root = Node(state=problem.initial_state)
+
+    return _recursive_best_first_search(problem, heuristic, root, root.path_cost + heuristic(root),
+                                        math.inf, {root.state})[0]
+
+
+def simplified_memory_bounded_astar_search(problem: Problem, heuristic: Heuristic, max_nodes: int) -> Node:
+    """Simplified memory-bounded A* search implementation. (SMA*)
+
+    Proceeds like A*, generating the best successor (the one with the lowest f-cost, amongst those of the deepest
+    nodes) one at a time, until the number of nodes in memory exceeds the ceiling. Then it drops the worst leaf
+    (the shallowest one amongst those with the highest f-cost), other than the successor it has just generated,
+    and backs its f-cost up to its parent, which remembers the cost of its best forgotten subtree and regenerates
+    it only when everything else looks worse. Every node also remembers the f-costs of its successors which are
+    not in memory, the ones it has not generated yet included.
+
+    The algorithm is complete and optimal as long as the ceiling is large enough to hold the path to
+    the shallowest optimal solution. Nodes which could not fit a path to a goal get an f-cost of math.inf.
+
+    Parameters
+    ----------
+    problem : Problem
+        Problem, which the algorithm searches.
+    heuristic : Callable[[Node], float]
+        Admissible function estimating the cost of the cheapest path from a node to a goal.
+    max_nodes : int
+        The maximum number of nodes kept in memory.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    return _SMAStar(problem, heuristic, max_nodes).search()
+
+
+def beam_search(problem: Problem, evaluation_function: EvaluationFunction, beam_width: int) -> Node:
+    """Beam search implementation.
+
+    Best-first search which proceeds a layer at a time and keeps only the beam_width best nodes of every layer
+    (according to the evaluation function), in a BoundedPriorityQueue, so memory and time per layer are bounded
+    by the width of the beam. The width trades the quality of the solution for speed: with a width of 1,
+    the search is a greedy descent, as the width grows, it approaches breadth-first search.
+
+    Nodes on a cycle are dropped, as are the worse nodes of a state reached more than once in a layer, before they
+    compete for the beam, so duplicates never take the place of other states. The search terminates on finite state
+    spaces, but it is neither complete nor optimal.
+
+    Parameters
+    ----------
+    problem : Problem
+        Problem, which the algorithm searches.
+    evaluation_function : Callable[[Node], float]
+        Function ranking the nodes of a layer, such as a heuristic (greedy) or the path cost plus a heuristic (A*).
+    beam_width : int
+        The maximum number of nodes kept in every layer.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    beam = [Node(state=problem.initial_state)]
+
+    while beam:
+        for node in beam:
+            if problem.is_goal(node.state):
+                return node
+
+        best = {}
+        for node in beam:
+            ancestors = set(node.get_path())
+            ancestors.add(node.state)
+
+            for c in node.expand(problem):
+                if c.state not in ancestors:
+                    f = evaluation_function(c)
+                    if c.state not in best or f < best[c.state][0]:
+                        best[c.state] = (f, c)
+
+        frontier = BoundedPriorityQueue(beam_width, evaluation_function)
+        for _, c in best.values():
+            frontier.add(c)
+
+        beam = [c for _, c in frontier.pop_all()]
+
+    return failure
+
+
+def _cost_limited_search(problem: Problem, heuristic: Heuristic, root: Node, bound: float) -> tuple[Node, float]:
+    f = root.path_cost + heuristic(root)
+    if f > bound:
+        return failure, f
+    if problem.is_goal(root.state):
+        return root, bound
+
+    next_bound = math.inf
+    path_states = {root.state}
+    path = [root]
+    stack = [iter(root.expand(problem))]
+
+    while stack:
+        child = next(stack[-1], None)
+
+        if child is None:
+            stack.pop()
+            path_states.discard(path.pop().state)
+            continue
+        if child.state in path_states:
+            continue
+
+        f = child.path_cost + heuristic(child)
+        if f > bound:
+            next_bound = min(next_bound, f)
+            continue
+        if problem.is_goal(child.state):
+            return child, bound
+
+        path.append(child)
+        path_states.add(child.state)
+        stack.append(iter(child.expand(problem)))
+
+    return failure, next_bound
+
+
+def _recursive_best_first_search(problem: Problem,
+                                  heuristic: Heuristic,
+                                  node: Node,
+                                  f: float,
+                                  f_limit: float,
+                                  path_states: set) -> tuple[Node, float]:
+    if problem.is_goal(node.state):
+        return node, f
+
+    successors = [[max(c.path_cost + heuristic(c), f), c] for c in node.expand(problem)
+                  if c.state not in path_states]
+    if not successors:
+        return failure, math.inf
+
+    while True:
+        successors.sort(key=lambda s: s[0])
+        best = successors[0]
+
+        if best[0] > f_limit or best[0] == math.inf:
+            return failure, best[0]
+
+        alternative = successors[1][0] if len(successors) > 1 else math.inf
+
+        path_states.add(best[1].state)
+        result, best[0] = _recursive_best_first_search(problem, heuristic, best[1], best[0],
+                                                       min(f_limit, alternative), path_states)
+        path_states.discard(best[1].state)
+
+        if result is not failure:
+            return result, best[0]
+
+
+class _SMAStarEntry:
+    def __init__(self, node: Node, f: float, parent: Optional[_SMAStarEntry]) -> None:
+        self.node = node
+        self.f = f
+        self.parent = parent
+        self.children = {}
+        self.forgotten = None
+        self.version = 0
+
+    def get_states(self) -> Iterator:
+        e = self
+        while e is not None:
+            yield e.node.state
+            e = e.parent
+
+    def get_open_key(self) -> Optional[float]:
+        if self.forgotten is None:
+            return self.f
+
+        return min(self.forgotten.values(), default=None)
+
+
+class _SMAStar:
+    def __init__(self, problem: Problem, heuristic: Heuristic, max_nodes: int) -> None:
+        self.problem = problem
+        self.heuristic = heuristic
+        self.max_nodes = max_nodes
+        self.open = []
+        self.leaves = []
+        self.entries = set()
+        self.counter = itertools.count()
+        self.root = None
+
+    def search(self) -> Node:
+        root = Node(state=self.problem.initial_state)
+        self.root = self.__add(root, root.path_cost + self.heuristic(root), None)
+
+        while True:
+            best = self.__pop(self.open)
+
+            if best is None or best.get_open_key() == math.inf:
+                return failure
+
+            if best.forgotten is None:
+                if self.problem.is_goal(best.node.state):
+                    return best.node
+                self.__open(best)
+            else:
+                self.__shrink(self.__regenerate(best))
+
+    def __open(self, entry: _SMAStarEntry) -> None:
+        states = set(entry.get_states())
+        entry.forgotten = {}
+
+        for c in entry.node.expand(self.problem):
+            if c.state not in states:
+                f = self.__evaluate(entry, c)
+                entry.forgotten[c.state] = min(f, entry.forgotten.get(c.state, math.inf))
+
+        self.__back_up(entry)
+
+    def __regenerate(self, entry: _SMAStarEntry) -> _SMAStarEntry:
+        state = min(entry.forgotten, key=entry.forgotten.get)
+        f = entry.forgotten.pop(state)
+        node = min((c for c in entry.node.expand(self.problem) if c.state == state), key=lambda c: c.path_cost)
+
+        child = entry.children[state] = self.__add(node, f, entry)
+        self.__back_up(entry)
+
+        return child
+
+    def __shrink(self, keep: _SMAStarEntry) -> None:
+        kept = False
+
+        while len(self.entries) > self.max_nodes:
+            worst = self.__pop(self.leaves)
+            if worst is None:
+                break
+
+            if worst is keep:
+                kept = True
+            else:
+                self.__forget(worst)
+
+        if kept:
+            self.__push(keep)
+
+    def __forget(self, entry: _SMAStarEntry) -> None:
+        parent = entry.parent
+
+        del parent.children[entry.node.state]
+        parent.forgotten[entry.node.state] = entry.f
+        self.entries.remove(entry)
+        entry.version += 1
+
+        self.__back_up(parent)
+
+    def __evaluate(self, parent: _SMAStarEntry, node: Node) -> float:
+        if node.depth >= self.max_nodes or (node.depth == self.max_nodes - 1 and not self.problem.is_goal(node.state)):
+            return math.inf
+
+        return max(parent.f, node.path_cost + self.heuristic(node))
+
+    def __back_up(self, entry: _SMAStarEntry) -> None:
+        self.__push(entry)
+
+        while entry.forgotten is not None:
+            f = min(min([c.f for c in entry.children.values()], default=math.inf),
+                    min(entry.forgotten.values(), default=math.inf))
+
+            if f == entry.f:
+                return
+
+            entry.f = f
+            self.__push(entry)
+
+            if entry.parent is None:
+                return
+            entry = entry.parent
+
+    def __add(self, node: Node, f: float, parent: Optional[_SMAStarEntry]) -> _SMAStarEntry:
+        entry = _SMAStarEntry(node, f, parent)
+        self.entries.add(entry)
+        self.__push(entry)
+
+        return entry
+
+    def __push(self, entry: _SMAStarEntry) -> None:
+        entry.version += 1
+        self.__push_items(entry, next(self.counter))
+
+        if len(self.open) + len(self.leaves) > 4 * len(self.entries) + 64:
+            self.__compact()
+
+    def __push_items(self, entry: _SMAStarEntry, c: int) -> None:
+        key = entry.get_open_key()
+
+        if key is not None:
+            heapq.heappush(self.open, (key, -entry.node.depth, c, entry.version, entry))
+        if not entry.children and entry is not self.root:
+            heapq.heappush(self.leaves, (-entry.f, entry.node.depth, c, entry.version, entry))
+
+    def __compact(self) -> None:
+        self.open, self.leaves = [], []
+
+        for entry in self.entries:
+            self.__push_items(entry, next(self.counter))
+
+    def __pop(self, entries: list) -> Optional[_SMAStarEntry]:
+        while entries:
+            *_, version, entry = heapq.heappop(entries)
+
+            if version == entry.version and entry in self.entries:
+                entry.version += 1
+                return entry
+
+        return None
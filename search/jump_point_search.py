@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from array import array
+from typing import Optional
+
+from problem.implicit import SQRT_2, Cell, GridProblem
+from problem.node import Node, failure
+
+Direction = tuple[int, int]
+
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+class JumpTable:
+    """Precomputed jump distances of a grid (JPS+).
+
+    For every cell and each of the 8 directions, stores how far a jump from the cell goes: a positive distance d
+    means the jump ends in a jump point d steps away, a distance -d (or 0) means the jump finds no jump point and
+    runs into an obstacle (or the border of the grid) after d steps. The table does not depend on the initial
+    and goal cells, so it is computed once per grid, in time linear in its number of cells.
+
+    Parameters
+    ----------
+    problem : GridProblem
+        The grid problem, whose obstacles the table is computed for.
+    """
+
+    def __init__(self, problem: GridProblem) -> None:
+        self.width = problem.width
+        self.height = problem.height
+        self.__distances = {}
+
+        for d in DIRECTIONS:
+            self.__compute(problem, d)
+
+    def get_distance(self, x: int, y: int, direction: Direction) -> int:
+        """Returns the jump distance from a cell, in a direction.
+
+        Parameters
+        ----------
+        x : int
+            Column of the cell.
+        y : int
+            Row of the cell.
+        direction : tuple[int, int]
+            The (dx, dy) direction.
+
+        Returns
+        -------
+        int
+            Positive distance to a jump point, or the negated distance to an obstacle.
+        """
+        return self.__distances[direction][y * self.width + x]
+
+    def __compute(self, problem: GridProblem, direction: Direction) -> None:
+        dx, dy = direction
+        width, height = self.width, self.height
+        distances = self.__distances[direction] = array("i", bytes(4 * width * height))
+
+        xs = range(width - 1, -1, -1) if dx > 0 else range(width)
+        ys = range(height - 1, -1, -1) if dy > 0 else range(height)
+
+        for y in ys:
+            for x in xs:
+                if not problem.is_free(x, y) or not _can_move(problem, x, y, dx, dy):
+                    continue
+
+                nx, ny = x + dx, y + dy
+                if dx and dy:
+                    is_jump_point = self.get_distance(nx, ny, (dx, 0)) > 0 or self.get_distance(nx, ny, (0, dy)) > 0
+                else:
+                    is_jump_point = _has_forced_neighbour(problem, nx, ny, dx, dy)
+
+                if is_jump_point:
+                    distances[y * width + x] = 1
+                else:
+                    d = distances[ny * width + nx]
+                    distances[y * width + x] = d + 1 if d > 0 else d - 1
+
+
+def jump_point_search(problem: GridProblem, table: Optional[JumpTable] = None) -> Node:
+    """Jump point search implementation. (JPS)
+
+    A* for 8-connected grids with uniform costs, which prunes symmetric paths: from every node, the search only
+    follows the directions a shortest path could take (given the direction it arrived from) and, instead of
+    generating every cell on the way, jumps straight ahead until it reaches a jump point, a cell where
+    the shortest paths can turn because of an obstacle, or a goal. Only jump points are put in the open list.
+
+    Corners of obstacles are never cut, like in GridProblem, the jumping rules are those of the variant which
+    moves diagonally only if there are no obstacles. With a JumpTable (JPS+), the jumps are looked up instead of
+    being scanned cell by cell.
+
+    The returned solution node contains every cell of the path, like the one returned by astar_search,
+    its actions are (next state, cost) tuples and its path cost is the sum of the costs of its moves.
+
+    Parameters
+    ----------
+    problem : GridProblem
+        An 8-connected grid problem.
+    table : JumpTable
+        Optional precomputed jump distances of the problem's grid.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+
+    Raises
+    ------
+    ValueError
+        If the grid is not 8-connected.
+    """
+    if not problem.diagonal:
+        raise ValueError("jump point search requires an 8-connected grid")
+
+    goals = {problem.get_cell(s) for s in problem.goal_states}
+    start = problem.get_cell(problem.initial_state)
+
+    if start in goals:
+        return Node(state=problem.initial_state)
+
+    def h(c: Cell) -> float:
+        return min((_octile(abs(c[0] - gx), abs(c[1] - gy)) for gx, gy in goals), default=math.inf)
+
+    counter = itertools.count()
+    frontier = [(h(start), next(counter), start, None)]
+    g = {start: 0}
+    parents = {start: None}
+    closed = set()
+
+    while frontier:
+        _, _, c, direction = heapq.heappop(frontier)
+
+        if c in closed:
+            continue
+        closed.add(c)
+
+        if c in goals:
+            return _build_path(problem, parents, c)
+
+        for d in _get_directions(direction):
+            j = _jump(problem, goals, c, d) if table is None else _look_up(table, goals, c, d)
+            if j is None:
+                continue
+
+            steps = max(abs(j[0] - c[0]), abs(j[1] - c[1]))
+            cost = g[c] + (steps * SQRT_2 if d[0] and d[1] else steps)
+
+            if j not in g or cost < g[j]:
+                g[j] = cost
+                parents[j] = c
+                heapq.heappush(frontier, (cost + h(j), next(counter), j, d))
+
+    return failure
+
+
+def _get_directions(direction: Optional[Direction]) -> list[Direction]:
+    if direction is None:
+        return DIRECTIONS
+
+    dx, dy = direction
+    if dx and dy:
+        return [(dx, 0), (0, dy), (dx, dy)]
+    if dx:
+        return [(dx, 0), (dx, 1), (dx, -1), (0, 1), (0, -1)]
+
+    return [(0, dy), (1, dy), (-1, dy), (1, 0), (-1, 0)]
+
+
+def _jump(problem: GridProblem, goals: set[Cell], c: Cell, direction: Direction) -> Optional[Cell]:
+    (x, y), (dx, dy) = c, direction
+
+    while _can_move(problem, x, y, dx, dy):
+        x, y = x + dx, y + dy
+
+        if (x, y) in goals:
+            return x, y
+        if dx and dy:
+            if _jump(problem, goals, (x, y), (dx, 0)) or _jump(problem, goals, (x, y), (0, dy)):
+                return x, y
+        elif _has_forced_neighbour(problem, x, y, dx, dy):
+            return x, y
+
+    return None
+
+
+def _look_up(table: JumpTable, goals: set[Cell], c: Cell, direction: Direction) -> Optional[Cell]:
+    (x, y), (dx, dy) = c, direction
+    distance = table.get_distance(x, y, direction)
+    steps = abs(distance)
+
+    best = distance if distance > 0 else math.inf
+    for gx, gy in goals:
+        ox, oy = gx - x, gy - y
+
+        if dx and dy:
+            if ox * dx > 0 and oy * dy > 0:
+                k = min(ox * dx, oy * dy)
+                if k <= steps:
+                    best = min(best, k)
+        elif (ox * dx > 0 and oy == 0) or (oy * dy > 0 and ox == 0):
+            k = abs(ox) + abs(oy)
+            if k <= steps:
+                best = min(best, k)
+
+    return None if best == math.inf else (x + best * dx, y + best * dy)
+
+
+def _can_move(problem: GridProblem, x: int, y: int, dx: int, dy: int) -> bool:
+    return problem.is_free(x + dx, y + dy) and problem.is_free(x + dx, y) and problem.is_free(x, y + dy)
+
+
+def _has_forced_neighbour(problem: GridProblem, x: int, y: int, dx: int, dy: int) -> bool:
+    free = problem.is_free
+
+    if dx:
+        return (free(x, y - 1) and not free(x - dx, y - 1)) or (free(x, y + 1) and not free(x - dx, y + 1))
+
+    return (free(x - 1, y) and not free(x - 1, y - dy)) or (free(x + 1, y) and not free(x + 1, y - dy))
+
+
+def _build_path(problem: GridProblem, parents: dict[Cell, Optional[Cell]], goal: Cell) -> Node:
+    jump_points = []
+    c = goal
+    while c is not None:
+        jump_points.append(c)
+        c = parents[c]
+    jump_points.reverse()
+
+    node = Node(state=problem.get_state(*jump_points[0]))
+    for (x, y), (tx, ty) in zip(jump_points, jump_points[1:]):
+        dx, dy = (tx > x) - (tx < x), (ty > y) - (ty < y)
+        cost = SQRT_2 if dx and dy else 1
+
+        while (x, y) != (tx, ty):
+            x, y = x + dx, y + dy
+            s = problem.get_state(x, y)
+            node = Node(state=s, parent=node, action=(s, cost), path_cost=node.path_cost + cost)
+
+    return node
+
+
+def _octile(dx: int, dy: int) -> float:
+    return max(dx, dy) + (SQRT_2 - 1) * min(dx, dy)
@@ -0,0 +1,148 @@
+import heapq
+import itertools
+import math
+from collections import defaultdict
+from typing import Any, Iterator, Optional
+
+from problem.node import Node, failure
+from problem.problem import GraphProblem, Problem
+
+
+def k_shortest_paths(problem: Problem, k: Optional[int] = None) -> Iterator[Node]:
+    """Yen's k-shortest loopless paths algorithm.
+
+    Lazily generates the paths from the initial state to the goal states, cheapest first. Every new path is
+    found by deviating from the previous one: for each of its vertices (the spur vertices), the path up to that
+    vertex is kept as the root and a spur path to a goal is searched for, which avoids the vertices of the root
+    and the edges used by already generated paths with the same root. The cheapest of all the candidates found
+    so far is the next path. Following Lawler, only the vertices from the point where the previous path deviated
+    from its own parent are used as spur vertices, since the earlier ones cannot produce new candidates.
+
+    Spur paths are found with A*, guided by the exact distances to the goals in the unrestricted graph. For a
+    GraphProblem these distances are computed once, by running Dijkstra's algorithm backwards from the goals,
+    this shortest-path tree is then reused by every spur search. Other problems are searched without a heuristic.
+
+    Edges without a cost (math.inf) cost nothing, as in Node.expand.
+
+    Parameters
+    ----------
+    problem : Problem
+        Problem, which the algorithm searches.
+    k : int
+        The maximum number of paths to generate, all of them by default.
+
+    Yields
+    -------
+    Node
+        Solution nodes, in the order of their path costs.
+    """
+    if k is not None and k < 1:
+        return
+
+    distances = _get_goal_distances(problem) if isinstance(problem, GraphProblem) else None
+
+    node = _spur_search(problem, Node(state=problem.initial_state), set(), set(), distances)
+    deviation = 0
+    branches = defaultdict(set)
+    seen = set()
+    candidates = []
+    counter = itertools.count()
+    generated = 0
+
+    while node is not failure:
+        yield node
+
+        generated += 1
+        if generated == k:
+            return
+
+        nodes = _get_nodes(node)
+        states = tuple(n.state for n in nodes)
+        seen.add(states)
+        for i in range(len(states) - 1):
+            branches[states[:i + 1]].add(states[i + 1])
+
+        for i in range(deviation, len(nodes) - 1):
+            root = states[:i + 1]
+            banned_edges = {(states[i], s) for s in branches[root]}
+
+            candidate = _spur_search(problem, nodes[i], set(root[:-1]), banned_edges, distances)
+            if candidate is failure:
+                continue
+
+            candidate_states = tuple(_get_states(candidate))
+            if candidate_states not in seen:
+                seen.add(candidate_states)
+                heapq.heappush(candidates, (candidate.path_cost, next(counter), candidate, i))
+
+        node, deviation = heapq.heappop(candidates)[2:] if candidates else (failure, 0)
+
+
+def _spur_search(problem: Problem,
+                 spur: Node,
+                 banned_states: set,
+                 banned_edges: set,
+                 distances: Optional[dict]) -> Node:
+    def h(n: Node) -> float:
+        return 0 if distances is None else distances.get(n.state, math.inf)
+
+    if h(spur) == math.inf:
+        return failure
+
+    counter = itertools.count()
+    frontier = [(spur.path_cost + h(spur), -spur.path_cost, next(counter), spur)]
+    reached = {spur.state: spur.path_cost}
+
+    while frontier:
+        *_, n = heapq.heappop(frontier)
+
+        if problem.is_goal(n.state):
+            return n
+        for c in n.expand(problem):
+            if c.state in banned_states or (n.state, c.state) in banned_edges:
+                continue
+
+            f = c.path_cost + h(c)
+            if f < math.inf and (c.state not in reached or c.path_cost < reached[c.state]):
+                reached[c.state] = c.path_cost
+                heapq.heappush(frontier, (f, -c.path_cost, next(counter), c))
+
+    return failure
+
+
+def _get_goal_distances(problem: GraphProblem) -> dict[Any, float]:
+    predecessors = defaultdict(list)
+    for v in problem.graph.get_vertices():
+        for t, cost in problem.graph.get_edges(v):
+            predecessors[t].append((v, 0 if cost == math.inf else cost))
+
+    distances = {}
+    counter = itertools.count()
+    frontier = [(0, next(counter), g) for g in problem.goal_states]
+
+    while frontier:
+        d, _, v = heapq.heappop(frontier)
+
+        if v in distances:
+            continue
+        distances[v] = d
+
+        for p, cost in predecessors[v]:
+            if p not in distances:
+                heapq.heappush(frontier, (d + cost, next(counter), p))
+
+    return distances
+
+
+def _get_nodes(node: Node) -> list[Node]:
+    nodes = []
+
+    while node:
+        nodes.append(node)
+        node = node.parent
+
+    return nodes[::-1]
+
+
+def _get_states(node: Node) -> list[Any]:
+    return [n.state for n in _get_nodes(node)]
@@ -0,0 +1,441 @@
+import math
+import multiprocessing
+import pickle
+import struct
+import zlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
+
+from datastructures import CompactGraph, FrozenGraph, Graph
+from problem.node import Node, failure
+from problem.problem import GraphProblem, Problem
+from search.helpers import path_cost_evaluation_function
+from search.uninformed_search import EvaluationFunction, best_first_search, uniform_cost_search
+
+Query = tuple[Any, set]
+PathRecords = list[tuple[Any, Any, float]]
+PartitionFunction = Callable[[Any, int], int]
+SearchAlgorithm = Callable[[Problem], Node]
+
+_HEADER = struct.Struct("qqq")
+_LENGTH = struct.Struct(">I")
+
+_worker_graph = None
+_worker_memory = None
+_worker_evaluation_function = None
+
+
+def share_graph(graph: CompactGraph) -> SharedMemory:
+    """Copies a compact graph into a newly created block of shared memory.
+
+    The block starts with a header holding the number of vertices, edges and the size of the pickled vertices,
+    it is followed by the offsets, targets and costs arrays and ends with the pickled vertices.
+    The caller owns the block and is responsible for closing and unlinking it.
+
+    Parameters
+    ----------
+    graph : CompactGraph
+        Graph which is going to be shared.
+
+    Returns
+    -------
+    SharedMemory
+        Block of shared memory holding the graph.
+    """
+    vertices, offsets, targets, costs = graph.get_arrays()
+    labels = pickle.dumps(list(vertices), pickle.HIGHEST_PROTOCOL)
+
+    arrays = [array("q", offsets).tobytes(), array("q", targets).tobytes(), array("d", costs).tobytes()]
+    size = _HEADER.size + sum(len(a) for a in arrays) + len(labels)
+
+    memory = SharedMemory(create=True, size=size)
+    _HEADER.pack_into(memory.buf, 0, len(vertices), len(targets), len(labels))
+
+    position = _HEADER.size
+    for data in arrays + [labels]:
+        memory.buf[position:position + len(data)] = data
+        position += len(data)
+
+    return memory
+
+
+def attach_graph(memory: SharedMemory) -> CompactGraph:
+    """Creates a compact graph backed by a block of shared memory created by share_graph.
+
+    Only the vertices are copied, the arrays are memory views over the shared block,
+    so the block must stay open for as long as the returned graph is used.
+
+    Parameters
+    ----------
+    memory : SharedMemory
+        Block of shared memory holding a graph.
+
+    Returns
+    -------
+    CompactGraph
+        Graph backed by the shared memory.
+    """
+    n_vertices, n_edges, n_labels = _HEADER.unpack_from(memory.buf, 0)
+
+    position = _HEADER.size
+    sections = []
+    for length, code in ((n_vertices + 1, "q"), (n_edges, "q"), (n_edges, "d")):
+        sections.append(memory.buf[position:position + 8 * length].cast(code))
+        position += 8 * length
+
+    vertices = pickle.loads(memory.buf[position:position + n_labels])
+
+    return CompactGraph(vertices, *sections)
+
+
+def batch_best_first_search(graph: Graph,
+                            queries: Sequence[Query],
+                            evaluation_function: EvaluationFunction = path_cost_evaluation_function,
+                            workers: Optional[int] = None,
+                            chunksize: Optional[int] = None) -> Iterator[Node]:
+    """Runs best-first search for a batch of queries on a pool of worker processes.
+
+    The graph is converted to its compact form and placed in shared memory once, every worker attaches to it
+    when it starts, so tasks only carry their (initial state, goal states) pair.
+    Solutions travel back as flat lists of path records and are rebuilt into nodes, in the order of the queries.
+
+    The evaluation function has to be picklable, i.e. defined at the top level of a module.
+
+    Parameters
+    ----------
+    graph : Graph
+        Graph which all queries are searched on.
+    queries : Sequence[tuple[Any, set]]
+        Pairs of an initial state and a set of goal states.
+    evaluation_function : Callable[[Node], float]
+        Function calculating the cost of each node, uniform-cost search by default.
+    workers : int
+        Number of worker processes, the number of CPUs by default.
+    chunksize : int
+        Number of queries sent to a worker at once, by default the queries are split in four chunks per worker.
+
+    Yields
+    -------
+    Node
+        Solution node or failure, one per query, in the order of the queries.
+    """
+    compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_graph(graph)
+    workers = workers or multiprocessing.cpu_count()
+    chunksize = chunksize or max(1, math.ceil(len(queries) / (4 * workers)))
+
+    memory = share_graph(compact)
+    try:
+        with multiprocessing.Pool(workers,
+                                  initializer=_initialise_worker,
+                                  initargs=(memory.name, evaluation_function)) as pool:
+            for records in pool.imap(_search, queries, chunksize):
+                yield _rebuild_path(records)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def threaded_batch_search(graph: Union[Graph, CompactGraph, FrozenGraph],
+                          queries: Sequence[Query],
+                          algorithm: SearchAlgorithm = uniform_cost_search,
+                          workers: Optional[int] = None) -> Iterator[Node]:
+    """Runs a search algorithm for a batch of queries on a pool of threads, sharing a single graph.
+
+    The graph is frozen into a FrozenGraph once (unless it already is one), and every query is searched on its own
+    GraphProblem over it. The search functions of this package keep all their state (frontier, reached set,
+    nodes) in local variables, so they are re-entrant and the only state shared between the threads is the frozen
+    graph, which is only ever read, so no locks are taken. On free-threaded builds of Python the queries run
+    in parallel, on the others the threads take turns, since searches do not release the GIL.
+
+    Problems which keep mutable state, like CachingProblem, must not be shared between threads.
+
+    Parameters
+    ----------
+    graph : Union[Graph, CompactGraph, FrozenGraph]
+        Graph which all queries are searched on.
+    queries : Sequence[tuple[Any, set]]
+        Pairs of an initial state and a set of goal states.
+    algorithm : Callable[[Problem], Node]
+        Search algorithm, such as best_first_search with an evaluation function or breadth_first_search,
+        uniform-cost search by default.
+    workers : int
+        Number of threads, the default of ThreadPoolExecutor if not provided.
+
+    Yields
+    -------
+    Node
+        Solution node or failure, one per query, in the order of the queries.
+    """
+    frozen = graph if isinstance(graph, FrozenGraph) else FrozenGraph.from_graph(graph)
+
+    with ThreadPoolExecutor(workers) as executor:
+        yield from executor.map(lambda q: algorithm(GraphProblem(q[0], q[1], frozen)), queries)
+
+
+def stable_partition(state: Any, partitions: int) -> int:
+    """Assigns a state to one of the partitions of a parallel search.
+
+    Relies on a checksum of a canonical serialisation of the state instead of the built-in hash function,
+    because the latter is randomised per process for strings. Equal states have to be serialised to the same bytes,
+    so numbers which are equal to an integer, such as 1.0 and True, are serialised as that integer,
+    tuples and lists element by element, and sets and frozensets with their serialised elements sorted,
+    since their iteration (and pickling) order depends on the hash seed of the process.
+    Other states are pickled, so they have to pickle to the same bytes whenever they are equal.
+
+    Parameters
+    ----------
+    state : Any
+        A picklable state.
+    partitions : int
+        Number of partitions.
+
+    Returns
+    -------
+    int
+        Index of the partition which owns the state.
+    """
+    return zlib.crc32(_canonical_bytes(state)) % partitions
+
+
+def parallel_breadth_first_search(problem: Problem,
+                                  workers: Optional[int] = None,
+                                  partition_function: PartitionFunction = stable_partition) -> Node:
+    """Level-synchronous parallel breadth-first search implementation.
+
+    Every worker process owns the states the partition function assigns to it, along with their part of the
+    reached set, which maps each state to its parent state and the action reaching it. Each layer is expanded in
+    two steps: first all workers expand the states of the layer they own and send every child to the inbox of its
+    owner, then every owner drops the children it has already reached and keeps the rest as its part of the next
+    layer. The coordinating process only exchanges commands, counts and goals with the workers.
+
+    Like breadth_first_search, goals are tested as soon as a node is generated, so the solution is found at the
+    end of the layer in which the goal is first generated. The solution path is recovered by walking the parent
+    states back through their owners.
+
+    States are assigned to workers by partitioning their encodings, as returned by the encode_state method of the
+    problem, so problems with a compact encoding of their states are partitioned on it. The workers are always
+    started with the spawn start method, so they behave the same on every platform and no state of the
+    coordinating process, such as its hash seed, is relied on.
+
+    The problem and its states have to be picklable. An exception raised by a worker, e.g. by the problem,
+    is sent to the coordinating process and raised there, and a worker which dies raises EOFError,
+    in both cases the remaining workers are terminated.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem which this implementation searches.
+    workers : int
+        Number of worker processes, the number of CPUs by default.
+    partition_function : Callable[[Any, int], int]
+        Function assigning an encoded state to a worker, it has to return the same worker for equal encodings
+        in every process, and it has to be picklable, i.e. defined at the top level of a module.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    node = Node(state=problem.initial_state)
+
+    if problem.is_goal(node.state):
+        return node
+
+    workers = workers or multiprocessing.cpu_count()
+    context = multiprocessing.get_context("spawn")
+    inboxes = [context.Queue() for _ in range(workers)]
+    connections, processes = [], []
+
+    for i in range(workers):
+        connection, worker_connection = context.Pipe()
+        process = context.Process(target=_breadth_first_worker,
+                                          args=(worker_connection, problem, i, inboxes, partition_function),
+                                          daemon=True)
+        process.start()
+        worker_connection.close()
+        connections.append(connection)
+        processes.append(process)
+
+    try:
+        connections[partition_function(problem.encode_state(node.state), workers)].send(("seed", node.state))
+
+        while True:
+            for c in connections:
+                c.send(("expand", None))
+            replies = _receive_all(connections)
+
+            goal = next((g for g, _ in replies if g is not None), None)
+            if goal is not None:
+                return _recover_path(goal, problem, connections, partition_function)
+            if not any(n for _, n in replies):
+                return failure
+    except BaseException:
+        for p in processes:
+            p.terminate()
+        raise
+    finally:
+        for c in connections:
+            try:
+                c.send(("stop", None))
+            except OSError:
+                pass
+            c.close()
+        for p in processes:
+            p.join()
+
+
+def _initialise_worker(name: str, evaluation_function: EvaluationFunction) -> None:
+    global _worker_graph, _worker_memory, _worker_evaluation_function
+
+    _worker_memory = SharedMemory(name=name)
+    _worker_graph = attach_graph(_worker_memory)
+    _worker_evaluation_function = evaluation_function
+
+
+def _search(query: Query) -> Optional[PathRecords]:
+    initial_state, goal_states = query
+
+    node = best_first_search(GraphProblem(initial_state, goal_states, _worker_graph), _worker_evaluation_function)
+
+    return None if node is failure else _flatten_path(node)
+
+
+def _flatten_path(node: Node) -> PathRecords:
+    records = []
+
+    while node:
+        records.append((node.state, node.action, node.path_cost))
+        node = node.parent
+
+    return records[::-1]
+
+
+def _rebuild_path(records: Optional[PathRecords]) -> Node:
+    if records is None:
+        return failure
+
+    node = None
+    for state, action, path_cost in records:
+        node = Node(state=state, parent=node, action=action, path_cost=path_cost)
+
+    return node
+
+
+def _breadth_first_worker(connection: Connection,
+                          problem: Problem,
+                          index: int,
+                          inboxes: list,
+                          partition_function: PartitionFunction) -> None:
+    try:
+        _run_breadth_first_worker(connection, problem, index, inboxes, partition_function)
+    except Exception as e:
+        connection.send(("error", e))
+
+
+def _run_breadth_first_worker(connection: Connection,
+                              problem: Problem,
+                              index: int,
+                              inboxes: list,
+                              partition_function: PartitionFunction) -> None:
+    workers = len(inboxes)
+    reached = {}
+    layer = []
+
+    while True:
+        command, argument = connection.recv()
+
+        if command == "seed":
+            reached[argument] = None
+            layer = [argument]
+        elif command == "parent":
+            connection.send(("result", reached[argument]))
+        elif command == "expand":
+            goal = None
+            buckets = [[] for _ in range(workers)]
+
+            for s in layer:
+                for c in Node(state=s).expand(problem):
+                    if goal is None and problem.is_goal(c.state):
+                        goal = (c.state, s, c.action)
+                    buckets[partition_function(problem.encode_state(c.state), workers)].append((c.state, s, c.action))
+
+            for i, b in enumerate(buckets):
+                inboxes[i].put(b)
+
+            layer = []
+            for _ in range(workers):
+                for state, parent, action in inboxes[index].get():
+                    if state not in reached:
+                        reached[state] = (parent, action)
+                        layer.append(state)
+
+            connection.send(("result", (goal, len(layer))))
+        else:
+            return
+
+
+def _receive(connection: Connection) -> Any:
+    kind, value = connection.recv()
+
+    if kind == "error":
+        raise value
+
+    return value
+
+
+def _receive_all(connections: list[Connection]) -> list[Any]:
+    # The workers are waited on in the order they reply, since a worker which failed leaves the others blocked.
+    replies = {}
+
+    while len(replies) < len(connections):
+        for c in wait([c for c in connections if c not in replies]):
+            replies[c] = _receive(c)
+
+    return [replies[c] for c in connections]
+
+
+def _recover_path(goal: tuple[Any, Any, Any],
+                  problem: Problem,
+                  connections: list[Connection],
+                  partition_function: PartitionFunction) -> Node:
+    # The reached entry of the initial state is None, any other entry is a (parent, action) pair,
+    # so states which are None themselves are told apart from the missing parent of the initial state.
+    state, parent, action = goal
+    steps = [(state, action)]
+
+    while True:
+        connection = connections[partition_function(problem.encode_state(parent), len(connections))]
+        connection.send(("parent", parent))
+        entry = _receive(connection)
+
+        if entry is None:
+            steps.append((parent, None))
+            break
+
+        steps.append((parent, entry[1]))
+        parent = entry[0]
+
+    steps.reverse()
+    node = Node(state=steps[0][0])
+    for state, action in steps[1:]:
+        cost = node.path_cost if action[1] == math.inf else node.path_cost + action[1]
+        node = Node(state=state, parent=node, action=action, path_cost=cost)
+
+    return node
+
+
+def _canonical_bytes(value: Any) -> bytes:
+    if isinstance(value, bool) or (isinstance(value, float) and value.is_integer()):
+        value = int(value)
+
+    if isinstance(value, (tuple, list)):
+        tag, parts = b"t", [_canonical_bytes(v) for v in value]
+    elif isinstance(value, (set, frozenset)):
+        tag, parts = b"s", sorted(_canonical_bytes(v) for v in value)
+    else:
+        return pickle.dumps(value, 4)
+
+    return tag + b"".join(_LENGTH.pack(len(p)) + p for p in parts)
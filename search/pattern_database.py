@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from typing import Any, Sequence, Union
+
+from problem.implicit import SlidingPuzzleProblem, unpack_tiles
+from problem.node import Node
+from problem.problem import Problem
+from search.helpers import path_cost_evaluation_function
+from search.informed_search import Heuristic
+from search.reached import ReachedSet
+from search.uninformed_search import best_first_search
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"AIAMPDB\0"
+_HEADER = struct.Struct(">8sHBBB")
+_UNREACHED = 255
+
+
+class PatternDatabase:
+    """Pattern database heuristic for sliding-tile puzzles.
+
+    A pattern is a subset of the tiles, the abstraction of a puzzle state keeps only the positions of
+    the pattern's tiles and of the blank. The database stores, for every placement of the pattern's tiles,
+    the least number of moves of those tiles needed to bring them to their goal positions, taken over all
+    positions of the blank. Since only the moves of the pattern's tiles are counted, the distances of
+    databases built for disjoint patterns can be added and the sum is still admissible.
+
+    Placements are indexed by a perfect hash, the rank of the partial permutation of positions they form, and
+    distances are stored one per byte, or two per byte (as nibbles) when none exceeds 15. Databases can be saved
+    to a file and loaded by memory-mapping it, so large ones are shared between processes and paged in on demand.
+
+    Parameters
+    ----------
+    size : int
+        Width of the puzzle.
+    pattern : Sequence[int]
+        The tiles of the pattern.
+    data : Union[bytes, bytearray, mmap.mmap, memoryview]
+        The stored distances.
+    nibbles : bool
+        Whether the distances are stored as nibbles.
+    """
+
+    def __init__(self, size: int, pattern: Sequence[int], data: Union[bytes, bytearray, mmap.mmap, memoryview],
+                 nibbles: bool) -> None:
+        self.size = size
+        self.pattern = tuple(pattern)
+        self.__data = data
+        self.__nibbles = nibbles
+
+    @classmethod
+    def build(cls, problem: SlidingPuzzleProblem, pattern: Sequence[int]) -> PatternDatabase:
+        """Builds the pattern database of a puzzle.
+
+        Runs a uniform-cost search (best_first_search), from the abstraction of the goal state, over the whole
+        abstract state space, in which moving a tile of the pattern costs 1 and moving any other tile costs nothing.
+        Since moves are reversible, the path costs it finds are the distances to the goal. They are recorded
+        straight into a byte array, by the reached set of the search.
+
+        Parameters
+        ----------
+        problem : SlidingPuzzleProblem
+            The puzzle, whose (single) goal state the distances are computed to.
+        pattern : Sequence[int]
+            The tiles of the pattern.
+
+        Returns
+        -------
+        PatternDatabase
+            The pattern database.
+        """
+        n = problem.size * problem.size
+        pattern = tuple(pattern)
+        tiles = unpack_tiles(next(iter(problem.goal_states)), problem.size)
+        goal = tuple(tiles.index(t) for t in pattern) + (tiles.index(0),)
+
+        reached = _AbstractReachedSet(n, len(pattern))
+        best_first_search(_AbstractPuzzleProblem(problem.size, goal), path_cost_evaluation_function, reached)
+
+        distances = reached.get_distances()
+        if max(distances) < 16:
+            data = bytearray((len(distances) + 1) // 2)
+            for i, d in enumerate(distances):
+                data[i >> 1] |= d << (4 * (i & 1))
+            return cls(problem.size, pattern, data, True)
+
+        return cls(problem.size, pattern, distances, False)
+
+    @classmethod
+    def load(cls, path: str) -> PatternDatabase:
+        """Loads a pattern database saved with save, by memory-mapping its file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+
+        Returns
+        -------
+        PatternDatabase
+            The pattern database.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a pattern database or it has an unsupported version.
+        """
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, nibbles, size, k = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} pattern database")
+
+        pattern = data[_HEADER.size:_HEADER.size + k]
+
+        return cls(size, pattern, memoryview(data)[_HEADER.size + k:], bool(nibbles))
+
+    def save(self, path: str) -> None:
+        """Saves this pattern database to a file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+        """
+        with open(path + ".tmp", "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, FORMAT_VERSION, self.__nibbles, self.size, len(self.pattern)))
+            f.write(bytes(self.pattern))
+            f.write(self.__data)
+
+        os.replace(path + ".tmp", path)
+
+    def get_distance(self, state: int) -> int:
+        """Returns the distance stored for a (packed) puzzle state.
+
+        Parameters
+        ----------
+        state : int
+            State of the puzzle.
+
+        Returns
+        -------
+        int
+            The number of moves of the pattern's tiles needed to reach the goal.
+        """
+        n = self.size * self.size
+        positions = [0] * 16
+
+        for p in range(n):
+            positions[(state >> (4 * p)) & 0xF] = p
+
+        i = _rank([positions[t] for t in self.pattern], n)
+
+        if self.__nibbles:
+            return (self.__data[i >> 1] >> (4 * (i & 1))) & 0xF
+
+        return self.__data[i]
+
+
+def additive_heuristic(*databases: PatternDatabase) -> Heuristic:
+    """Combines pattern databases built for disjoint patterns into a single admissible heuristic.
+
+    Parameters
+    ----------
+    databases : PatternDatabase
+        Pattern databases of disjoint patterns.
+
+    Returns
+    -------
+    Callable[[Node], float]
+        Heuristic summing the distances stored in the databases.
+    """
+    def heuristic(node: Node) -> float:
+        return sum(d.get_distance(node.state) for d in databases)
+
+    return heuristic
+
+
+class _AbstractPuzzleProblem(Problem):
+    def __init__(self, size: int, goal: tuple[int, ...]) -> None:
+        super().__init__(initial_state=goal, goal_states=set())
+        self.__neighbours = [[q for q, valid in ((p - size, p >= size), (p + size, p < size * size - size),
+                                                 (p - 1, p % size > 0), (p + 1, p % size < size - 1)) if valid]
+                             for p in range(size * size)]
+
+    def get_actions(self, state):
+        blank = state[-1]
+        actions = []
+
+        for q in self.__neighbours[blank]:
+            try:
+                j = state.index(q, 0, len(state) - 1)
+            except ValueError:
+                actions.append((state[:-1] + (q,), 0))
+            else:
+                actions.append((state[:j] + (blank,) + state[j + 1:-1] + (q,), 1))
+
+        return actions
+
+    def apply_action(self, action):
+        return action[0]
+
+    def get_action_cost(self, action):
+        return action[1]
+
+
+class _AbstractReachedSet(ReachedSet):
+    def __init__(self, n: int, k: int) -> None:
+        self.__n = n
+        self.__k = k
+        self.__length = 0
+
+        size = 1
+        for i in range(k + 1):
+            size *= n - i
+        self.__costs = bytearray([_UNREACHED]) * size
+
+    def __contains__(self, state: Any) -> bool:
+        return self.__costs[_rank(state, self.__n)] != _UNREACHED
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def add(self, state: Any, path_cost: float = 0, parent: Any = None) -> None:
+        i = _rank(state, self.__n)
+
+        self.__length += self.__costs[i] == _UNREACHED
+        self.__costs[i] = int(path_cost)
+
+    def get_path_cost(self, state: Any) -> float:
+        return self.__costs[_rank(state, self.__n)]
+
+    def get_memory_usage(self) -> int:
+        return sys.getsizeof(self.__costs)
+
+    def get_distances(self) -> bytearray:
+        costs, blanks = self.__costs, self.__n - self.__k
+        distances = bytearray(min(costs[i:i + blanks]) for i in range(0, len(costs), blanks))
+
+        return distances.replace(bytes([_UNREACHED]), b"\0")
+
+
+def _rank(positions: Sequence[int], n: int) -> int:
+    rank = 0
+
+    for i, p in enumerate(positions):
+        rank = rank * (n - i) + p - sum(1 for q in positions[:i] if q < p)
+
+    return rank
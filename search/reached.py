@@ -0,0 +1,269 @@
+import hashlib
+import math
+import pickle
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any
+
+from problem.problem import Problem
+
+
+class ReachedSet(ABC):
+    """An abstract class acting as the base for the reached sets of search algorithms.
+
+    A reached set records the states a search has already generated, along with the path cost
+    of the best path found to each of them. Implementations trade precision for memory in different ways.
+    """
+
+    @abstractmethod
+    def __contains__(self, state: Any) -> bool:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def add(self, state: Any, path_cost: float = 0, parent: Any = None) -> None:
+        """Records a state as reached, or updates the path cost of an already reached one.
+
+        Parameters
+        ----------
+        state : Any
+            The reached state.
+        path_cost : float
+            Path cost, from the root, to the state.
+        parent : Any
+            The state from which the state was reached, None for the root.
+        """
+        pass
+
+    @abstractmethod
+    def get_path_cost(self, state: Any) -> float:
+        """Returns the path cost recorded for a reached state.
+
+        Parameters
+        ----------
+        state : Any
+            A reached state.
+
+        Returns
+        -------
+        float
+            Path cost of the best path found to the state.
+        """
+        pass
+
+    @abstractmethod
+    def get_memory_usage(self) -> int:
+        """Returns an estimate of the memory used by this reached set.
+
+        Returns
+        -------
+        int
+            Size in bytes.
+        """
+        pass
+
+
+class StateReachedSet(ReachedSet):
+    """Reached set keeping the states themselves, mapped to their path costs.
+
+    This is the default used by the search algorithms.
+    """
+
+    def __init__(self) -> None:
+        self.__path_costs = {}
+
+    def __contains__(self, state: Any) -> bool:
+        return state in self.__path_costs
+
+    def __len__(self) -> int:
+        return len(self.__path_costs)
+
+    def add(self, state: Any, path_cost: float = 0, parent: Any = None) -> None:
+        self.__path_costs[state] = path_cost
+
+    def get_path_cost(self, state: Any) -> float:
+        return self.__path_costs[state]
+
+    def get_memory_usage(self) -> int:
+        return _get_dict_size(self.__path_costs)
+
+
+class EncodedReachedSet(ReachedSet):
+    """Reached set keeping the compact encodings of states, as provided by Problem.encode_state.
+
+    Parameters
+    ----------
+    problem : Problem
+        Problem whose states are going to be recorded.
+    """
+
+    def __init__(self, problem: Problem) -> None:
+        self.__encode = problem.encode_state
+        self.__path_costs = {}
+
+    def __contains__(self, state: Any) -> bool:
+        return self.__encode(state) in self.__path_costs
+
+    def __len__(self) -> int:
+        return len(self.__path_costs)
+
+    def add(self, state: Any, path_cost: float = 0, parent: Any = None) -> None:
+        self.__path_costs[self.__encode(state)] = path_cost
+
+    def get_path_cost(self, state: Any) -> float:
+        return self.__path_costs[self.__encode(state)]
+
+    def get_memory_usage(self) -> int:
+        return _get_dict_size(self.__path_costs)
+
+
+class ParentIndexTable(ReachedSet):
+    """Reached set keeping only what is needed to recover paths.
+
+    Every reached state is numbered in the order it was first reached, its encoding, path cost and the number
+    of its parent are stored in flat arrays. This makes it possible to recover the path to any
+    reached state without keeping nodes around.
+
+    Parameters
+    ----------
+    problem : Problem
+        Problem whose states are going to be recorded, its encode_state and decode_state methods are used.
+    """
+
+    def __init__(self, problem: Problem) -> None:
+        self.__encode = problem.encode_state
+        self.__decode = problem.decode_state
+        self.__indices = {}
+        self.__codes = []
+        self.__path_costs = array("d")
+        self.__parents = array("q")
+
+    def __contains__(self, state: Any) -> bool:
+        return self.__encode(state) in self.__indices
+
+    def __len__(self) -> int:
+        return len(self.__codes)
+
+    def add(self, state: Any, path_cost: float = 0, parent: Any = None) -> None:
+        code = self.__encode(state)
+        parent_index = -1 if parent is None else self.__indices[self.__encode(parent)]
+
+        i = self.__indices.get(code)
+        if i is None:
+            self.__indices[code] = len(self.__codes)
+            self.__codes.append(code)
+            self.__path_costs.append(path_cost)
+            self.__parents.append(parent_index)
+        else:
+            self.__path_costs[i] = path_cost
+            self.__parents[i] = parent_index
+
+    def get_path_cost(self, state: Any) -> float:
+        return self.__path_costs[self.__indices[self.__encode(state)]]
+
+    def get_path(self, state: Any) -> list[Any]:
+        """Returns the path from a reached state to the root (omitting the state), like Node.get_path.
+
+        Parameters
+        ----------
+        state : Any
+            A reached state.
+
+        Returns
+        -------
+        list[Any]
+            The path from the state to the root.
+        """
+        path = []
+
+        i = self.__parents[self.__indices[self.__encode(state)]]
+        while i != -1:
+            path.append(self.__decode(self.__codes[i]))
+            i = self.__parents[i]
+
+        return path
+
+    def get_memory_usage(self) -> int:
+        return (_get_dict_size(self.__indices) + sys.getsizeof(self.__codes)
+                + sys.getsizeof(self.__path_costs) + sys.getsizeof(self.__parents))
+
+
+class BloomReachedSet(ReachedSet):
+    """Probabilistic reached set (bit-state hashing) backed by a Bloom filter.
+
+    Only a few bits are kept per state, so very large state spaces can be explored in a fixed amount of memory.
+    The price is that a state can be mistaken for a reached one, with a probability close to the error rate
+    while the number of states stays below the capacity. Such states are pruned, which means searches using
+    this reached set are not complete. Path costs are not kept, every reached state reports a path cost of
+    -math.inf, so a state is never reached twice.
+
+    Parameters
+    ----------
+    capacity : int
+        Expected number of reached states.
+    error_rate : float
+        Target probability of mistaking a state for a reached one.
+    problem : Problem
+        Optional problem whose encode_state method is used before hashing states.
+
+    Raises
+    ------
+    ValueError
+        If the capacity is not positive or the error rate is not between 0 and 1.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01, problem: Problem = None) -> None:
+        if capacity <= 0:
+            raise ValueError(f"The capacity has to be positive, got {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"The error rate has to be between 0 and 1, got {error_rate}")
+
+        n_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+
+        self.__n_bits = n_bits
+        self.__n_hashes = max(1, round(n_bits / capacity * math.log(2)))
+        self.__bits = bytearray((n_bits + 7) // 8)
+        self.__encode = problem.encode_state if problem is not None else _identity
+        self.__length = 0
+
+    def __contains__(self, state: Any) -> bool:
+        bits = self.__bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self.__get_positions(state))
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def add(self, state: Any, path_cost: float = 0, parent: Any = None) -> None:
+        bits = self.__bits
+        added = False
+
+        for p in self.__get_positions(state):
+            if not bits[p >> 3] & (1 << (p & 7)):
+                bits[p >> 3] |= 1 << (p & 7)
+                added = True
+
+        self.__length += added
+
+    def get_path_cost(self, state: Any) -> float:
+        return -math.inf
+
+    def get_memory_usage(self) -> int:
+        return sys.getsizeof(self.__bits)
+
+    def __get_positions(self, state: Any) -> list[int]:
+        digest = hashlib.blake2b(pickle.dumps(self.__encode(state), 4), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+        return [(h1 + i * h2) % self.__n_bits for i in range(self.__n_hashes)]
+
+
+def _identity(state: Any) -> Any:
+    return state
+
+
+def _get_dict_size(d: dict) -> int:
+    return sys.getsizeof(d) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in d.items())
@@ -0,0 +1,247 @@
+import math
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+from problem.node import Node
+from problem.problem import GraphProblem, Problem
+from search.helpers import path_cost_evaluation_function, path_cost_has_terminated
+from search.informed_search import Heuristic, astar_search
+from search.uninformed_search import (bidirectional_best_first_search, bidirectional_breadth_first_search,
+                                      breadth_first_search, fringe_search, uniform_cost_search)
+
+DEFAULT_SAMPLE_SIZE = 4096
+MAX_BREADTH_FIRST_STATES = 1 << 20
+MIN_DEEPENING_BRANCHING_FACTOR = 2
+
+_graph_statistics = weakref.WeakKeyDictionary()
+
+
+@dataclass(frozen=True)
+class ProblemStatistics:
+    """Cheap statistics of a problem, which solve uses to choose an algorithm.
+
+    Attributes
+    ----------
+    states : Optional[int]
+        The number of states, None if the state space is larger than the sample (or unknown).
+    actions : int
+        The number of actions of the inspected states.
+    branching_factor : float
+        The average number of actions of the inspected states.
+    uniform_costs : Optional[bool]
+        Whether all the actions have the same cost, math.inf (no cost) counting as 0. None if the inspected actions
+        have the same cost, but the state space is larger than the sample, so other actions may not.
+    has_heuristic : bool
+        Whether a heuristic is available.
+    has_reverse_problem : bool
+        Whether a problem in the backwards direction is available.
+    """
+    states: Optional[int]
+    actions: int
+    branching_factor: float
+    uniform_costs: Optional[bool]
+    has_heuristic: bool
+    has_reverse_problem: bool
+
+
+@dataclass(frozen=True)
+class SolveResult:
+    """The result of solve, a solution along with the algorithm which found it.
+
+    Attributes
+    ----------
+    node : Node
+        Solution node or failure.
+    algorithm : str
+        The name of the search function which was chosen.
+    reason : str
+        Why the algorithm was chosen.
+    statistics : ProblemStatistics
+        The statistics the choice was based on.
+    """
+    node: Node
+    algorithm: str
+    reason: str
+    statistics: ProblemStatistics
+
+
+def get_statistics(problem: Problem,
+                   heuristic: Optional[Heuristic] = None,
+                   reverse_problem: Optional[Problem] = None,
+                   sample_size: int = DEFAULT_SAMPLE_SIZE) -> ProblemStatistics:
+    """Gathers statistics of a problem.
+
+    The whole graph of a GraphProblem is inspected, since its vertices and edges are known, the statistics of
+    a graph are cached until its version changes, so repeated queries on the same graph inspect it once.
+    Other problems are sampled, by a breadth-first traversal of at most sample_size states from the initial state.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem.
+    heuristic : Callable[[Node], float]
+        Optional heuristic of the problem.
+    reverse_problem : Problem
+        Optional problem in the backwards direction.
+    sample_size : int
+        The maximum number of states inspected, for problems which are not graph problems.
+
+    Returns
+    -------
+    ProblemStatistics
+        The statistics.
+    """
+    if isinstance(problem, GraphProblem):
+        inspected, actions, costs = _get_graph_statistics(problem.graph)
+        exhausted = True
+    else:
+        states, exhausted = _sample_states(problem, sample_size)
+        inspected, actions, costs = _get_action_statistics(problem.get_actions, states)
+
+    uniform_costs = costs <= 1
+    if uniform_costs and not exhausted:
+        uniform_costs = None
+
+    return ProblemStatistics(states=inspected if exhausted else None,
+                             actions=actions,
+                             branching_factor=actions / inspected if inspected else 0,
+                             uniform_costs=uniform_costs,
+                             has_heuristic=heuristic is not None,
+                             has_reverse_problem=reverse_problem is not None)
+
+
+def solve(problem: Problem,
+          heuristic: Optional[Heuristic] = None,
+          reverse_problem: Optional[Problem] = None,
+          sample_size: int = DEFAULT_SAMPLE_SIZE,
+          uniform_costs: Optional[bool] = None) -> SolveResult:
+    """Solves a problem with the algorithm best suited to it, according to its statistics (see get_statistics).
+
+    The choice is made in this order:
+
+    - with a heuristic, astar_search,
+    - with uniform costs and a reverse problem (of a single goal), bidirectional_breadth_first_search,
+    - with uniform costs and at most MAX_BREADTH_FIRST_STATES states, breadth_first_search,
+    - with uniform costs, a larger (or unknown) state space and a branching factor of at least
+      MIN_DEEPENING_BRANCHING_FACTOR, fringe_search, an iterative-deepening search whose memory is bounded
+      by its transposition table, its fringe and its depth,
+    - with uniform costs, a larger (or unknown) state space and a smaller branching factor, breadth_first_search,
+    - with a reverse problem (of a single goal), bidirectional uniform-cost search,
+    - otherwise, uniform_cost_search.
+
+    The branching factor b decides between the last two: breadth-first search keeps the b^d states within the
+    depth d of the solution, while iterative deepening keeps only its bounded tables, but generates about
+    b / (b - 1) times as many states, because every iteration generates the shallower levels again. That is
+    twice as many at b = 2 and more and more as b approaches 1, while b^d grows slowly there, so breadth-first
+    search is used instead.
+
+    The costs are only known to be uniform when all the actions were inspected, a sample of a larger state space
+    cannot rule out costlier actions beyond it, so unless the caller states that the costs are uniform, such
+    a problem is solved as one whose costs vary. All the choices then return optimal solutions, provided that
+    the heuristic is admissible and the caller's uniform_costs is correct.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem.
+    heuristic : Callable[[Node], float]
+        Optional heuristic of the problem.
+    reverse_problem : Problem
+        Optional problem in the backwards direction (Goal -> Initial), its initial state has to be the only goal
+        of the problem and its goal has to be the initial state of the problem.
+    sample_size : int
+        The maximum number of states inspected, for problems which are not graph problems.
+    uniform_costs : Optional[bool]
+        Whether all the actions of the problem have the same cost, used when the statistics cannot tell,
+        because the state space is larger than the sample.
+
+    Returns
+    -------
+    SolveResult
+        The solution, the chosen algorithm, the reason for choosing it and the statistics.
+    """
+    statistics = get_statistics(problem, heuristic, reverse_problem, sample_size)
+    bidirectional = reverse_problem is not None and len(problem.goal_states) == 1
+
+    if heuristic is not None:
+        return SolveResult(astar_search(problem, heuristic), "astar_search",
+                           "a heuristic is available", statistics)
+
+    if statistics.uniform_costs is None:
+        if uniform_costs:
+            reason = "the costs are stated to be uniform"
+        else:
+            reason = f"the costs of the {sample_size} sampled states are uniform, but the ones beyond are unknown"
+    else:
+        uniform_costs = statistics.uniform_costs
+        reason = "the costs are uniform" if uniform_costs else "the costs vary"
+
+    if uniform_costs:
+        if bidirectional:
+            return SolveResult(bidirectional_breadth_first_search(problem, reverse_problem),
+                               "bidirectional_breadth_first_search",
+                               f"{reason} and a reverse problem is available", statistics)
+
+        if statistics.states is not None and statistics.states <= MAX_BREADTH_FIRST_STATES:
+            return SolveResult(breadth_first_search(problem), "breadth_first_search", reason, statistics)
+
+        if statistics.branching_factor < MIN_DEEPENING_BRANCHING_FACTOR:
+            return SolveResult(breadth_first_search(problem), "breadth_first_search",
+                               f"{reason} and the state space is large, but its branching factor is small",
+                               statistics)
+
+        return SolveResult(fringe_search(problem), "fringe_search", f"{reason} and the state space is large",
+                           statistics)
+
+    if bidirectional:
+        node = bidirectional_best_first_search(problem, path_cost_evaluation_function,
+                                               reverse_problem, path_cost_evaluation_function,
+                                               path_cost_has_terminated)
+        return SolveResult(node, "bidirectional_best_first_search",
+                           f"{reason} and a reverse problem is available", statistics)
+
+    return SolveResult(uniform_cost_search(problem), "uniform_cost_search", reason, statistics)
+
+
+def _sample_states(problem: Problem, sample_size: int) -> tuple[set[Any], bool]:
+    states = {problem.initial_state}
+    queue = deque(states)
+
+    while queue:
+        for a in problem.get_actions(queue.popleft()):
+            s = problem.apply_action(a)
+
+            if s not in states:
+                if len(states) >= sample_size:
+                    return states, False
+
+                states.add(s)
+                queue.append(s)
+
+    return states, True
+
+
+def _get_graph_statistics(graph: Any) -> tuple[int, int, int]:
+    version = graph.get_version() if hasattr(graph, "get_version") else 0
+    cached = _graph_statistics.get(graph)
+
+    if cached is None or cached[0] != version:
+        cached = (version, _get_action_statistics(graph.get_edges, graph.get_vertices()))
+        _graph_statistics[graph] = cached
+
+    return cached[1]
+
+
+def _get_action_statistics(get_actions: Callable[[Any], Iterable], states: Iterable[Any]) -> tuple[int, int, int]:
+    costs = set()
+    inspected, actions = 0, 0
+
+    for s in states:
+        inspected += 1
+        for a in get_actions(s):
+            costs.add(0 if a[1] == math.inf else a[1])
+            actions += 1
+
+    return inspected, actions, len(costs)
@@ -1,16 +1,26 @@
-from collections import deque
-from typing import Callable
+import random
+from collections import OrderedDict, deque
+from typing import Any, Callable, Optional, Union
 
 from datastructures import PriorityQueue
-from problem.node import Node, failure, cutoff
+from problem.node import Node, PathView, failure, cutoff
 from problem.problem import Problem
+from search.checkpoint import Checkpoint
 from search.helpers import path_cost_evaluation_function, proceed
+from search.reached import ReachedSet, StateReachedSet
 
 EvaluationFunction = Callable[[Node], float]
-HasTerminated = Callable[[Node, PriorityQueue, PriorityQueue], bool]
+HasTerminated = Callable[[Union[Node, PathView], PriorityQueue, PriorityQueue], bool]
 
+DEFAULT_TABLE_SIZE = 1 << 16
+DEFAULT_FRINGE_SIZE = 1 << 12
 
-def best_first_search(problem: Problem, evaluation_function: EvaluationFunction) -> Node:
+
+def best_first_search(problem: Problem,
+                      evaluation_function: EvaluationFunction,
+                      reached: ReachedSet = None,
+                      checkpoint: Checkpoint = None,
+                      resume: bool = False) -> Node:
     """Best-first search implementation.
 
     A general implementation of the best-first search algorithm,
@@ -22,6 +32,13 @@ def best_first_search(problem: Problem, evaluation_function: EvaluationFunction)
         Problem, which the algorithm searches.
     evaluation_function: Callable[[Node], float]
         Function calculating the cost of each node. It is used to order the priority queue backing the algorithm.
+    reached : ReachedSet
+        Empty reached set used to record the reached states, a StateReachedSet by default.
+    checkpoint : Checkpoint
+        If provided, the children added by every expansion and the random state are appended to the checkpoint's
+        log every checkpoint.interval expansions, resuming replays them to rebuild the frontier and reached set.
+    resume : bool
+        Whether to continue the search saved in the checkpoint, instead of starting a new one.
 
     Returns
     -------
@@ -30,18 +47,42 @@ def best_first_search(problem: Problem, evaluation_function: EvaluationFunction)
     """
     node = Node(state=problem.initial_state)
 
-    reached = {node.state: node}
+    reached = StateReachedSet() if reached is None else reached
+    reached.add(node.state, node.path_cost)
     frontier = PriorityQueue([(evaluation_function(node), node)], evaluation_function)
+    expansions, log = 0, []
+
+    if resume:
+        records, state = checkpoint.load_log("best_first_search")
+        for children in records:
+            n = frontier.pop()[1]
+            for c in _replay_children(n, children, reached):
+                frontier.add(c)
+        expansions = len(records)
+        if state is not None:
+            random.setstate(state["random"])
+    elif checkpoint is not None:
+        checkpoint.start_log("best_first_search")
 
     while frontier:
         n = frontier.pop()[1]
 
         if problem.is_goal(n.state):
             return n
+
+        children = []
         for c in n.expand(problem):
-            if c.state not in reached or c.path_cost < reached[c.state].path_cost:
-                reached[c.state] = c
+            if c.state not in reached or c.path_cost < reached.get_path_cost(c.state):
+                reached.add(c.state, c.path_cost, n.state)
                 frontier.add(c)
+                children.append((c.state, c.action, c.path_cost))
+
+        expansions += 1
+        if checkpoint is not None:
+            log.append(children)
+            if checkpoint.is_due(expansions):
+                checkpoint.append_log(log, {"random": random.getstate()})
+                log = []
 
     return failure
 
@@ -66,7 +107,10 @@ def uniform_cost_search(problem: Problem) -> Node:
     return best_first_search(problem, path_cost_evaluation_function)
 
 
-def breadth_first_search(problem: Problem) -> Node:
+def breadth_first_search(problem: Problem,
+                         reached: ReachedSet = None,
+                         checkpoint: Checkpoint = None,
+                         resume: bool = False) -> Node:
     """Breadth-first search implementation.
 
     Relies on the dequeue data structure for its FIFO queue needs.
@@ -78,6 +122,13 @@ def breadth_first_search(problem: Problem) -> Node:
     ----------
     problem : Problem
         The problem which this implementation searches.
+    reached : ReachedSet
+        Empty reached set used to record the reached states, a StateReachedSet by default.
+    checkpoint : Checkpoint
+        If provided, the children added by every expansion and the random state are appended to the checkpoint's
+        log every checkpoint.interval expansions, resuming replays them to rebuild the frontier and reached set.
+    resume : bool
+        Whether to continue the search saved in the checkpoint, instead of starting a new one.
 
     Returns
     -------
@@ -90,17 +141,38 @@ def breadth_first_search(problem: Problem) -> Node:
         return node
 
     frontier = deque([node])
-    reached = {node.state}
+    reached = StateReachedSet() if reached is None else reached
+    reached.add(node.state, node.path_cost)
+    expansions, log = 0, []
+
+    if resume:
+        records, state = checkpoint.load_log("breadth_first_search")
+        for children in records:
+            frontier.extend(_replay_children(frontier.popleft(), children, reached))
+        expansions = len(records)
+        if state is not None:
+            random.setstate(state["random"])
+    elif checkpoint is not None:
+        checkpoint.start_log("breadth_first_search")
 
     while frontier:
         n = frontier.popleft()
 
+        children = []
         for e in n.expand(problem):
             if problem.is_goal(e.state):
                 return e
             if e.state not in reached:
-                reached.add(e.state)
+                reached.add(e.state, e.path_cost, n.state)
                 frontier.append(e)
+                children.append((e.state, e.action, e.path_cost))
+
+        expansions += 1
+        if checkpoint is not None:
+            log.append(children)
+            if checkpoint.is_due(expansions):
+                checkpoint.append_log(log, {"random": random.getstate()})
+                log = []
 
     return failure
 
@@ -201,6 +273,54 @@ def iterative_deepening_search(problem: Problem) -> Node:
         depth += 1
 
 
+def fringe_search(problem: Problem,
+                  table_size: int = DEFAULT_TABLE_SIZE,
+                  fringe_size: int = DEFAULT_FRINGE_SIZE) -> Node:
+    """Fringe search implementation, an iterative-deepening search which continues from the previous iteration.
+
+    Like iterative-deepening search, runs a depth-first, depth-limited search with an ever increasing limit.
+    The nodes which an iteration cuts off at its limit form its fringe, the next iteration searches from them
+    instead of from the initial state, so the shallower levels are not generated again. The fringe holds at most
+    fringe_size nodes, once it overflows, it is dropped and the next iteration starts over from the initial state.
+
+    A transposition table, kept across the iterations, maps the states to the depth below them which was searched,
+    the limit minus the depth of the node which was expanded. A node of a state already searched at least as deep
+    below is dominated and not expanded again, so states reachable by many paths are not expanded once per path.
+    The table holds at most table_size states, evicting the least recently used ones, whose nodes are then expanded
+    again when they are reached. Nodes of states missing from the table are checked for cycles,
+    like in depth-limited search.
+
+    Memory is bounded by the sizes of the table and the fringe, plus the depth-first frontier, O(b * d).
+    The returned solution has the fewest actions, like the one of iterative-deepening search.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem which this implementation searches.
+    table_size : int
+        The maximum number of states in the transposition table.
+    fringe_size : int
+        The maximum number of nodes in the fringe.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    root = Node(state=problem.initial_state)
+    table = OrderedDict()
+    fringe = [root]
+    limit = 0
+
+    while True:
+        node, fringe = _fringe_limited_search(problem, [root] if fringe is None else fringe, limit, table,
+                                              table_size, fringe_size)
+
+        if node != cutoff:
+            return node
+        limit += 1
+
+
 def bidirectional_best_first_search(
         problem_f: Problem,
         evaluation_function_f: EvaluationFunction,
@@ -229,8 +349,9 @@ def bidirectional_best_first_search(
         Problem in the backwards direction (Goal -> Initial)
     evaluation_function_b : Callable[[Node], float]
         Cost evaluation function for the backwards problem.
-    has_terminated : Callable[[Node, list[(float, Node)], list[(float, Node)]], bool]
-        Function that check if the found solution is an optimal one.
+    has_terminated : Callable[[Union[Node, PathView], PriorityQueue, PriorityQueue], bool]
+        Function that checks if the best solution found so far, failure or a PathView joining the two directions,
+        is an optimal one, given the frontiers of both directions.
 
     Returns
     -------
@@ -241,16 +362,134 @@ def bidirectional_best_first_search(
     node_b = Node(problem_b.initial_state)
 
     frontier_f = PriorityQueue([(evaluation_function_f(node_f), node_f)], evaluation_function_f)
-    frontier_b = PriorityQueue([(evaluation_function_f(node_b), node_b)], evaluation_function_b)
+    frontier_b = PriorityQueue([(evaluation_function_b(node_b), node_b)], evaluation_function_b)
 
-    reached_f = {}
-    reached_b = {}
+    reached_f = {node_f.state: node_f}
+    reached_b = {node_b.state: node_b}
 
-    solution = failure
+    solution = PathView(node_f, node_b) if node_f.state == node_b.state else failure
 
     while not has_terminated(solution, frontier_f, frontier_b):
         solution = (proceed("F", problem_f, frontier_f, reached_f, reached_b, solution)
                     if evaluation_function_f(frontier_f.top()) < evaluation_function_b(frontier_b.top())
                     else proceed("B", problem_b, frontier_b, reached_b, reached_f, solution))
 
-    return solution
+    return solution.to_node() if isinstance(solution, PathView) else solution
+
+
+def bidirectional_breadth_first_search(problem_f: Problem, problem_b: Problem) -> Node:
+    """Bidirectional breadth-first search implementation.
+
+    Runs two breadth-first searches, one from the initial state of each problem, a layer at a time,
+    always expanding the smaller of the two frontier layers. When an expanded layer reaches states already
+    reached in the other direction, the shortest of the joined paths is returned, since any shorter one would
+    have met in an earlier layer. The returned path has the fewest actions, which makes it optimal on
+    unweighted and unit-cost problems, like the one of breadth-first search.
+
+    Parameters
+    ----------
+    problem_f : Problem
+        Problem in the forwards direction (Initial -> Goal)
+    problem_b : Problem
+        Problem in the backwards direction (Goal -> Initial), its initial state is the goal which is searched for.
+
+    Returns
+    -------
+    Node
+        Solution node or failure.
+    """
+    node_f = Node(state=problem_f.initial_state)
+    node_b = Node(state=problem_b.initial_state)
+
+    if problem_f.is_goal(node_f.state):
+        return node_f
+
+    reached_f = {node_f.state: node_f}
+    reached_b = {node_b.state: node_b}
+    layer_f = [node_f]
+    layer_b = [node_b]
+
+    while layer_f and layer_b:
+        if len(layer_f) <= len(layer_b):
+            layer_f, solution = _expand_layer("F", problem_f, layer_f, reached_f, reached_b)
+        else:
+            layer_b, solution = _expand_layer("B", problem_b, layer_b, reached_b, reached_f)
+
+        if solution is not failure:
+            return solution.to_node()
+
+    return failure
+
+
+def _expand_layer(direction: str,
+                  problem: Problem,
+                  layer: list[Node],
+                  reached1: dict[Any, Node],
+                  reached2: dict[Any, Node]) -> tuple[list[Node], Union[Node, PathView]]:
+    next_layer = []
+    solution = failure
+
+    for n in layer:
+        for c in n.expand(problem):
+            if c.state in reached1:
+                continue
+
+            reached1[c.state] = c
+            next_layer.append(c)
+
+            if c.state in reached2:
+                joined_solution = PathView.join(direction, (c, reached2[c.state]))
+                if solution is failure or joined_solution.depth < solution.depth:
+                    solution = joined_solution
+
+    return next_layer, solution
+
+
+def _fringe_limited_search(problem: Problem,
+                           roots: list[Node],
+                           limit: int,
+                           table: OrderedDict,
+                           table_size: int,
+                           fringe_size: int) -> tuple[Node, Optional[list[Node]]]:
+    result = failure
+    fringe = []
+    frontier = roots[::-1]
+
+    while frontier:
+        node = frontier.pop()
+        remaining = limit - node.depth
+
+        searched = table.get(node.state)
+        if searched is not None:
+            if searched >= remaining:
+                continue
+        elif node.is_cycle():
+            continue
+
+        table[node.state] = remaining
+        table.move_to_end(node.state)
+        if len(table) > table_size:
+            table.popitem(last=False)
+
+        if problem.is_goal(node.state):
+            return node, None
+        elif remaining <= 0:
+            result = cutoff
+            if fringe is not None:
+                fringe.append(node)
+                if len(fringe) > fringe_size:
+                    fringe = None
+        else:
+            frontier.extend(node.expand(problem))
+
+    return result, fringe
+
+
+def _replay_children(node: Node, children: list[tuple[Any, Any, float]], reached: ReachedSet) -> list[Node]:
+    nodes = []
+
+    for state, action, path_cost in children:
+        reached.add(state, path_cost, node.state)
+        nodes.append(Node(state=state, parent=node, action=action, path_cost=path_cost))
+
+    return nodes
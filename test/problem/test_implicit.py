@@ -0,0 +1,104 @@
+import math
+import random
+from unittest import TestCase
+
+from problem.implicit import GridProblem, SlidingPuzzleProblem, pack_tiles, unpack_tiles
+from problem.node import Node, failure
+from search.informed_search import astar_search, iterative_deepening_astar_search
+from search.uninformed_search import breadth_first_search, uniform_cost_search
+
+
+class TestGridProblem(TestCase):
+    def setUp(self):
+        self.rows = ["S...#...",
+                     ".##.#.#.",
+                     ".#..#.#.",
+                     ".#.##.#.",
+                     "......#G"]
+
+    def test_get_actions(self):
+        problem = GridProblem.from_strings(["..",
+                                            "S#"], diagonal=True)
+
+        test_data = [((0, 1), {((0, 0), 1)}), ((0, 0), {((1, 0), 1), ((0, 1), 1)}), ((1, 0), {((0, 0), 1)})]
+
+        for c, e in test_data:
+            with self.subTest("Should have returned the free neighbours, without cutting corners.", c=c, e=e):
+                actions = problem.get_actions(problem.get_state(*c))
+                self.assertEqual({(problem.get_cell(s), cost) for s, cost in actions}, e)
+
+    def test_search(self):
+        open_rows = ["S....",
+                     ".....",
+                     "....G"]
+        test_data = [(self.rows, False, 19), (self.rows, True, 19), (open_rows, False, 6),
+                     (open_rows, True, 2 + 2 * math.sqrt(2))]
+
+        for r, d, e in test_data:
+            problem = GridProblem.from_strings(r, diagonal=d)
+            heuristic = problem.octile_heuristic if d else problem.manhattan_heuristic
+
+            with self.subTest("Should have found the optimal path with A*.", r=r, d=d, e=e):
+                self.assertAlmostEqual(astar_search(problem, heuristic).path_cost, e)
+                self.assertAlmostEqual(uniform_cost_search(problem).path_cost, e)
+
+            with self.subTest("Should have avoided the obstacles.", r=r, d=d):
+                node = astar_search(problem, heuristic)
+                self.assertTrue(all(problem.is_free(*problem.get_cell(s)) for s in node.get_path()))
+
+        with self.subTest("Should have returned failure for an enclosed goal."):
+            problem = GridProblem.from_strings(["S.#G"])
+            self.assertEqual(breadth_first_search(problem), failure)
+
+    def test_heuristics(self):
+        rng = random.Random(2)
+        obstacles = {(rng.randrange(20), rng.randrange(20)) for _ in range(80)} - {(0, 0)}
+
+        for d in [False, True]:
+            problem = GridProblem(20, 20, obstacles, (0, 0), [(19, 19), (10, 3)], diagonal=d)
+            heuristic = problem.octile_heuristic if d else problem.manhattan_heuristic
+
+            for s in rng.sample(sorted(set(range(400)) - {problem.get_state(*c) for c in obstacles}), 10):
+                exact = uniform_cost_search(GridProblem(20, 20, obstacles, problem.get_cell(s),
+                                                        [(19, 19), (10, 3)], diagonal=d)).path_cost
+
+                with self.subTest("Should have never overestimated the cost to a goal.", d=d, s=s):
+                    self.assertLessEqual(heuristic(Node(state=s)), exact + 1e-9)
+
+
+class TestSlidingPuzzleProblem(TestCase):
+    def test_pack_tiles(self):
+        tiles = [15, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 0]
+
+        self.assertEqual(unpack_tiles(pack_tiles(tiles), 4), tiles)
+
+    def test_get_actions(self):
+        problem = SlidingPuzzleProblem([1, 2, 3,
+                                        4, 0, 5,
+                                        7, 8, 6])
+
+        self.assertEqual(sorted(unpack_tiles(s, 3) for s, _ in problem.get_actions(problem.initial_state)),
+                         sorted([[1, 0, 3, 4, 2, 5, 7, 8, 6], [1, 2, 3, 4, 8, 5, 7, 0, 6],
+                                 [1, 2, 3, 0, 4, 5, 7, 8, 6], [1, 2, 3, 4, 5, 0, 7, 8, 6]]))
+
+    def test_search(self):
+        test_data = [([1, 2, 3, 4, 0, 5, 7, 8, 6], 2),
+                     ([8, 6, 7, 2, 5, 4, 3, 0, 1], 31),
+                     ([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 0, 13, 14, 15], 3),
+                     ([5, 1, 2, 4, 9, 6, 3, 8, 13, 10, 7, 11, 0, 14, 15, 12], 9)]
+
+        for t, e in test_data:
+            problem = SlidingPuzzleProblem(t)
+
+            with self.subTest("Should have found an optimal solution.", t=t, e=e):
+                self.assertTrue(problem.is_solvable())
+                self.assertEqual(astar_search(problem, problem.manhattan_heuristic).depth, e)
+                if len(t) == 16:
+                    self.assertEqual(iterative_deepening_astar_search(problem, problem.manhattan_heuristic).depth, e)
+
+        with self.subTest("Should have recognised an unsolvable puzzle."):
+            self.assertFalse(SlidingPuzzleProblem([2, 1, 3, 4, 5, 6, 7, 8, 0]).is_solvable())
+            self.assertFalse(SlidingPuzzleProblem([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 15, 14, 0]).is_solvable())
+
+        with self.subTest("Should have raised an exception for a puzzle which is not square."):
+            self.assertRaises(ValueError, SlidingPuzzleProblem, [1, 2, 0])
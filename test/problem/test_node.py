@@ -2,7 +2,7 @@ import math
 from unittest import TestCase
 from unittest.mock import Mock
 
-from problem.node import Node
+from problem.node import Node, PathView, join_nodes
 from problem.problem import Problem
 
 
@@ -47,3 +47,32 @@ class TestNode(TestCase):
         mock_problem.apply_action.side_effect = states
 
         self.assertEqual(tuple(self.node.expand(mock_problem)), expected)
+
+    def test_path_view(self):
+        a = Node(state="A")
+        b = Node(state="B", parent=a, action=("B", 2), path_cost=2)
+        c_f = Node(state="C", parent=b, action=("C", 3), path_cost=5)
+        e = Node(state="E")
+        d = Node(state="D", parent=e, action=("D", 4), path_cost=4)
+        c_b = Node(state="C", parent=d, action=("C", 1), path_cost=5)
+
+        test_data = [("F", (c_f, c_b)), ("B", (c_b, c_f))]
+
+        for direction, nodes in test_data:
+            view = PathView.join(direction, nodes)
+
+            with self.subTest("Should have viewed the joined path.", direction=direction):
+                self.assertEqual(list(view), ["A", "B", "C", "D", "E"])
+                self.assertEqual(list(reversed(view)), ["E", "D", "C", "B", "A"])
+                self.assertEqual((len(view), view.depth, view.path_cost, view.state), (5, 4, 10, "E"))
+
+            with self.subTest("Should have materialised the path like join_nodes.", direction=direction):
+                node = view.to_node()
+                self.assertEqual(node, join_nodes(direction, nodes))
+                self.assertEqual(node.get_path()[::-1] + [node.state], list(view))
+                self.assertEqual((node.depth, node.path_cost), (view.depth, view.path_cost))
+
+        with self.subTest("Should have viewed the path of a single chain."):
+            view = PathView(c_f)
+            self.assertEqual((list(view), len(view), view.path_cost, view.state), (["A", "B", "C"], 3, 5, "C"))
+            self.assertIs(view.to_node(), c_f)
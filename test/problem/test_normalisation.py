@@ -0,0 +1,79 @@
+import math
+import random
+import unittest
+
+from datastructures import Graph, romania_road_map
+from problem.node import failure
+from problem.normalisation import normalise_graph
+from problem.problem import GraphProblem
+from search.uninformed_search import uniform_cost_search
+
+
+class TestNormaliseGraph(unittest.TestCase):
+    def test_parallel_edges_and_self_loops(self):
+        graph = Graph([("A", "B", 5), ("A", "B", 3), ("B", "B", 1), ("B", "C", 2)], directed=True)
+        normalised = normalise_graph(graph, contract=False)
+        a, b, c = (normalised.get_index(v) for v in "ABC")
+
+        with self.subTest("Should have kept the cheapest of the parallel edges and dropped the self-loop."):
+            self.assertEqual(normalised.get_graph().get_edges(a), {(b, 3)})
+            self.assertEqual(normalised.get_graph().get_edges(b), {(c, 2)})
+
+        with self.subTest("Should have relabelled the vertices with consecutive integers."):
+            self.assertEqual(sorted([a, b, c]), [0, 1, 2])
+            self.assertEqual([normalised.get_vertex(i) for i in (a, b, c)], ["A", "B", "C"])
+
+    def test_chain_contraction(self):
+        graph = Graph([("A", "B", 1), ("B", "C", 2), ("C", "D", math.inf), ("D", "E", 4), ("A", "F", 1), ("F", "E", 9)])
+        normalised = normalise_graph(graph, keep={"A", "E"})
+        problem = normalised.create_problem("A", {"E"})
+
+        with self.subTest("Should have contracted the chains into single edges."):
+            self.assertEqual(normalised.get_graph().get_vertices(), {0, 1})
+            self.assertEqual(normalised.get_graph().get_edges(problem.initial_state), {(1 - problem.initial_state, 7)})
+
+        with self.subTest("Should have expanded the solution back into the original vertices."):
+            node = normalised.expand_node(uniform_cost_search(problem))
+            self.assertEqual(node.get_path()[::-1] + [node.state], ["A", "B", "C", "D", "E"])
+            self.assertEqual(node.path_cost, 7)
+            self.assertEqual(node.action, ("E", 4))
+            self.assertEqual(normalised.expand_path([problem.initial_state, 1 - problem.initial_state]),
+                             ["A", "B", "C", "D", "E"])
+
+        with self.subTest("Should have rejected a contracted vertex."):
+            with self.assertRaises(ValueError):
+                normalised.create_problem("C", {"E"})
+
+    def test_shortest_paths(self):
+        rng = random.Random(17)
+        graphs = [romania_road_map]
+
+        for directed in [False, True]:
+            for _ in range(5):
+                edges = [(rng.randrange(60), rng.randrange(60), rng.randint(1, 9)) for _ in range(90)]
+                edges += [(v, v + 1, rng.randint(1, 9)) for v in range(60, 80)]
+                graphs.append(Graph(edges + [(rng.randrange(60), 60, 1), (79, rng.randrange(60), 1)], directed))
+
+        for n, graph in enumerate(graphs):
+            vertices = sorted(graph.get_vertices())
+
+            for _ in range(10):
+                i, g = rng.choice(vertices), rng.choice(vertices)
+                normalised = normalise_graph(graph, keep={i, g})
+                expected = uniform_cost_search(GraphProblem(i, {g}, graph))
+                node = normalised.expand_node(uniform_cost_search(normalised.create_problem(i, {g})))
+
+                with self.subTest("Should have returned a path of the original graph, of the same cost.", n=n):
+                    if expected is failure:
+                        self.assertIs(node, failure)
+                        continue
+
+                    self.assertEqual(node.path_cost, expected.path_cost)
+                    path = node.get_path()[::-1] + [node.state]
+                    self.assertEqual((path[0], path[-1]), (i, g))
+                    costs = [min(c for t, c in graph.get_edges(f) if t == s) for f, s in zip(path, path[1:])]
+                    self.assertEqual(sum(costs), node.path_cost)
+
+                with self.subTest("Should have contracted the chain of degree-2 vertices.", n=n):
+                    if n:
+                        self.assertLess(len(normalised.get_graph().get_vertices()), len(graph.get_vertices()) - 10)
@@ -1,8 +1,10 @@
 from unittest import TestCase
 from unittest.mock import patch, Mock
 
-from datastructures import Graph
-from problem.problem import Problem, GraphProblem, calculate_non_attacking_pairs, create_n_queens_states
+from datastructures import Graph, romania_road_map
+from problem.problem import Problem, GraphProblem, CachingProblem, calculate_non_attacking_pairs, \
+    create_n_queens_states
+from search.uninformed_search import iterative_deepening_search
 
 
 class TestProblem(TestCase):
@@ -59,6 +61,48 @@ class TestGraphProblem(TestCase):
             self.assertRaises(ValueError, self.problem.get_action_cost, invalid_action)
 
 
+class TestCachingProblem(TestCase):
+    def setUp(self):
+        self.problem = GraphProblem("Arad", {"Bucharest"}, romania_road_map)
+        self.problem.get_actions = Mock(wraps=self.problem.get_actions)
+        self.problem.apply_action = Mock(wraps=self.problem.apply_action)
+
+    def test_iterative_deepening_search(self):
+        caching_problem = CachingProblem(self.problem)
+
+        node = iterative_deepening_search(caching_problem)
+
+        with self.subTest("Should have returned the same solution as the wrapped problem."):
+            self.assertEqual(node.get_path(), iterative_deepening_search(GraphProblem("Arad", {"Bucharest"},
+                                                                                     romania_road_map)).get_path())
+
+        with self.subTest("Should have called the wrapped problem once per state and action."):
+            self.assertEqual(self.problem.get_actions.call_count, len({c[0][0] for c in
+                                                                      self.problem.get_actions.call_args_list}))
+            self.assertEqual(caching_problem.get_misses(),
+                             self.problem.get_actions.call_count + self.problem.apply_action.call_count)
+            self.assertGreater(caching_problem.get_hits(), 0)
+
+    def test_max_size(self):
+        caching_problem = CachingProblem(self.problem, max_size=2)
+
+        for s in ["Arad", "Sibiu", "Arad", "Fagaras", "Arad", "Sibiu"]:
+            caching_problem.get_actions(s)
+
+        with self.subTest("Should have evicted the least recently used state."):
+            self.assertEqual([c[0][0] for c in self.problem.get_actions.call_args_list],
+                             ["Arad", "Sibiu", "Fagaras", "Sibiu"])
+            self.assertEqual((caching_problem.get_hits(), caching_problem.get_misses()), (2, 4))
+
+        with self.subTest("Should have called the wrapped problem again after clearing the cache."):
+            caching_problem.clear()
+            caching_problem.get_actions("Arad")
+            self.assertEqual(self.problem.get_actions.call_count, 5)
+
+        with self.subTest("Should have propagated the errors of the wrapped problem."):
+            self.assertRaises(ValueError, caching_problem.apply_action, ("Atlantis", 1))
+
+
 class TestNQueensProblem(TestCase):
     def test_create_n_queens_states(self):
         test_data = [(8, 100), (3, 10)]
@@ -0,0 +1,12 @@
+bucharest_distances = {"Arad": 366, "Bucharest": 0, "Craiova": 160, "Drobeta": 242, "Eforie": 161, "Fagaras": 176,
+                       "Giurgiu": 77, "Hirsova": 151, "Iasi": 226, "Lugoj": 244, "Mehadia": 241, "Neamt": 234,
+                       "Oradea": 380, "Pitesti": 100, "Rimnicu Vilcea": 193, "Sibiu": 253, "Timisoara": 329,
+                       "Urziceni": 80, "Vaslui": 199, "Zerind": 374}
+
+
+def bucharest_heuristic(node):
+    return bucharest_distances[node.state]
+
+
+def zero_heuristic(node):
+    return 0
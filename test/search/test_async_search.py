@@ -0,0 +1,82 @@
+import asyncio
+import random
+import unittest
+
+from datastructures import Graph, romania_road_map
+from problem.node import failure
+from problem.problem import GraphProblem
+from search.async_search import AsyncProblem, AsyncProblemAdapter, async_best_first_search, \
+    async_breadth_first_search, async_uniform_cost_search
+from search.uninformed_search import breadth_first_search, uniform_cost_search
+from test.search.fixtures import bucharest_heuristic
+
+
+class FakeRoutingService(AsyncProblem):
+    def __init__(self, initial_state, goal_states, graph, latency=0.002, seed=0):
+        super().__init__(initial_state, goal_states)
+        self.graph = graph
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def get_actions(self, state):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.rng.uniform(0, self.latency))
+            return self.graph.get_edges(state)
+        finally:
+            self.in_flight -= 1
+
+    async def apply_action(self, action):
+        return action[0]
+
+    def get_action_cost(self, action):
+        return action[1]
+
+
+class TestAsyncSearch(unittest.IsolatedAsyncioTestCase):
+    async def test_async_best_first_search(self):
+        test_data = [(1, 418), (4, 418), (16, 418)]
+
+        for m, ec in test_data:
+            service = FakeRoutingService("Arad", {"Bucharest"}, romania_road_map)
+            node = await async_best_first_search(service, lambda n: n.path_cost + bucharest_heuristic(n), m)
+
+            with self.subTest("Should have returned the optimal solution.", m=m, ec=ec):
+                self.assertEqual(node.get_path(), ["Pitesti", "Rimnicu Vilcea", "Sibiu", "Arad"])
+                self.assertEqual(node.path_cost, ec)
+
+            with self.subTest("Should have respected the in-flight limit.", m=m):
+                self.assertLessEqual(service.peak_in_flight, m)
+                self.assertEqual(service.peak_in_flight > 1, m > 1)
+
+    async def test_async_uniform_cost_search(self):
+        rng = random.Random(7)
+
+        for i in range(10):
+            graph = Graph([(rng.randrange(60), rng.randrange(60), rng.randint(1, 20)) for _ in range(150)],
+                          directed=True)
+
+            with self.subTest("Should have returned a solution as cheap as uniform-cost search.", i=i):
+                node = await async_uniform_cost_search(FakeRoutingService(0, {59, 58}, graph, 0.0005, i), 6)
+                self.assertEqual(node.path_cost, uniform_cost_search(GraphProblem(0, {59, 58}, graph)).path_cost)
+
+    async def test_async_breadth_first_search(self):
+        test_data = [("Arad", {"Bucharest"}), ("Arad", {"Arad"}), ("Neamt", {"Timisoara", "Drobeta"})]
+
+        for s, g in test_data:
+            with self.subTest("Should have returned the same solution as breadth-first search.", s=s, g=g):
+                node = await async_breadth_first_search(FakeRoutingService(s, g, romania_road_map), 5)
+                self.assertEqual(node, breadth_first_search(GraphProblem(s, g, romania_road_map)))
+
+        with self.subTest("Should have returned failure for an unreachable goal."):
+            graph = Graph([("A", "B", 1), ("C", "D", 1)])
+            self.assertEqual(await async_breadth_first_search(FakeRoutingService("A", {"D"}, graph)), failure)
+
+    async def test_async_problem_adapter(self):
+        problem = AsyncProblemAdapter(GraphProblem("Arad", {"Bucharest"}, romania_road_map))
+
+        with self.subTest("Should have searched a blocking problem in an executor."):
+            self.assertEqual((await async_uniform_cost_search(problem)).path_cost, 418)
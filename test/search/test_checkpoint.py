@@ -0,0 +1,162 @@
+import os
+import random
+import tempfile
+import unittest
+
+from datastructures import Graph
+from problem.node import Node
+from problem.problem import GraphProblem, create_n_queens_states, calculate_non_attacking_pairs
+from search.checkpoint import Checkpoint, flatten_nodes, restore_nodes
+from search.complex_search import genetic_algorithm
+from search.helpers import path_cost_evaluation_function
+from search.uninformed_search import best_first_search, breadth_first_search
+
+
+class InterruptedGraphProblem(GraphProblem):
+    def __init__(self, initial_state, goal_states, graph, interrupt_after):
+        super().__init__(initial_state, goal_states, graph)
+        self.interrupt_after = interrupt_after
+        self.expanded = []
+
+    def get_actions(self, state):
+        if len(self.expanded) == self.interrupt_after:
+            raise KeyboardInterrupt
+        self.expanded.append(state)
+        # The edges of a Graph are a set, sorting them makes the expansion order independent of hashing,
+        # which resuming only reproduces exactly for a deterministic order of the actions.
+        return sorted(super().get_actions(state))
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "search.ckpt")
+
+        rng = random.Random(11)
+        self.graph = Graph([((x, y), n, rng.randint(1, 5)) for x in range(15) for y in range(15)
+                            for n in [(x + 1, y), (x, y + 1)] if max(n) < 15])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_resume_search(self):
+        test_data = [("best_first_search", lambda p, **kw: best_first_search(p, path_cost_evaluation_function, **kw)),
+                     ("breadth_first_search", breadth_first_search)]
+
+        for name, search in test_data:
+            problem = InterruptedGraphProblem((0, 0), {(14, 14)}, self.graph, -1)
+            expected = search(problem)
+
+            interval = len(problem.expanded) // 3
+            interrupted = InterruptedGraphProblem((0, 0), {(14, 14)}, self.graph, 2 * interval + 1)
+            checkpoint = Checkpoint(self.path, interval=interval)
+            with self.assertRaises(KeyboardInterrupt):
+                search(interrupted, checkpoint=checkpoint)
+
+            resumed = InterruptedGraphProblem((0, 0), {(14, 14)}, self.graph, -1)
+            node = search(resumed, checkpoint=checkpoint, resume=True)
+
+            with self.subTest("Should have returned the same solution as an uninterrupted search.", name=name):
+                self.assertEqual(node, expected)
+
+            with self.subTest("Should have expanded the same states as an uninterrupted search.", name=name):
+                self.assertEqual(interrupted.expanded[:2 * interval] + resumed.expanded, problem.expanded)
+
+    def test_save_size(self):
+        n = 60
+        graph = Graph([((x, y), (x + dx, y + dy)) for x in range(n) for y in range(n)
+                       for dx, dy in [(1, 0), (0, 1)] if x + dx < n and y + dy < n])
+        checkpoint = Checkpoint(self.path, interval=50)
+        sizes = []
+
+        def append_log(records, state, append=checkpoint.append_log):
+            size = os.path.getsize(self.path)
+            append(records, state)
+            sizes.append(os.path.getsize(self.path) - size)
+
+        checkpoint.append_log = append_log
+        breadth_first_search(GraphProblem((0, 0), {(n - 1, n - 1)}, graph), checkpoint=checkpoint)
+
+        with self.subTest("Should have written only the expansions since the previous save, not the whole state."):
+            self.assertGreater(len(sizes), 60)
+            self.assertLess(max(sizes), 8000)
+            self.assertLess(max(sizes[-10:]), 2 * max(sizes[:10]))
+
+    def test_log(self):
+        checkpoint = Checkpoint(self.path)
+        checkpoint.start_log("breadth_first_search")
+
+        with self.subTest("Should have loaded an empty log."):
+            self.assertEqual(checkpoint.load_log("breadth_first_search"), ([], None))
+
+        for i in range(3):
+            checkpoint.append_log([i, i], {"step": i})
+        with open(self.path, "ab") as f:
+            f.write(b"\x00\x00\x01\x00incomplete")
+
+        with self.subTest("Should have loaded the records and the latest state, dropping an incomplete chunk."):
+            self.assertEqual(checkpoint.load_log("breadth_first_search"), ([0, 0, 1, 1, 2, 2], {"step": 2}))
+            checkpoint.append_log([3], {"step": 3})
+            self.assertEqual(checkpoint.load_log("breadth_first_search"), ([0, 0, 1, 1, 2, 2, 3], {"step": 3}))
+
+        with self.subTest("Should have compacted the log into a single chunk, keeping its records."):
+            for i in range(200):
+                checkpoint.append_log([os.urandom(1000)], {"random": os.urandom(1000)})
+            records, _ = checkpoint.load_log("breadth_first_search")
+            self.assertEqual(len(records), 207)
+            self.assertLess(os.path.getsize(self.path), 350 * 1000)
+
+        with self.subTest("Should have raised an exception for another algorithm's log or a snapshot."):
+            self.assertRaises(ValueError, checkpoint.load_log, "best_first_search")
+            checkpoint.save("breadth_first_search", {})
+            self.assertRaises(ValueError, checkpoint.load_log, "breadth_first_search")
+
+    def test_resume_genetic_algorithm(self):
+        genes = [str(i) for i in range(1, 9)]
+
+        def run(number_generations, **kwargs):
+            return genetic_algorithm(create_n_queens_states(8, 50), calculate_non_attacking_pairs, genes,
+                                     number_generations=number_generations, generation_size=50, **kwargs)
+
+        random.seed(3)
+        expected = run(12)
+
+        random.seed(3)
+        run(7, checkpoint=Checkpoint(self.path, interval=5))
+        random.seed(99)
+
+        with self.subTest("Should have returned the same individual as an uninterrupted run."):
+            self.assertEqual(run(12, checkpoint=Checkpoint(self.path, interval=5), resume=True), expected)
+
+    def test_load(self):
+        checkpoint = Checkpoint(self.path)
+        checkpoint.save("best_first_search", {"expansions": 1})
+
+        with self.subTest("Should have loaded the saved state."):
+            self.assertEqual(checkpoint.load("best_first_search"), {"expansions": 1})
+
+        with self.subTest("Should have raised an exception for another algorithm's checkpoint."):
+            self.assertRaises(ValueError, checkpoint.load, "genetic_algorithm")
+
+        with self.subTest("Should have raised an exception for a file which is not a checkpoint."):
+            with open(self.path, "wb") as f:
+                f.write(b"not a checkpoint")
+            self.assertRaises(ValueError, checkpoint.load, "best_first_search")
+
+    def test_flatten_nodes(self):
+        node = Node(state=0)
+        for i in range(1, 5000):
+            node = Node(state=i, parent=node, action=(i, 1), path_cost=i)
+        sibling = Node(state=-1, parent=node.parent, action=(-1, 1), path_cost=4999)
+
+        table, indices = flatten_nodes([node, sibling, node])
+        nodes = restore_nodes(table)
+
+        with self.subTest("Should have stored every node once."):
+            self.assertEqual(len(table), 5001)
+
+        with self.subTest("Should have restored the nodes."):
+            self.assertEqual([nodes[i].state for i in indices], [4999, -1, 4999])
+            self.assertIs(nodes[indices[0]].parent, nodes[indices[1]].parent)
+            self.assertEqual(nodes[indices[0]].depth, 4999)
+            self.assertEqual(nodes[indices[0]].get_path(), node.get_path())
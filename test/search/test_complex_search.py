@@ -1,8 +1,39 @@
+import random
 from unittest import TestCase
 from unittest.mock import patch, Mock, DEFAULT
 
-from problem.problem import create_n_queens_states, calculate_non_attacking_pairs
-from search.complex_search import weight_by, reproduce, mutate, genetic_algorithm
+from problem.problem import Problem, create_n_queens_states, calculate_non_attacking_pairs
+from search.complex_search import weight_by, reproduce, mutate, genetic_algorithm, local_beam_search
+
+
+class LineProblem(Problem):
+    def __init__(self, initial_state, goal_states, size):
+        super().__init__(initial_state, goal_states)
+        self.size = size
+
+    def get_actions(self, state):
+        return [(s, 1) for s in (state - 1, state + 1) if 0 <= s < self.size]
+
+    def apply_action(self, action):
+        return action[0]
+
+    def get_action_cost(self, action):
+        return action[1]
+
+
+class NQueensProblem(Problem):
+    def get_actions(self, state):
+        return [(state[:i] + str(r) + state[i + 1:], 1)
+                for i in range(len(state)) for r in range(1, len(state) + 1) if str(r) != state[i]]
+
+    def apply_action(self, action):
+        return action[0]
+
+    def get_action_cost(self, action):
+        return action[1]
+
+    def is_goal(self, state):
+        return calculate_non_attacking_pairs(state) == 28
 
 
 class GeneticAlgorithm(TestCase):
@@ -53,3 +84,34 @@ class GeneticAlgorithm(TestCase):
                                   fitness_threshold=ft)
 
         self.assertEqual(calculate_non_attacking_pairs(state), ft)
+
+
+class LocalBeamSearch(TestCase):
+    def test_local_beam_search(self):
+        def objective_function(x):
+            return max(20 - abs(x - 20), 50 - abs(x - 70))
+
+        problem = LineProblem(0, set(), 100)
+
+        test_data = [([0], 20), ([0, 60], 70), ([0, 10, 30], 20)]
+
+        for initial_states, e in test_data:
+            with self.subTest("Should have climbed to the best reachable maximum.", initial_states=initial_states):
+                self.assertEqual(local_beam_search(problem, objective_function, 2, initial_states), e)
+
+        with self.subTest("Should have stopped at a goal."):
+            self.assertEqual(local_beam_search(LineProblem(0, {5}, 100), objective_function, 2), 5)
+
+    def test_stochastic_beam_search(self):
+        random.seed(1)
+        problem = NQueensProblem(None, set())
+
+        state = local_beam_search(problem, lambda s: 4 ** calculate_non_attacking_pairs(s), 8,
+                                  create_n_queens_states(8, 8), max_iterations=200, stochastic=True)
+
+        with self.subTest("Should have found a solution."):
+            self.assertEqual(calculate_non_attacking_pairs(state), 28)
+
+        with self.subTest("Should have rejected negative objective values."):
+            with self.assertRaises(ValueError):
+                local_beam_search(LineProblem(1, set(), 3), lambda x: -x, 2, stochastic=True)
@@ -0,0 +1,95 @@
+import os
+import random
+import tempfile
+import unittest
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from datastructures import Graph, binary_tree, romania_road_map
+from problem.node import failure
+from problem.problem import GraphProblem
+from search.external_search import external_breadth_first_search, external_uniform_cost_search
+from search.uninformed_search import breadth_first_search, uniform_cost_search
+
+
+class TestExternalSearch(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+        rng = random.Random(7)
+        n = 20
+        self.grid = Graph([((x, y), (x + dx, y + dy), rng.randint(1, 9))
+                           for x in range(n) for y in range(n) for dx, dy in ((1, 0), (0, 1))
+                           if x + dx < n and y + dy < n])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_external_breadth_first_search(self):
+        test_data = [("Arad", {"Bucharest"}, ["Fagaras", "Sibiu", "Arad"], romania_road_map, 2),
+                     ("Arad", {"Arad"}, [], romania_road_map, None),
+                     ("Arad", {"Unknown"}, failure, romania_road_map, 2),
+                     ("A", {"M"}, ["F", "C", "A"], binary_tree, None),
+                     ("A", {"Z"}, failure, binary_tree, None)]
+
+        for i, g, e, graph, loc in test_data:
+            with self.subTest("Should have returned the breadth-first solution or failure.", i=i, g=g, e=e):
+                node = external_breadth_first_search(GraphProblem(i, g, graph), 256, self.directory.name, loc)
+
+                if type(e) != list:
+                    self.assertEqual(node, e)
+                else:
+                    self.assertEqual(node.get_path(), e)
+
+    def test_external_breadth_first_search_spills(self):
+        problem = GraphProblem((0, 0), {(19, 19)}, self.grid)
+
+        node = external_breadth_first_search(problem, 512, self.directory.name)
+
+        self.assertEqual(node.depth, breadth_first_search(problem).depth)
+
+    @unittest.skipUnless(resource is not None and os.path.isdir("/proc/self/fd"), "needs resource limits and /proc")
+    def test_external_breadth_first_search_open_files(self):
+        wide = Graph([(0, i) for i in range(1, 3001)] + [(i, 3001 + i % 7) for i in range(1, 3001)], directed=True)
+        deep = Graph([(i, i + 1) for i in range(40)], directed=True)
+        test_data = [(wide, 3007, 2), (wide, 3008, None), (deep, 40, 40)]
+
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (len(os.listdir("/proc/self/fd")) + 64, hard))
+
+        try:
+            for graph, g, e in test_data:
+                with self.subTest("Should have merged the runs and layers instead of opening all of them.", g=g):
+                    node = external_breadth_first_search(GraphProblem(0, {g}, graph), 1000, self.directory.name)
+
+                    self.assertEqual(node.depth if node is not failure else None, e)
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+    def test_external_uniform_cost_search(self):
+        test_data = [("Arad", {"Bucharest"}, ["Pitesti", "Rimnicu Vilcea", "Sibiu", "Arad"]),
+                     ("Arad", {"Craiova"}, ["Rimnicu Vilcea", "Sibiu", "Arad"]),
+                     ("Arad", {"Arad"}, []),
+                     ("Arad", {"Unknown"}, failure)]
+
+        for i, g, e in test_data:
+            with self.subTest("Should have returned the uniform-cost solution or failure.", i=i, g=g, e=e):
+                node = external_uniform_cost_search(GraphProblem(i, g, romania_road_map), 256, self.directory.name)
+
+                if type(e) != list:
+                    self.assertEqual(node, e)
+                else:
+                    self.assertEqual(node.get_path(), e)
+
+    def test_external_uniform_cost_search_spills(self):
+        for g in [(19, 19), (0, 19), (10, 3)]:
+            with self.subTest("Should have found a path as short as uniform-cost search.", g=g):
+                problem = GraphProblem((0, 0), {g}, self.grid)
+
+                node = external_uniform_cost_search(problem, 2048, self.directory.name)
+
+                self.assertEqual(node.path_cost, uniform_cost_search(problem).path_cost)
+                self.assertEqual(node.state, g)
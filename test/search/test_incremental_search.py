@@ -0,0 +1,117 @@
+import random
+import unittest
+
+from datastructures import Graph, romania_road_map
+from problem.node import failure
+from problem.problem import GraphProblem
+from search.incremental_search import LifelongPlanningAStar
+from search.uninformed_search import uniform_cost_search
+from test.search.fixtures import bucharest_heuristic
+
+
+class TestLifelongPlanningAStar(unittest.TestCase):
+    def test_plan(self):
+        graph = Graph([(v, n, c) for v in romania_road_map.get_vertices() for n, c in romania_road_map.get_edges(v)])
+        planner = LifelongPlanningAStar(GraphProblem("Arad", {"Bucharest"}, graph), bucharest_heuristic)
+
+        test_data = [(None, ["Pitesti", "Rimnicu Vilcea", "Sibiu", "Arad"], 418),
+                     (("Rimnicu Vilcea", "Pitesti", 500), ["Fagaras", "Sibiu", "Arad"], 450),
+                     (("Rimnicu Vilcea", "Pitesti", 97), ["Pitesti", "Rimnicu Vilcea", "Sibiu", "Arad"], 418),
+                     (("Arad", "Sibiu", None), ["Pitesti", "Rimnicu Vilcea", "Sibiu", "Oradea", "Zerind", "Arad"],
+                      575),
+                     (("Oradea", "Sibiu", None), ["Pitesti", "Craiova", "Drobeta", "Mehadia", "Lugoj", "Timisoara",
+                                                  "Arad"], 733)]
+
+        for c, e, ec in test_data:
+            with self.subTest("Should have returned the optimal solution after the change.", c=c, e=e, ec=ec):
+                if c is not None:
+                    f, t, cost = c
+                    if cost is None:
+                        graph.remove_edge(f, t)
+                    else:
+                        graph.set_edge_cost(f, t, cost)
+
+                node = planner.plan()
+
+                self.assertEqual(node.get_path(), e)
+                self.assertEqual(node.path_cost, ec)
+
+        graph.remove_edge("Arad", "Timisoara")
+        self.assertEqual(planner.plan(), failure)
+
+    def test_incremental_changes(self):
+        rng = random.Random(5)
+        graph = Graph([(rng.randrange(200), rng.randrange(200), rng.randint(1, 20)) for _ in range(800)],
+                      directed=True)
+        problem = GraphProblem(0, {199, 198}, graph)
+        planner = LifelongPlanningAStar(problem)
+
+        planner.plan()
+
+        for _ in range(30):
+            f, t = rng.randrange(200), rng.randrange(200)
+            if rng.random() < 0.3:
+                graph.remove_edge(f, t)
+            else:
+                graph.set_edge_cost(f, t, rng.randint(1, 20))
+
+            expansions = planner.get_expansions()
+            node = planner.plan()
+
+            with self.subTest("Should have returned a solution as cheap as uniform-cost search.", f=f, t=t):
+                self.assertEqual(node.path_cost, uniform_cost_search(problem).path_cost)
+
+            fresh_planner = LifelongPlanningAStar(GraphProblem(0, {199, 198}, graph))
+            fresh_planner.plan()
+
+            with self.subTest("Should have expanded every vertex at most twice, as many as searching again.", f=f, t=t):
+                self.assertLessEqual(planner.get_expansions() - expansions, 2 * fresh_planner.get_expansions())
+
+        unreachable = next(v for v in range(200) if uniform_cost_search(GraphProblem(0, {v}, graph)) is failure)
+        graph.set_edge_cost(unreachable, 199, 1)
+        expansions = planner.get_expansions()
+        planner.plan()
+
+        with self.subTest("Should not have expanded any vertex after changing an edge the search does not reach."):
+            self.assertEqual(planner.get_expansions(), expansions)
+
+    def test_truncated_changes(self):
+        graph = Graph([("A", "B", 1), ("B", "C", 1), ("A", "C", 5)], directed=True, change_log_size=4)
+        planner = LifelongPlanningAStar(GraphProblem("A", {"C"}, graph))
+        planner.plan()
+
+        for cost in range(10, 20):
+            graph.set_edge_cost("B", "C", cost)
+        node = planner.plan()
+
+        with self.subTest("Should have searched again once the changes since its last plan were discarded."):
+            self.assertEqual(node.get_path(), ["A"])
+            self.assertEqual(node.path_cost, 5)
+
+
+class TestGraphChanges(unittest.TestCase):
+    def test_changes(self):
+        graph = Graph([("A", "B", 1), ("B", "C", 2)])
+
+        version = graph.get_version()
+        graph.set_edge_cost("A", "B", 5)
+        graph.remove_edge("B", "C")
+
+        self.assertEqual(graph.get_version(), version + 2)
+        self.assertEqual(graph.get_changes(version), [("A", "B"), ("B", "A"), ("B", "C"), ("C", "B")])
+        self.assertEqual(graph.get_changes(version + 1), [("B", "C"), ("C", "B")])
+        self.assertEqual(graph.get_edges("A"), {("B", 5)})
+        self.assertEqual(graph.get_edges("B"), {("A", 5)})
+        self.assertEqual(graph.get_edges("C"), set())
+
+    def test_change_log_size(self):
+        graph = Graph([("A", "B", 1)], directed=True, change_log_size=4)
+
+        for cost in range(2, 7):
+            graph.set_edge_cost("A", "B", cost)
+
+        with self.subTest("Should have kept the latest changes."):
+            self.assertEqual(graph.get_changes(graph.get_version() - 2), [("A", "B"), ("A", "B")])
+
+        with self.subTest("Should have signalled that older changes were discarded."):
+            self.assertIsNone(graph.get_changes(0))
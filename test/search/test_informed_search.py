@@ -0,0 +1,103 @@
+import random
+import unittest
+
+from datastructures import Graph, binary_tree, romania_road_map
+from problem.node import failure
+from problem.problem import GraphProblem
+from search.informed_search import (astar_search, beam_search, iterative_deepening_astar_search,
+                                    recursive_best_first_search, simplified_memory_bounded_astar_search)
+from search.uninformed_search import breadth_first_search, uniform_cost_search
+from test.search.fixtures import bucharest_heuristic, zero_heuristic
+
+
+class TestInformedSearch(unittest.TestCase):
+    def setUp(self):
+        self.algorithms = [astar_search,
+                           iterative_deepening_astar_search,
+                           recursive_best_first_search,
+                           lambda p, h: simplified_memory_bounded_astar_search(p, h, 8)]
+
+    def test_romania(self):
+        test_data = [("Arad", {"Bucharest"}, bucharest_heuristic, ["Pitesti", "Rimnicu Vilcea", "Sibiu", "Arad"]),
+                     ("Arad", {"Craiova"}, zero_heuristic, ["Rimnicu Vilcea", "Sibiu", "Arad"]),
+                     ("Arad", {"Arad"}, zero_heuristic, [])]
+
+        self.__with_graph_problem(test_data, romania_road_map)
+
+    def test_binary_tree(self):
+        test_data = [("A", {"M"}, zero_heuristic, ["F", "C", "A"]), ("A", {"Z"}, zero_heuristic, failure)]
+
+        self.__with_graph_problem(test_data, binary_tree)
+
+    def test_random_graphs(self):
+        rng = random.Random(3)
+
+        for n in range(5):
+            graph = Graph([(rng.randrange(30), rng.randrange(30), rng.randint(1, 20)) for _ in range(60)])
+            problem = GraphProblem(0, {29}, graph)
+            expected = uniform_cost_search(problem).path_cost
+
+            for a in self.algorithms[:-1] + [lambda p, h: simplified_memory_bounded_astar_search(p, h, 30)]:
+                with self.subTest("Should have found an optimal solution.", n=n, a=a):
+                    self.assertEqual(a(problem, zero_heuristic).path_cost, expected)
+
+    def test_simplified_memory_bounded_astar_search_ceiling(self):
+        problem = GraphProblem("Arad", {"Bucharest"}, romania_road_map)
+
+        self.assertEqual(simplified_memory_bounded_astar_search(problem, bucharest_heuristic, 3), failure)
+        self.assertEqual(simplified_memory_bounded_astar_search(problem, bucharest_heuristic, 5).path_cost, 418)
+
+    def test_simplified_memory_bounded_astar_search_tight_ceiling(self):
+        rng = random.Random(30)
+
+        for n in range(100):
+            size = rng.randint(5, 40)
+            graph = Graph([(rng.randrange(size), rng.randrange(size), rng.randint(1, 20))
+                           for _ in range(rng.randint(size, 3 * size))], directed=rng.random() < 0.5)
+            problem = GraphProblem(0, {size - 1}, graph)
+            expected = uniform_cost_search(problem)
+
+            if expected is failure:
+                continue
+
+            for max_nodes in [expected.depth + 1, expected.depth + 2]:
+                with self.subTest("Should have found an optimal solution which fits in memory.", n=n, m=max_nodes):
+                    node = simplified_memory_bounded_astar_search(problem, zero_heuristic, max_nodes)
+                    self.assertEqual(node.path_cost, expected.path_cost)
+                    self.assertLessEqual(node.depth + 1, max_nodes)
+
+    def test_beam_search(self):
+        problem = GraphProblem("Arad", {"Bucharest"}, romania_road_map)
+
+        with self.subTest("Should have followed the greedy path with a beam of width 1."):
+            self.assertEqual(beam_search(problem, bucharest_heuristic, 1).get_path(), ["Fagaras", "Sibiu", "Arad"])
+
+        with self.subTest("Should have returned failure when there is no solution."):
+            self.assertEqual(beam_search(GraphProblem("A", {"Z"}, binary_tree), zero_heuristic, 4), failure)
+
+        graph = Graph([("S", "A"), ("S", "B"), ("A", "C"), ("B", "C"), ("B", "D"), ("D", "G")], directed=True)
+        ranks = {"S": 0, "A": 0, "B": 0, "C": 0, "D": 1, "G": 0}
+
+        with self.subTest("Should have kept a single node of a state reached twice, leaving room for other states."):
+            node = beam_search(GraphProblem("S", {"G"}, graph), lambda n: ranks[n.state], 2)
+            self.assertEqual(node.get_path(), ["D", "B", "S"])
+
+        rng = random.Random(5)
+
+        for n in range(5):
+            graph = Graph([(rng.randrange(30), rng.randrange(30), rng.randint(1, 20)) for _ in range(60)])
+            problem = GraphProblem(0, {29}, graph)
+
+            with self.subTest("Should have found a shallowest solution with a beam as wide as the graph.", n=n):
+                self.assertEqual(beam_search(problem, zero_heuristic, 30).depth, breadth_first_search(problem).depth)
+
+    def __with_graph_problem(self, test_data, graph):
+        for i, g, h, e in test_data:
+            for a in self.algorithms:
+                with self.subTest("Should have returned a solution or failure.", i=i, g=g, e=e, a=a):
+                    node = a(GraphProblem(i, g, graph), h)
+
+                    if type(e) != list:
+                        self.assertEqual(node, e)
+                    else:
+                        self.assertEqual(node.get_path(), e)
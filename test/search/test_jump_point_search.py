@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from problem.implicit import GridProblem
+from problem.node import failure
+from search.informed_search import astar_search
+from search.jump_point_search import JumpTable, jump_point_search
+
+
+class TestJumpPointSearch(unittest.TestCase):
+    def setUp(self):
+        self.rows = ["S.......#.......",
+                     "........#.......",
+                     "...###..#..###..",
+                     "...#....#....#..",
+                     "...#.........#.G",
+                     "...######.####..",
+                     "................"]
+
+    def test_jump_point_search(self):
+        problem = GridProblem.from_strings(self.rows, diagonal=True)
+        expected = astar_search(problem, problem.octile_heuristic)
+
+        for t in [None, JumpTable(problem)]:
+            node = jump_point_search(problem, t)
+
+            with self.subTest("Should have returned an optimal solution.", table=t is not None):
+                self.assertAlmostEqual(node.path_cost, expected.path_cost)
+
+            with self.subTest("Should have returned every cell of the path.", table=t is not None):
+                path = node.get_path()[::-1] + [node.state]
+                self.assertEqual(path[0], problem.initial_state)
+                for s, n in zip(path, path[1:]):
+                    self.assertIn(n, [a[0] for a in problem.get_actions(s)])
+
+    def test_random_grids(self):
+        rng = random.Random(6)
+
+        for i in range(30):
+            obstacles = {(rng.randrange(24), rng.randrange(24)) for _ in range(rng.randrange(150))}
+            free = [(x, y) for x in range(24) for y in range(24) if (x, y) not in obstacles]
+            problem = GridProblem(24, 24, obstacles, rng.choice(free), rng.sample(free, 2), diagonal=True)
+            expected = astar_search(problem, problem.octile_heuristic).path_cost
+
+            with self.subTest("Should have returned a solution as cheap as A*.", i=i):
+                for node in [jump_point_search(problem), jump_point_search(problem, JumpTable(problem))]:
+                    self.assertTrue(node.path_cost == expected or abs(node.path_cost - expected) < 1e-9)
+
+    def test_edge_cases(self):
+        with self.subTest("Should have returned failure for an enclosed goal."):
+            self.assertEqual(jump_point_search(GridProblem.from_strings(["S.#.",
+                                                                         "..#G"], diagonal=True)), failure)
+
+        with self.subTest("Should have returned the root when the initial cell is a goal."):
+            problem = GridProblem(3, 3, [], (1, 1), [(1, 1)], diagonal=True)
+            self.assertEqual(jump_point_search(problem).state, problem.initial_state)
+
+        with self.subTest("Should have raised an exception for a 4-connected grid."):
+            self.assertRaises(ValueError, jump_point_search, GridProblem.from_strings(["SG"]))
@@ -0,0 +1,64 @@
+import random
+import unittest
+
+from datastructures import Graph, romania_road_map
+from problem.problem import GraphProblem
+from search.k_shortest_paths import k_shortest_paths
+
+
+def _get_simple_path_costs(graph, start, goals):
+    costs = []
+    stack = [(start, {start}, 0)]
+
+    while stack:
+        v, states, cost = stack.pop()
+        if v in goals:
+            costs.append(cost)
+            continue
+        for n, c in graph.get_edges(v):
+            if n not in states:
+                stack.append((n, states | {n}, cost + c))
+
+    return sorted(costs)
+
+
+class TestKShortestPaths(unittest.TestCase):
+    def test_k_shortest_paths(self):
+        problem = GraphProblem("Arad", {"Bucharest"}, romania_road_map)
+
+        test_data = [(["Pitesti", "Rimnicu Vilcea", "Sibiu", "Arad"], 418),
+                     (["Fagaras", "Sibiu", "Arad"], 450),
+                     (["Pitesti", "Rimnicu Vilcea", "Sibiu", "Oradea", "Zerind", "Arad"], 575)]
+
+        for node, (e, ec) in zip(k_shortest_paths(problem, 3), test_data):
+            with self.subTest("Should have returned the paths in the order of their costs.", e=e, ec=ec):
+                self.assertEqual(node.get_path(), e)
+                self.assertEqual(node.path_cost, ec)
+
+        with self.subTest("Should have generated at most k paths."):
+            self.assertEqual(len(list(k_shortest_paths(problem, 5))), 5)
+            self.assertEqual(list(k_shortest_paths(problem, 0)), [])
+
+        with self.subTest("Should have generated nothing for an unreachable goal."):
+            graph = Graph([("A", "B", 1), ("C", "D", 1)])
+            self.assertEqual(list(k_shortest_paths(GraphProblem("A", {"D"}, graph))), [])
+
+    def test_all_simple_paths(self):
+        rng = random.Random(3)
+
+        for i in range(20):
+            edges = {(rng.randrange(9), rng.randrange(9)): rng.randint(1, 10) for _ in range(18)}
+            graph = Graph([(f, t, c) for (f, t), c in edges.items() if f != t and (t, f) not in edges],
+                          directed=bool(i % 2))
+            if 0 not in graph.get_vertices():
+                continue
+            goals = {8, 7}
+            nodes = list(k_shortest_paths(GraphProblem(0, goals, graph)))
+
+            with self.subTest("Should have generated every simple path, cheapest first.", i=i):
+                self.assertEqual([n.path_cost for n in nodes], _get_simple_path_costs(graph, 0, goals))
+
+            with self.subTest("Should have generated distinct paths.", i=i):
+                paths = [tuple(n.get_path()) + (n.state,) for n in nodes]
+                self.assertEqual(len(set(paths)), len(paths))
+                self.assertTrue(all(len(set(p)) == len(p) for p in paths))
@@ -0,0 +1,180 @@
+import itertools
+import os
+import random
+import subprocess
+import sys
+import unittest
+
+from datastructures import CompactGraph, FrozenGraph, Graph, binary_tree, romania_road_map
+from problem.node import failure
+from problem.problem import GraphProblem
+from search.parallel_search import (attach_graph, batch_best_first_search, share_graph,
+                                    parallel_breadth_first_search, stable_partition, threaded_batch_search)
+from search.uninformed_search import breadth_first_search, uniform_cost_search
+
+
+class FailingProblem(GraphProblem):
+    """A graph problem whose actions cannot be listed for one state."""
+
+    def __init__(self, initial_state, goal_states, graph, failing_state):
+        super().__init__(initial_state, goal_states, graph)
+        self.failing_state = failing_state
+
+    def get_actions(self, state):
+        if state == self.failing_state:
+            raise KeyError(state)
+        return super().get_actions(state)
+
+
+class EncodedProblem(GraphProblem):
+    """A graph problem over tuples, which encodes its states as strings."""
+
+    def encode_state(self, state):
+        return "-".join(state)
+
+
+def partition_encoding(code, partitions):
+    if not isinstance(code, str):
+        raise TypeError(code)
+    return len(code) % partitions
+
+
+class TestSharedGraph(unittest.TestCase):
+    def test_attach_graph(self):
+        memory = share_graph(CompactGraph.from_graph(romania_road_map))
+
+        try:
+            graph = attach_graph(memory)
+
+            self.assertEqual(graph.get_vertices(), romania_road_map.get_vertices())
+            for v in romania_road_map.get_vertices():
+                with self.subTest("Should have returned the same edges as the original graph.", v=v):
+                    self.assertEqual(graph.get_edges(v), romania_road_map.get_edges(v))
+
+            del graph
+        finally:
+            memory.close()
+            memory.unlink()
+
+
+class TestBatchBestFirstSearch(unittest.TestCase):
+    def test_batch_best_first_search(self):
+        queries = [("Arad", {"Bucharest"}), ("Arad", {"Craiova"}), ("Arad", {"Arad"}),
+                   ("Neamt", {"Drobeta"}), ("Arad", {"Unknown"})] * 3
+
+        results = list(batch_best_first_search(romania_road_map, queries, workers=2, chunksize=2))
+
+        self.assertEqual(len(results), len(queries))
+        for (i, g), node in zip(queries, results):
+            with self.subTest("Should have returned the uniform-cost solution, in order.", i=i, g=g):
+                expected = uniform_cost_search(GraphProblem(i, g, romania_road_map))
+
+                if expected is failure:
+                    self.assertIs(node, failure)
+                else:
+                    self.assertEqual(node.state, expected.state)
+                    self.assertEqual(node.path_cost, expected.path_cost)
+                    self.assertEqual(node.get_path(), expected.get_path())
+
+
+class TestThreadedBatchSearch(unittest.TestCase):
+    def test_threaded_batch_search(self):
+        rng = random.Random(7)
+        graph = FrozenGraph.from_graph(Graph([(rng.randrange(300), rng.randrange(300), rng.randint(1, 50))
+                                              for _ in range(900)]))
+        queries = [(rng.randrange(300), {rng.randrange(300)}) for _ in range(200)]
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        try:
+            for algorithm in [uniform_cost_search, breadth_first_search]:
+                expected = [algorithm(GraphProblem(i, g, graph)) for i, g in queries]
+
+                for run in range(3):
+                    results = list(threaded_batch_search(graph, queries, algorithm, workers=8))
+
+                    with self.subTest("Should have returned the sequential results under concurrency.",
+                                      algorithm=algorithm, run=run):
+                        self.assertEqual([(n.state, n.path_cost, n.get_path()) for n in results],
+                                         [(n.state, n.path_cost, n.get_path()) for n in expected])
+        finally:
+            sys.setswitchinterval(interval)
+
+
+class TestStablePartition(unittest.TestCase):
+    def test_stable_partition(self):
+        test_data = [[1, 1.0, True],
+                     [frozenset(["a", "b", "c"]), frozenset(["c", "b", "a"]), {"b", "a", "c"}],
+                     [(frozenset([1, "x"]), 0.0), (frozenset(["x", 1.0]), False)],
+                     [("state", "state"), ("state", "".join(["sta", "te"]))]]
+
+        for states in test_data:
+            with self.subTest("Should have assigned equal states to the same partition.", states=states):
+                self.assertEqual(len({stable_partition(s, 1 << 30) for s in states}), 1)
+
+    def test_stable_partition_hash_seed(self):
+        state = frozenset("state-{}".format(i) for i in range(20))
+        script = "from search.parallel_search import stable_partition; " \
+                 "print(stable_partition(frozenset('state-{}'.format(i) for i in range(20)), 1 << 30))"
+
+        partitions = set()
+        for seed in ["1", "2", "3"]:
+            output = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True, text=True,
+                                    env=dict(os.environ, PYTHONHASHSEED=seed)).stdout
+            partitions.add(int(output))
+
+        with self.subTest("Should have assigned the state to the same partition whatever the hash seed."):
+            self.assertEqual(partitions, {stable_partition(state, 1 << 30)})
+
+
+class TestParallelBreadthFirstSearch(unittest.TestCase):
+    def test_parallel_breadth_first_search(self):
+        test_data = [("Arad", {"Bucharest"}, ["Fagaras", "Sibiu", "Arad"], romania_road_map),
+                     ("Arad", {"Craiova"}, ["Rimnicu Vilcea", "Sibiu", "Arad"], romania_road_map),
+                     ("Arad", {"Arad"}, [], romania_road_map),
+                     ("Arad", {"Unknown"}, failure, romania_road_map),
+                     ("A", {"M"}, ["F", "C", "A"], binary_tree)]
+
+        for i, g, e, graph in test_data:
+            with self.subTest("Should have returned the breadth-first solution or failure.", i=i, g=g, e=e):
+                node = parallel_breadth_first_search(GraphProblem(i, g, graph), workers=3)
+
+                if type(e) != list:
+                    self.assertEqual(node, e)
+                else:
+                    self.assertEqual(node.get_path(), e)
+                    self.assertEqual(node.state, next(iter(g)))
+
+    def test_parallel_breadth_first_search_frozenset_states(self):
+        letters = "abcdef"
+        subsets = [frozenset(c) for n in range(len(letters)) for c in itertools.combinations(letters, n)]
+        graph = Graph([(s, s | {x}) for s in subsets for x in letters if x not in s], directed=True)
+        problem = GraphProblem(frozenset(), {frozenset(letters)}, graph)
+
+        node = parallel_breadth_first_search(problem, workers=3)
+
+        self.assertEqual(node.depth, len(letters))
+        self.assertEqual(node.state, frozenset(letters))
+
+    def test_parallel_breadth_first_search_encoded_states(self):
+        graph = Graph([(("a",), ("a", "b")), (("a", "b"), ("a", "b", "c")),
+                       (("a",), ("c",)), (("c",), ("a", "b", "c"))])
+        problem = EncodedProblem(("a",), {("a", "b", "c")}, graph)
+
+        node = parallel_breadth_first_search(problem, workers=2, partition_function=partition_encoding)
+
+        self.assertEqual(node.depth, 2)
+
+    def test_parallel_breadth_first_search_none_state(self):
+        graph = Graph([(None, "B"), ("B", "C"), ("C", None)], directed=True)
+        node = parallel_breadth_first_search(GraphProblem(None, {"C"}, graph), workers=2)
+
+        self.assertEqual(node.get_path(), ["B", None])
+
+    def test_parallel_breadth_first_search_worker_error(self):
+        problem = FailingProblem("Arad", {"Bucharest"}, romania_road_map, "Sibiu")
+
+        with self.subTest("Should have raised the exception of the worker instead of hanging."):
+            with self.assertRaises(KeyError):
+                parallel_breadth_first_search(problem, workers=3)
@@ -0,0 +1,93 @@
+import os
+import random
+import tempfile
+import unittest
+
+from problem.implicit import SlidingPuzzleProblem, pack_tiles
+from problem.node import Node
+from search.informed_search import astar_search, iterative_deepening_astar_search
+from search.pattern_database import PatternDatabase, additive_heuristic
+from search.uninformed_search import breadth_first_search
+
+
+def _random_tiles(rng, size, moves):
+    problem = SlidingPuzzleProblem(list(range(1, size * size)) + [0])
+    state = problem.initial_state
+
+    for _ in range(moves):
+        state = rng.choice(problem.get_actions(state))[0]
+
+    return state
+
+
+class TestPatternDatabase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.problem = SlidingPuzzleProblem(list(range(1, 9)) + [0])
+        cls.databases = [PatternDatabase.build(cls.problem, p) for p in [(1, 2, 3, 4), (5, 6, 7, 8)]]
+
+    def test_additive_heuristic(self):
+        rng = random.Random(4)
+        heuristic = additive_heuristic(*self.databases)
+
+        for _ in range(15):
+            state = _random_tiles(rng, 3, 40)
+            node = Node(state=state)
+            problem = SlidingPuzzleProblem([0] * 9)
+            problem.initial_state, problem.goal_states = state, self.problem.goal_states
+            exact = breadth_first_search(problem).depth
+
+            with self.subTest("Should have never overestimated the distance to the goal.", state=state):
+                self.assertLessEqual(heuristic(node), exact)
+
+            with self.subTest("Should have dominated the Manhattan distance.", state=state):
+                self.assertGreaterEqual(heuristic(node), problem.manhattan_heuristic(node))
+
+    def test_search(self):
+        test_data = [([8, 6, 7, 2, 5, 4, 3, 0, 1], 31), ([1, 2, 3, 4, 0, 5, 7, 8, 6], 2)]
+
+        for t, e in test_data:
+            problem = SlidingPuzzleProblem(t)
+
+            with self.subTest("Should have found an optimal solution with A* and IDA*.", t=t, e=e):
+                self.assertEqual(astar_search(problem, additive_heuristic(*self.databases)).depth, e)
+                self.assertEqual(iterative_deepening_astar_search(problem, additive_heuristic(*self.databases)).depth,
+                                 e)
+
+    def test_load(self):
+        state = pack_tiles([8, 6, 7, 2, 5, 4, 3, 0, 1])
+
+        with tempfile.TemporaryDirectory() as d:
+            for i, database in enumerate(self.databases):
+                path = os.path.join(d, f"{i}.pdb")
+                database.save(path)
+                loaded = PatternDatabase.load(path)
+
+                with self.subTest("Should have loaded the saved database.", pattern=database.pattern):
+                    self.assertEqual(loaded.pattern, database.pattern)
+                    self.assertEqual(loaded.get_distance(state), database.get_distance(state))
+
+                del loaded
+
+            with self.subTest("Should have loaded a database storing a distance per byte."):
+                path = os.path.join(d, "bytes.pdb")
+                PatternDatabase(3, (1,), bytes(range(20, 29)), False).save(path)
+                self.assertEqual(PatternDatabase.load(path).get_distance(state), 28)
+
+            with self.subTest("Should have raised an exception for a file which is not a pattern database."):
+                path = os.path.join(d, "invalid.pdb")
+                with open(path, "wb") as f:
+                    f.write(b"\0" * 32)
+                self.assertRaises(ValueError, PatternDatabase.load, path)
+
+    def test_fifteen_puzzle(self):
+        problem = SlidingPuzzleProblem(list(range(1, 16)) + [0])
+        databases = [PatternDatabase.build(problem, p) for p in [(1, 2, 5), (3, 4, 8)]]
+        rng = random.Random(8)
+
+        for _ in range(3):
+            problem.initial_state = _random_tiles(rng, 4, 30)
+            expected = astar_search(problem, problem.manhattan_heuristic).depth
+
+            with self.subTest("Should have found an optimal solution.", state=problem.initial_state):
+                self.assertEqual(astar_search(problem, additive_heuristic(*databases)).depth, expected)
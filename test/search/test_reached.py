@@ -0,0 +1,78 @@
+import math
+import pickle
+import unittest
+
+from datastructures import romania_road_map
+from problem.problem import GraphProblem
+from search.reached import BloomReachedSet, EncodedReachedSet, ParentIndexTable, StateReachedSet
+from search.uninformed_search import breadth_first_search, best_first_search
+from search.helpers import path_cost_evaluation_function
+
+
+class IndexedGraphProblem(GraphProblem):
+    def __init__(self, initial_state, goal_states, graph):
+        super().__init__(initial_state, goal_states, graph)
+        self.vertices = sorted(graph.get_vertices())
+        self.indices = {v: i for i, v in enumerate(self.vertices)}
+
+    def encode_state(self, state):
+        return self.indices[state]
+
+    def decode_state(self, code):
+        return self.vertices[code]
+
+
+class TestReachedSets(unittest.TestCase):
+    def setUp(self):
+        self.problem = IndexedGraphProblem("Arad", {"Bucharest"}, romania_road_map)
+
+    def test_searches(self):
+        test_data = [(StateReachedSet, ["Pitesti", "Rimnicu Vilcea", "Sibiu", "Arad"]),
+                     (lambda: EncodedReachedSet(self.problem), ["Pitesti", "Rimnicu Vilcea", "Sibiu", "Arad"]),
+                     (lambda: ParentIndexTable(self.problem), ["Pitesti", "Rimnicu Vilcea", "Sibiu", "Arad"]),
+                     (lambda: BloomReachedSet(100, 0.001), ["Fagaras", "Sibiu", "Arad"])]
+
+        for r, e in test_data:
+            with self.subTest("Should have found the same solution as the default reached set.", r=r, e=e):
+                node = best_first_search(self.problem, path_cost_evaluation_function, r())
+                self.assertEqual(node.get_path(), e)
+
+                node = breadth_first_search(self.problem, r())
+                self.assertEqual(node.get_path(), ["Fagaras", "Sibiu", "Arad"])
+
+    def test_parent_index_table(self):
+        reached = ParentIndexTable(self.problem)
+
+        node = best_first_search(self.problem, path_cost_evaluation_function, reached)
+
+        self.assertEqual(reached.get_path("Bucharest"), node.get_path())
+        self.assertEqual(reached.get_path_cost("Bucharest"), node.path_cost)
+        self.assertEqual(reached.get_path("Arad"), [])
+
+    def test_bloom_reached_set(self):
+        reached = BloomReachedSet(1000, 0.01)
+        states = [str(i) for i in range(1000)]
+
+        for s in states:
+            reached.add(s)
+
+        self.assertTrue(all(s in reached for s in states))
+        self.assertLess(sum(str(-i) in reached for i in range(1, 1001)), 50)
+        self.assertEqual(reached.get_path_cost("1"), -math.inf)
+
+        with self.subTest("Should have kept the reached states when pickled."):
+            self.assertTrue(all(s in pickle.loads(pickle.dumps(reached)) for s in states))
+
+        for capacity, error_rate in [(0, 0.01), (-1, 0.01), (10, 0), (10, 1)]:
+            with self.subTest("Should have raised an exception for invalid parameters.", capacity=capacity,
+                              error_rate=error_rate):
+                self.assertRaises(ValueError, BloomReachedSet, capacity, error_rate)
+
+    def test_get_memory_usage(self):
+        states, bloom = StateReachedSet(), BloomReachedSet(10000, 0.01)
+
+        for i in range(10000):
+            states.add("state {}".format(i), i)
+            bloom.add("state {}".format(i), i)
+
+        self.assertGreater(states.get_memory_usage(), 10 * bloom.get_memory_usage())
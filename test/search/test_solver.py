@@ -0,0 +1,148 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from datastructures import Graph, romania_road_map
+from problem.implicit import GridProblem
+from problem.node import failure
+from problem.problem import GraphProblem, Problem
+from search.solver import get_statistics, solve
+from search.uninformed_search import breadth_first_search, uniform_cost_search
+from test.search.fixtures import bucharest_heuristic
+
+
+class ShortcutLineProblem(Problem):
+    """A line of states 0..length with actions of cost 1, the states from 50 on also have a shortcut of cost 1000
+    to the last state, so a sample of the first states sees uniform costs only."""
+
+    def __init__(self, length):
+        super().__init__(initial_state=0, goal_states={length})
+        self.length = length
+
+    def get_actions(self, state):
+        actions = [(state + 1, 1)] if state < self.length else []
+        return actions + [(self.length, 1000)] if 50 <= state < self.length - 1 else actions
+
+    def apply_action(self, action):
+        return action[0]
+
+    def get_action_cost(self, action):
+        return action[1]
+
+
+class InfiniteTreeProblem(Problem):
+    """An infinite tree of integers, in which every state n has a child 2n + 1 and states divisible by 3
+    have a second child 2n + 2, so that its branching factor is about 4 / 3."""
+
+    def __init__(self, goal_state):
+        super().__init__(initial_state=0, goal_states={goal_state})
+
+    def get_actions(self, state):
+        return [(2 * state + 1, 1)] + ([(2 * state + 2, 1)] if state % 3 == 0 else [])
+
+    def apply_action(self, action):
+        return action[0]
+
+    def get_action_cost(self, action):
+        return action[1]
+
+
+class TestSolve(unittest.TestCase):
+    def test_romania(self):
+        problem = GraphProblem("Arad", {"Bucharest"}, romania_road_map)
+        reverse_problem = GraphProblem("Bucharest", {"Arad"}, romania_road_map)
+
+        test_data = [({}, "uniform_cost_search"),
+                     ({"reverse_problem": reverse_problem}, "bidirectional_best_first_search"),
+                     ({"heuristic": bucharest_heuristic}, "astar_search")]
+
+        for arguments, e in test_data:
+            result = solve(problem, **arguments)
+
+            with self.subTest("Should have chosen the suitable algorithm.", e=e):
+                self.assertEqual(result.algorithm, e)
+
+            with self.subTest("Should have returned an optimal solution.", e=e):
+                self.assertEqual(result.node.path_cost, 418)
+                self.assertEqual(result.node.get_path(), ["Pitesti", "Rimnicu Vilcea", "Sibiu", "Arad"])
+
+    def test_statistics(self):
+        graph = Graph([("A", "B"), ("B", "C"), ("C", "A")], directed=True)
+        statistics = get_statistics(GraphProblem("A", {"C"}, graph), reverse_problem=GraphProblem("C", {"A"}, graph))
+
+        self.assertEqual((statistics.states, statistics.actions, statistics.branching_factor), (3, 3, 1))
+        self.assertTrue(statistics.uniform_costs and statistics.has_reverse_problem)
+        self.assertFalse(statistics.has_heuristic)
+
+    def test_statistics_cache(self):
+        graph = Graph([("A", "B"), ("B", "C"), ("C", "A")], directed=True)
+        problem = GraphProblem("A", {"C"}, graph)
+
+        with patch.object(graph, "get_edges", wraps=graph.get_edges) as get_edges:
+            get_statistics(problem)
+            get_statistics(GraphProblem("B", {"A"}, graph))
+
+            with self.subTest("Should have inspected the graph once for queries on the same version."):
+                self.assertEqual(get_edges.call_count, 3)
+
+            graph.set_edge_cost("A", "C", 5)
+            statistics = get_statistics(problem)
+
+            with self.subTest("Should have inspected the graph again after it changed."):
+                self.assertEqual(get_edges.call_count, 6)
+                self.assertEqual(statistics.actions, 4)
+                self.assertFalse(statistics.uniform_costs)
+
+    def test_random_graphs(self):
+        rng = random.Random(13)
+
+        for n in range(10):
+            edges = [(rng.randrange(40), rng.randrange(40), rng.randint(1, 9) if n % 2 else 1) for _ in range(100)]
+            graph, reversed_graph = Graph(edges, directed=True), Graph([(t, f, c) for f, t, c in edges], directed=True)
+            problem, reverse_problem = GraphProblem(0, {39}, graph), GraphProblem(39, {0}, reversed_graph)
+            expected = uniform_cost_search(problem)
+
+            for r in [None, reverse_problem]:
+                result = solve(problem, reverse_problem=r)
+
+                with self.subTest("Should have used breadth-first searches only for uniform costs.", n=n, r=r):
+                    self.assertEqual("breadth_first" in result.algorithm, n % 2 == 0)
+
+                with self.subTest("Should have returned an optimal solution or failure.", n=n, r=r):
+                    if expected is failure:
+                        self.assertIs(result.node, failure)
+                    else:
+                        self.assertEqual(result.node.path_cost, expected.path_cost)
+                        self.assertEqual(result.node.state, 39)
+
+    def test_branching_factor(self):
+        test_data = [(GridProblem(100, 100, set(), (0, 0), [(3, 4)]), "fringe_search"),
+                     (InfiniteTreeProblem(2 ** 12 - 1), "breadth_first_search"),
+                     (InfiniteTreeProblem(2 ** 30 - 1), "breadth_first_search")]
+
+        for problem, e in test_data:
+            result = solve(problem, sample_size=1000, uniform_costs=True)
+
+            with self.subTest("Should have chosen iterative deepening only for large branching factors.", e=e):
+                self.assertIsNone(result.statistics.states)
+                self.assertEqual(result.statistics.branching_factor >= 2, e == "fringe_search")
+                self.assertEqual(result.algorithm, e)
+
+            with self.subTest("Should have returned a solution with the fewest actions.", e=e):
+                self.assertEqual(result.node.depth, breadth_first_search(problem).depth)
+
+    def test_sampled_costs(self):
+        problem = ShortcutLineProblem(200)
+        result = solve(problem, sample_size=10)
+
+        with self.subTest("Should not have trusted the uniform costs of the sample."):
+            self.assertIsNone(result.statistics.uniform_costs)
+            self.assertEqual(result.algorithm, "uniform_cost_search")
+            self.assertIn("sampled", result.reason)
+
+        with self.subTest("Should have returned an optimal solution, not the one with the fewest actions."):
+            self.assertEqual(result.node.path_cost, 200)
+            self.assertGreater(breadth_first_search(problem).path_cost, 200)
+
+        with self.subTest("Should have trusted the costs of an exhausted sample."):
+            self.assertFalse(solve(ShortcutLineProblem(200), sample_size=1000).statistics.uniform_costs)
@@ -1,10 +1,15 @@
+import random
 import unittest
+from unittest.mock import Mock
 
-from datastructures import binary_tree, romania_road_map
+from datastructures import Graph, binary_tree, romania_road_map
 from problem.node import cutoff, failure
 from problem.problem import GraphProblem
+from search.helpers import path_cost_evaluation_function, path_cost_has_terminated
 from search.uninformed_search import (uniform_cost_search, depth_limited_search, depth_first_search,
-                                      breadth_first_search, iterative_deepening_search)
+                                      breadth_first_search, iterative_deepening_search,
+                                      fringe_search, bidirectional_best_first_search,
+                                      bidirectional_breadth_first_search)
 
 
 class TestSearchAlgorithms(unittest.TestCase):
@@ -42,6 +47,126 @@ class TestSearchAlgorithms(unittest.TestCase):
 
         self.__with_graph_problem(test_data, binary_tree, iterative_deepening_search)
 
+    def test_fringe_search(self):
+        test_data = [("A", {"M"}, ["F", "C", "A"]), ("A", {"A"}, []), ("A", {"Z"}, failure)]
+
+        self.__with_graph_problem(test_data, binary_tree, fringe_search)
+
+        test_data = [("Arad", {"Bucharest"}, ["Fagaras", "Sibiu", "Arad"]), ("Arad", {"Unknown"}, failure)]
+
+        self.__with_graph_problem(test_data, romania_road_map, fringe_search)
+
+        rng = random.Random(11)
+
+        for n in range(5):
+            graph = Graph([(rng.randrange(40), rng.randrange(40)) for _ in range(80)])
+            problem = GraphProblem(0, {39}, graph)
+            expected = breadth_first_search(problem)
+
+            for table_size, fringe_size in [(2, 1), (2, 1000), (1000, 1), (1000, 1000)]:
+                with self.subTest("Should have found a solution with the fewest actions.",
+                                  n=n, table_size=table_size, fringe_size=fringe_size):
+                    solution = fringe_search(problem, table_size, fringe_size)
+                    self.assertEqual(solution.depth, expected.depth)
+
+    def test_fringe_search_duplicates(self):
+        grid = Graph([((x, y), (x + dx, y + dy)) for x in range(6) for y in range(6) for dx, dy in [(1, 0), (0, 1)]
+                      if x + dx < 6 and y + dy < 6])
+
+        test_data = [(iterative_deepening_search, "ids"),
+                     (fringe_search, "fringe"),
+                     (lambda p: fringe_search(p, fringe_size=1), "restart")]
+
+        expansions = {}
+        for a, name in test_data:
+            problem = GraphProblem((0, 0), {(5, 5)}, grid)
+            problem.get_actions = Mock(side_effect=problem.get_actions)
+
+            self.assertEqual(a(problem).depth, 10)
+            expansions[name] = problem.get_actions.call_count
+
+        with self.subTest("Should have expanded every state at most once when continuing from the fringe."):
+            self.assertLessEqual(expansions["fringe"], 36)
+
+        with self.subTest("Should have expanded every state once per iteration, not once per path, after restarts."):
+            self.assertLessEqual(expansions["restart"], 36 * 11)
+            self.assertLess(expansions["restart"] * 5, expansions["ids"])
+
+    def test_bidirectional_best_first_search(self):
+        test_data = [("Arad", "Bucharest", romania_road_map, ["Pitesti", "Rimnicu Vilcea", "Sibiu", "Arad"], 418),
+                     ("Arad", "Arad", romania_road_map, [], 0),
+                     ("Arad", "Zerind", romania_road_map, ["Arad"], 75),
+                     ("Arad", "Unknown", romania_road_map, failure, None),
+                     ("A", "B", Graph([("A", "B", 5), ("A", "C", 1), ("C", "B", 1)]), ["C", "A"], 2)]
+
+        for i, g, graph, e, c in test_data:
+            with self.subTest("Should have returned the cheapest solution or failure.", i=i, g=g, e=e):
+                node = bidirectional_best_first_search(GraphProblem(i, {g}, graph), path_cost_evaluation_function,
+                                                       GraphProblem(g, {i}, graph), path_cost_evaluation_function,
+                                                       path_cost_has_terminated)
+
+                if type(e) != list:
+                    self.assertEqual(node, e)
+                else:
+                    self.assertEqual(node.get_path(), e)
+                    self.assertEqual(node.state, g)
+                    self.assertEqual(node.path_cost, c)
+
+        rng = random.Random(5)
+        edges = [(rng.randrange(60), rng.randrange(60), rng.randint(1, 9)) for _ in range(150)]
+        graph, reversed_graph = Graph(edges, directed=True), Graph([(t, f, c) for f, t, c in edges], directed=True)
+
+        for _ in range(20):
+            i, g = rng.randrange(60), rng.randrange(60)
+
+            with self.subTest("Should have returned a path as cheap as uniform-cost search.", i=i, g=g):
+                node = bidirectional_best_first_search(GraphProblem(i, {g}, graph), path_cost_evaluation_function,
+                                                       GraphProblem(g, {i}, reversed_graph),
+                                                       path_cost_evaluation_function, path_cost_has_terminated)
+                expected = uniform_cost_search(GraphProblem(i, {g}, graph))
+
+                self.assertEqual(node.path_cost, expected.path_cost)
+                if node is not failure:
+                    path = node.get_path()[::-1] + [node.state]
+                    self.assertEqual((path[0], path[-1]), (i, g))
+                    self.assertTrue(all(any(t == b for t, _ in graph.get_edges(a)) for a, b in zip(path, path[1:])))
+
+    def test_bidirectional_breadth_first_search(self):
+        reversed_tree = Graph([(t, v) for v in binary_tree.get_vertices() for t, _ in binary_tree.get_edges(v)],
+                              directed=True)
+
+        test_data = [("Arad", "Bucharest", romania_road_map, romania_road_map, ["Fagaras", "Sibiu", "Arad"]),
+                     ("Arad", "Arad", romania_road_map, romania_road_map, []),
+                     ("Arad", "Unknown", romania_road_map, romania_road_map, failure),
+                     ("A", "K", binary_tree, reversed_tree, ["E", "B", "A"]),
+                     ("B", "G", binary_tree, reversed_tree, failure)]
+
+        for i, g, graph_f, graph_b, e in test_data:
+            with self.subTest("Should have returned a solution with the fewest actions or failure.", i=i, g=g, e=e):
+                node = bidirectional_breadth_first_search(GraphProblem(i, {g}, graph_f), GraphProblem(g, {i}, graph_b))
+
+                if type(e) != list:
+                    self.assertEqual(node, e)
+                else:
+                    self.assertEqual(node.get_path(), e)
+                    self.assertEqual(node.state, g)
+
+        rng = random.Random(9)
+        graph = Graph([(rng.randrange(500), rng.randrange(500), 1) for _ in range(900)])
+
+        for _ in range(20):
+            i, g = rng.randrange(500), rng.randrange(500)
+
+            with self.subTest("Should have returned a path as short as breadth-first search.", i=i, g=g):
+                node = bidirectional_breadth_first_search(GraphProblem(i, {g}, graph), GraphProblem(g, {i}, graph))
+                expected = breadth_first_search(GraphProblem(i, {g}, graph))
+
+                self.assertEqual(node.depth, expected.depth)
+                self.assertEqual(node.path_cost, expected.path_cost)
+                if node is not failure:
+                    path = node.get_path()[::-1] + [node.state]
+                    self.assertTrue(all(any(t == b for t, _ in graph.get_edges(a)) for a, b in zip(path, path[1:])))
+
     def __with_graph_problem(self, test_data, graph, algorithm):
         for i, g, e, *a in test_data:
             with self.subTest("Should have returned one of a solution, a cutoff or failure.", i=i, g=g, e=e, a=a):
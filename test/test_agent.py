@@ -1,5 +1,10 @@
 import unittest
+from unittest.mock import Mock
+
 from agent import (VacuumPerception,
+                   VACUUM_PERCEPTIONS,
+                   PerceptionTrie,
+                   compile_rules,
                    create_table_driven_agent_program,
                    create_reflex_vacuum_agent_program,
                    parse_vacuum_perception,
@@ -30,6 +35,26 @@ class TestTableDrivenAgentProgram(unittest.TestCase):
             with self.subTest(p=p, a=a):
                 self.assertEqual(agent_program(p), a)
 
+    def test_perception_trie(self):
+        p1 = VacuumPerception("A", "Clean")
+        p2 = VacuumPerception("A", "Dirty")
+
+        table = {(p1,): "Right", (p1, p2): "Suck", (p2,): "Suck", (p1, p2, p2, p1): "Left"}
+        trie = PerceptionTrie(table)
+
+        with self.subTest("Should have created a node per distinct prefix."):
+            self.assertEqual(len(trie), 6)
+
+        restored = PerceptionTrie.from_bytes(trie.to_bytes())
+        test_data = [[p1, p2, p2, p1], [p1, p1, p2], [p2, p2, p1, p1]]
+
+        for sequence in test_data:
+            with self.subTest("Should have acted like the table, after serialisation.", sequence=sequence):
+                agent_program = create_table_driven_agent_program(restored)
+
+                self.assertEqual([agent_program(p) for p in sequence],
+                                 [table.get(tuple(sequence[:i + 1])) for i in range(len(sequence))])
+
 
 class TestVacuumAgent(unittest.TestCase):
     @classmethod
@@ -66,3 +91,54 @@ class TestSimpleReflexAgent(TestVacuumAgent):
                                                          "Is Clean B": "Left"},
                                                         parse_vacuum_perception,
                                                         match_vacuum_rule)
+
+
+class TestCompiledSimpleReflexAgent(TestVacuumAgent):
+    def setUp(self):
+        self.rules = {"Is Dirty": "Suck", "Is Clean A": "Right", "Is Clean B": "Left"}
+        self.agent_program = create_simple_reflex_agent(self.rules, parse_vacuum_perception, match_vacuum_rule,
+                                                        VACUUM_PERCEPTIONS)
+
+    def test_compile_rules(self):
+        self.assertEqual(compile_rules(self.rules, parse_vacuum_perception, match_vacuum_rule, VACUUM_PERCEPTIONS),
+                         {VacuumPerception("A", "Clean"): "Right", VacuumPerception("A", "Dirty"): "Suck",
+                          VacuumPerception("B", "Clean"): "Left", VacuumPerception("B", "Dirty"): "Suck"})
+
+    def test_cache(self):
+        parse_perception = Mock(side_effect=parse_vacuum_perception)
+        agent_program = create_simple_reflex_agent(self.rules, parse_perception, match_vacuum_rule, cache_size=2)
+
+        perceptions = [VacuumPerception("A", "Clean"), VacuumPerception("A", "Clean"), VacuumPerception("B", "Dirty"),
+                       VacuumPerception("C", "Clean"), VacuumPerception("A", "Clean")]
+
+        with self.subTest("Should have returned the same actions."):
+            self.assertEqual([agent_program(p) for p in perceptions], ["Right", "Right", "Suck", None, "Right"])
+
+        with self.subTest("Should have parsed a perception again only after it was evicted."):
+            self.assertEqual(parse_perception.call_count, 4)
+
+    def test_cache_eviction(self):
+        parse_perception = Mock(side_effect=parse_vacuum_perception)
+        match_rule = Mock(side_effect=match_vacuum_rule)
+        agent_program = create_simple_reflex_agent(self.rules, parse_perception, match_rule, cache_size=2)
+
+        a, b, c = VacuumPerception("A", "Clean"), VacuumPerception("B", "Clean"), VacuumPerception("C", "Dirty")
+        test_data = [([a, b, a, c, a], 3), ([b], 4), ([a, c], 5)]
+
+        for perceptions, e in test_data:
+            for p in perceptions:
+                agent_program(p)
+
+            with self.subTest("Should have parsed only the perceptions evicted as least recently used.", e=e):
+                self.assertEqual(parse_perception.call_count, e)
+
+        with self.subTest("Should have matched every perception against the rules."):
+            self.assertEqual(match_rule.call_count, 8)
+
+        parse_perception.reset_mock()
+        for i in range(100):
+            agent_program(VacuumPerception(str(i), "Clean"))
+        agent_program(a)
+
+        with self.subTest("Should have kept only cache_size perceptions."):
+            self.assertEqual(parse_perception.call_count, 101)
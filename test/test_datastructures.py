@@ -1,7 +1,12 @@
 import math
+import os
+import tempfile
 import unittest
+from unittest.mock import Mock
 
-from datastructures import Graph
+import datastructures
+from datastructures import (BoundedPriorityQueue, CompactGraph, FrozenGraph, Graph, PriorityQueue, get_dataset_names,
+                            load_dataset, register_dataset)
 
 
 class TestGraph(unittest.TestCase):
@@ -26,3 +31,113 @@ class TestGraph(unittest.TestCase):
         for n, e in test_data:
             with self.subTest("Should have returned the correct connections.", n=n, e=e):
                 self.assertEqual(graph.get_edges(n), e)
+
+
+class TestCompactGraph(unittest.TestCase):
+    def setUp(self):
+        self.connections = [("A", "B", 1), ("A", "C", 2), ("B", "D"), ("D", "E", 4)]
+
+    def test_from_graph(self):
+        for d in [True, False]:
+            with self.subTest("Should have held the same vertices and edges as the original graph.", d=d):
+                graph = Graph(self.connections, d)
+                compact = CompactGraph.from_graph(graph)
+
+                self.assertEqual(compact.get_vertices(), graph.get_vertices())
+                for v in graph.get_vertices() | {"Z"}:
+                    self.assertEqual(compact.get_edges(v), graph.get_edges(v))
+
+
+class TestFrozenGraph(unittest.TestCase):
+    def test_from_graph(self):
+        graph = Graph([("A", "B", 1), ("B", "C", 2), ("C", "A")], directed=True)
+        frozen = FrozenGraph.from_graph(graph)
+
+        with self.subTest("Should have copied the vertices and edges."):
+            self.assertEqual(frozen.get_vertices(), graph.get_vertices())
+            for v in graph.get_vertices():
+                self.assertEqual(frozen.get_edges(v), graph.get_edges(v))
+
+        graph.set_edge_cost("A", "C", 5)
+
+        with self.subTest("Should not have been affected by changes of the original graph."):
+            self.assertEqual(frozen.get_edges("A"), frozenset({("B", 1)}))
+
+        with self.subTest("Should have returned no edges for an unknown vertex, without adding it."):
+            self.assertEqual(frozen.get_edges("D"), frozenset())
+            self.assertNotIn("D", frozen.get_vertices())
+
+
+class TestPriorityQueue(unittest.TestCase):
+    def test_pop(self):
+        items = [object() for _ in range(4)]
+        priorities = dict(zip(items, [2, 1, 1, 0]))
+
+        queue = PriorityQueue([(priorities[items[0]], items[0])], lambda i: priorities[i])
+        for i in items[1:]:
+            queue.add(i)
+
+        self.assertEqual([queue.pop()[1] for _ in items], [items[3], items[1], items[2], items[0]])
+
+    def test_from_entries(self):
+        priorities = {"A": 1, "B": 0, "C": 1, "D": 1}
+
+        queue = PriorityQueue([], priorities.get)
+        for i in "ABC":
+            queue.add(i)
+
+        restored = PriorityQueue.from_entries(queue.get_entries(), priorities.get)
+        restored.add("D")
+
+        self.assertEqual([restored.pop()[1] for _ in range(4)], ["B", "A", "C", "D"])
+
+
+class TestBoundedPriorityQueue(unittest.TestCase):
+    def test_add(self):
+        priorities = {"A": 3, "B": 1, "C": 2, "D": 0, "E": 2, "F": 4}
+        queue = BoundedPriorityQueue(3, priorities.get)
+
+        with self.subTest("Should have evicted the worst items once full."):
+            self.assertEqual([queue.add(i) for i in "ABCDEF"], [None, None, None, "A", "E", "F"])
+            self.assertEqual((len(queue), queue.worst()), (3, "C"))
+
+        with self.subTest("Should have returned the best items in order."):
+            self.assertEqual(queue.pop_all(), [(0, "D"), (1, "B"), (2, "C")])
+            self.assertEqual(len(queue), 0)
+
+        with self.subTest("Should have rejected a capacity which is not positive."):
+            with self.assertRaises(ValueError):
+                BoundedPriorityQueue(0, priorities.get)
+
+
+class TestDatasets(unittest.TestCase):
+    def test_load_dataset(self):
+        builder = Mock(return_value=Graph([("A", "B", 1)]))
+        register_dataset("test_graph", builder)
+
+        with self.subTest("Should not have built the graph before it was accessed."):
+            self.assertIn("test_graph", get_dataset_names())
+            builder.assert_not_called()
+
+        with self.subTest("Should have built the graph once, on first access."):
+            self.assertIs(load_dataset("test_graph"), datastructures.test_graph)
+            builder.assert_called_once()
+
+        with self.subTest("Should have raised an exception for an unknown graph."):
+            self.assertRaises(KeyError, load_dataset, "unknown_graph")
+            self.assertRaises(AttributeError, getattr, datastructures, "unknown_graph")
+
+    def test_load_dataset_directory(self):
+        with tempfile.TemporaryDirectory() as d:
+            register_dataset("test_graph", lambda: Graph([("A", "B", 1)]))
+            load_dataset("test_graph", d)
+
+            with self.subTest("Should have saved the prebuilt graph."):
+                self.assertTrue(os.path.exists(os.path.join(d, "test_graph.pickle")))
+
+            builder = Mock()
+            register_dataset("test_graph", builder)
+
+            with self.subTest("Should have loaded the prebuilt graph instead of building it."):
+                self.assertEqual(load_dataset("test_graph", d).get_edges("B"), {("A", 1)})
+                builder.assert_not_called()
@@ -0,0 +1,76 @@
+import random
+import unittest
+
+from agent import create_reflex_vacuum_agent_program, create_simple_reflex_agent, parse_vacuum_perception, \
+    match_vacuum_rule
+from environment import BatchPerception, VacuumWorldBatch
+
+
+def _simulate(location, dirt, agent_program, steps):
+    score = 0
+
+    for _ in range(steps):
+        action = agent_program(BatchPerception(1, location, dirt[location]).get_perception(0))
+        if action == "Suck":
+            dirt[location] = 0
+        elif action == "Right":
+            location = 1
+        elif action == "Left":
+            location = 0
+        score += dirt.count(0)
+
+    return score
+
+
+class TestVacuumWorldBatch(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(1)
+        self.size = 200
+        self.worlds = [(self.rng.randrange(2), [self.rng.randrange(2), self.rng.randrange(2)])
+                       for _ in range(self.size)]
+
+    def test_run(self):
+        test_data = [("batch", create_reflex_vacuum_agent_program()),
+                     ("scalar", create_simple_reflex_agent({"Is Dirty": "Suck", "Is Clean A": "Right",
+                                                           "Is Clean B": "Left"},
+                                                          parse_vacuum_perception, match_vacuum_rule))]
+
+        for name, agent_program in test_data:
+            environment = VacuumWorldBatch(self.size, *self.__get_bitmaps())
+            environment.run(agent_program, 5)
+
+            expected = [_simulate(l, list(d), create_reflex_vacuum_agent_program(), 5) for l, d in self.worlds]
+
+            with self.subTest("Should have scored every world like a single world simulation.", name=name):
+                self.assertEqual(environment.get_scores(), expected)
+                self.assertEqual(environment.get_performance(), sum(expected))
+                self.assertEqual(environment.get_steps(), 5)
+
+    def test_perception(self):
+        environment = VacuumWorldBatch(3, location=0b010, dirt_a=0b011, dirt_b=0b110)
+
+        self.assertEqual([environment.get_perception().get_perception(i) for i in range(3)],
+                         [BatchPerception(1, 0, 1).get_perception(0), BatchPerception(1, 1, 1).get_perception(0),
+                          BatchPerception(1, 0, 0).get_perception(0)])
+
+    def test_large_batch(self):
+        size = 1 << 16
+        location, dirt_a, dirt_b = (self.rng.getrandbits(size) for _ in range(3))
+
+        environment = VacuumWorldBatch(size, location, dirt_a, dirt_b)
+        environment.run(create_reflex_vacuum_agent_program(), 10)
+        scores = environment.get_scores()
+
+        for i in self.rng.sample(range(size), 50):
+            expected = _simulate(location >> i & 1, [dirt_a >> i & 1, dirt_b >> i & 1],
+                                 create_reflex_vacuum_agent_program(), 10)
+
+            with self.subTest("Should have scored every world like a single world simulation.", i=i):
+                self.assertEqual(scores[i], expected)
+
+    def __get_bitmaps(self):
+        location = sum(l << i for i, (l, _) in enumerate(self.worlds))
+        dirt_a = sum(d[0] << i for i, (_, d) in enumerate(self.worlds))
+        dirt_b = sum(d[1] << i for i, (_, d) in enumerate(self.worlds))
+
+        return location, dirt_a, dirt_b
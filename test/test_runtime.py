@@ -0,0 +1,91 @@
+import asyncio
+import math
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from agent import VacuumPerception, create_reflex_vacuum_agent_program, create_table_driven_agent_program
+from runtime import AgentRuntime
+
+
+async def perception_stream(rng, n):
+    for _ in range(n):
+        await asyncio.sleep(rng.uniform(0, 0.001))
+        yield VacuumPerception(rng.choice("AB"), rng.choice(["Clean", "Dirty"]))
+
+
+class TestAgentRuntime(unittest.IsolatedAsyncioTestCase):
+    async def test_runtime(self):
+        for executor in [None, ThreadPoolExecutor(4)]:
+            received = {}
+
+            async def actuator(name, perception, action):
+                received.setdefault(name, []).append((perception, action))
+
+            async with AgentRuntime(actuator, queue_size=4, batch_size=8, executor=executor) as runtime:
+                for i in range(20):
+                    runtime.add_agent(f"agent-{i}", create_reflex_vacuum_agent_program())
+
+                await asyncio.gather(*(runtime.feed(f"agent-{i}", perception_stream(random.Random(i), 30))
+                                       for i in range(20)))
+
+            expected_program = create_reflex_vacuum_agent_program()
+
+            with self.subTest("Should have acted on every perception in order.", executor=executor):
+                for i in range(20):
+                    name = f"agent-{i}"
+                    self.assertEqual(runtime.get_steps(name), 30)
+                    self.assertEqual([a for _, a in received[name]], [expected_program(p) for p, _ in received[name]])
+                    self.assertEqual([p for p, _ in received[name]],
+                                     [p async for p in perception_stream(random.Random(i), 30)])
+
+            with self.subTest("Should have reported ordered latency percentiles.", executor=executor):
+                percentiles = runtime.get_latency_percentiles("agent-0")
+                self.assertTrue(0 <= percentiles[50] <= percentiles[90] <= percentiles[99])
+
+            if executor is not None:
+                executor.shutdown()
+
+    async def test_backpressure(self):
+        gate = asyncio.Event()
+
+        async def slow_actuator(name, perception, action):
+            await gate.wait()
+
+        runtime = AgentRuntime(slow_actuator, queue_size=2, batch_size=1)
+        runtime.add_agent("agent", create_table_driven_agent_program({}))
+
+        submissions = asyncio.ensure_future(asyncio.gather(*(runtime.submit("agent", i) for i in range(10))))
+        await asyncio.sleep(0.01)
+
+        with self.subTest("Should have waited while the queue was full."):
+            self.assertFalse(submissions.done())
+            self.assertEqual(runtime.get_steps("agent"), 1)
+
+        gate.set()
+        await submissions
+        await runtime.join()
+        await runtime.close()
+
+        with self.subTest("Should have handled every perception once the agent caught up."):
+            self.assertEqual(runtime.get_steps("agent"), 10)
+
+    async def test_errors(self):
+        def failing_program(perception):
+            raise RuntimeError(perception)
+
+        runtime = AgentRuntime()
+        runtime.add_agent("agent", failing_program)
+        await runtime.submit("agent", "boom")
+
+        with self.subTest("Should have raised the agent program's exception."):
+            with self.assertRaises(RuntimeError):
+                await runtime.join()
+
+        with self.subTest("Should have cleared the exception once it was raised."):
+            await runtime.join()
+
+        with self.subTest("Should have reported no latencies for an agent without steps."):
+            self.assertTrue(math.isnan(runtime.get_latency_percentiles("agent")[50]))
+
+        await runtime.close()